@@ -1,17 +1,53 @@
 from finm_python.hw1.src.data_loader import MarketDataPoint
 from finm_python.hw1.src.strategies import Strategy
 
-from collections import deque
+from collections import defaultdict, deque
 
 
 class MovingAverageStrategy(Strategy):
-    def __init__(self, params: dict = None):
+    def __init__(self, params: dict = None, indicators=None):
+        """
+        Initialize the moving average strategy.
+
+        Args:
+            params: Dictionary with 'short_ma' and 'long_ma' window sizes
+            indicators: Optional shared moving-average service
+                (hw3.src.indicators.IndicatorService). When given, averages are
+                read from it in O(1) instead of this strategy's own buffer, so
+                many parameter variants on one symbol share the work.
+        """
         self.params = params if params else {}
         self._short_ma = self.params.get('short_ma', 20)
         self._long_ma = self.params.get('long_ma', 50)
         self._price_history = deque(maxlen=self._long_ma)
 
+        self._indicators = indicators
+        self._seq = defaultdict(int)
+        if indicators is not None:
+            indicators.subscribe(None, self._short_ma)
+            indicators.subscribe(None, self._long_ma)
+
+    def _indicator_signal(self, tick: MarketDataPoint) -> list:
+        seq = self._seq[tick.symbol]
+        self._seq[tick.symbol] = seq + 1
+        self._indicators.record(tick.symbol, seq, tick.price)
+
+        long_ma = self._indicators.mean(tick.symbol, self._long_ma, seq)
+        if long_ma is None:
+            return []
+        short_ma = self._indicators.mean(tick.symbol, self._short_ma, seq)
+
+        if short_ma > long_ma:
+            return ['Buy', tick.symbol, 100, tick.price]
+        elif short_ma < long_ma:
+            return ['Sell', tick.symbol, 100, tick.price]
+        else:
+            return ['Hold', tick.symbol, 100, tick.price]
+
     def generate_signals(self, tick: MarketDataPoint) -> list:
+        if self._indicators is not None:
+            return self._indicator_signal(tick)
+
         self._price_history.append(tick.price)
 
         if len(self._price_history) < self._long_ma:
@@ -2,13 +2,22 @@ __version__ = '0.1.0'
 __author__ = 'Dafu'
 
 from .src.models import MarketDataPoint, Strategy
+from .src.indicators import IndicatorService
 from .src.strategies import (
     NaiveMovingAverageStrategy,
     WindowedMovingAverageStrategy,
     VectorizedMovingAverageStrategy,
     CachedMovingAverageStrategy,
+    PrefixSumCache,
     StreamingMovingAverageStrategy,
-    HybridOptimizedStrategy
+    HybridOptimizedStrategy,
+    ChunkedStreamingStrategy,
+)
+from .src.benchmark import (
+    BenchmarkConfig,
+    register_benchmark,
+    run_benchmarks,
+    compare_to_baseline,
 )
 from .src.profiler import run_comprehensive_benchmark
 from .src.reporting import generate_complexity_report, generate_plots
@@ -17,12 +26,19 @@ from .src.reporting import generate_complexity_report, generate_plots
 __all__ = [
     "MarketDataPoint",
     "Strategy",
+    "IndicatorService",
     "NaiveMovingAverageStrategy",
     "WindowedMovingAverageStrategy",
     "VectorizedMovingAverageStrategy",
     "CachedMovingAverageStrategy",
+    "PrefixSumCache",
     "StreamingMovingAverageStrategy",
     "HybridOptimizedStrategy",
+    "ChunkedStreamingStrategy",
+    "BenchmarkConfig",
+    "register_benchmark",
+    "run_benchmarks",
+    "compare_to_baseline",
     "generate_complexity_report",
     "generate_plots"
 ]
\ No newline at end of file
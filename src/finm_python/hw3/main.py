@@ -5,14 +5,17 @@ Workflow:
 1. Load data for different input sizes
 2. Initialize strategies
 3. Run profiling benchmarks
-4. Generate visualizations
-5. Create complexity_report.md
+4. Sweep n and window length, fit complexity exponents
+5. Generate visualizations
+6. Create complexity_report.md
 """
 from finm_python.hw3 import (
     run_comprehensive_benchmark,
     generate_plots,
     generate_complexity_report
 )
+from finm_python.hw3.src.benchmark import run_scaling_sweep
+from finm_python.hw3.src.reporting import generate_scaling_plots
 from pathlib import Path
 
 
@@ -29,9 +32,14 @@ def main():
     # Run benchmarks
     results = run_comprehensive_benchmark()
 
+    # Sweep n and window length to verify documented complexity
+    print("\n\nRunning scaling sweep (n and window)...")
+    results['scaling'] = run_scaling_sweep()
+
     # Generate visualizations
     print("\n\nGenerating visualizations...")
     plot_filename = generate_plots(results, plot_dir=PLOTS_DIR)
+    results['scaling_plot'] = generate_scaling_plots(results['scaling'], plot_dir=PLOTS_DIR)
 
     # Generate report
     print("Generating markdown report...")
@@ -0,0 +1,668 @@
+"""
+Reusable benchmark subsystem for strategy implementations.
+
+Functions:
+- register_benchmark(name, factory, runner, description): add a strategy variant
+- market_data(n_ticks, seed): cached synthetic tick dataset
+- benchmark_case(name, n_ticks, params, config): warmup + repeated timing + memory pass
+- run_benchmarks(names, tick_sizes, params, config): full results with machine metadata
+- save_results / load_results: JSON persistence
+- compare_to_baseline(results, baseline, threshold): regression detection
+- run_scaling_sweep(names, n_grid, window_grid): empirical complexity exponents
+
+Usage:
+    python -m finm_python.hw3.src.benchmark --group hw3 --output results.json
+    python -m finm_python.hw3.src.benchmark --baseline results.json --threshold 0.1
+
+Methodology:
+- Data is generated once per (n_ticks, seed) and reused across strategies
+- A fresh strategy is built for every run; construction is not timed
+- Warmup runs are discarded, then `repeats` timed runs are summarized by
+  median and interquartile range (robust to outliers from GC/scheduling)
+- Memory is measured in a separate tracemalloc pass so tracing overhead
+  never leaks into the timings
+- Optionally pins the process to fixed CPUs to reduce migration noise
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import socket
+import sys
+import time
+import tracemalloc
+import warnings
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Any
+
+import numpy as np
+
+from finm_python.hw3.src.models import MarketDataPoint
+from finm_python.hw3.src.strategies import (
+    NaiveMovingAverageStrategy,
+    WindowedMovingAverageStrategy,
+    VectorizedMovingAverageStrategy,
+    CachedMovingAverageStrategy,
+    StreamingMovingAverageStrategy,
+    HybridOptimizedStrategy,
+    ChunkedStreamingStrategy,
+)
+
+
+DEFAULT_PARAMS = {'short': 5, 'long': 20}
+
+
+# ============================================================================
+# Datasets
+# ============================================================================
+
+def generate_market_data(n_ticks: int, seed: int = 42) -> List[MarketDataPoint]:
+    """Generate synthetic market data."""
+    # RandomState reproduces the legacy np.random.seed stream without
+    # touching global random state
+    rng = np.random.RandomState(seed)
+    returns = rng.normal(loc=0.0001, scale=0.02, size=n_ticks)
+    prices = 100.0 * np.exp(np.cumsum(returns))
+    base_time = datetime(2025, 1, 1, 9, 30, 0)
+
+    result = []
+    for i, price in enumerate(prices.tolist()):
+        data_point = MarketDataPoint(
+            timestamp=base_time + timedelta(seconds=i),
+            symbol='AAPL',
+            price=price
+        )
+        result.append(data_point)
+
+    return result
+
+
+@lru_cache(maxsize=16)
+def market_data(n_ticks: int, seed: int = 42) -> Tuple[MarketDataPoint, ...]:
+    """
+    Cached, immutable version of generate_market_data.
+
+    Ticks are frozen dataclasses, so one tuple can safely be shared by every
+    strategy and every repeat.
+    """
+    return tuple(generate_market_data(n_ticks, seed))
+
+
+# ============================================================================
+# Registry
+# ============================================================================
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """A registered strategy variant: how to build it and how to drive it."""
+    name: str
+    factory: Callable[[dict], Any]
+    runner: Callable[[Any, Sequence[MarketDataPoint]], None]
+    description: str = ''
+    group: str = ''
+    # Documented scaling of total run time as exponents: (vs n ticks, vs window)
+    complexity: Optional[Tuple[float, float]] = None
+
+
+BENCHMARKS: Dict[str, BenchmarkCase] = {}
+
+
+def run_ticks(strategy, data: Sequence[MarketDataPoint]) -> None:
+    """Default runner: feed every tick through generate_signals."""
+    generate = strategy.generate_signals
+    for tick in data:
+        generate(tick)
+
+
+def run_strategy(strat, data: Sequence[MarketDataPoint]) -> None:
+    """Drive an hw3 strategy through its fastest public interface."""
+    if isinstance(strat, VectorizedMovingAverageStrategy):
+        strat.process_batch(data)
+    elif isinstance(strat, (StreamingMovingAverageStrategy, ChunkedStreamingStrategy)):
+        for signal in strat.stream_signals(iter(data)):
+            pass  # consume generator
+    else:
+        run_ticks(strat, data)
+
+
+def register_benchmark(name: str, factory: Callable[[dict], Any],
+                       runner: Callable = run_ticks, description: str = '',
+                       group: str = '',
+                       complexity: Optional[Tuple[float, float]] = None) -> BenchmarkCase:
+    """
+    Register a strategy variant for benchmarking.
+
+    Args:
+        name: Unique benchmark name (e.g. 'hw3.Hybrid')
+        factory: Builds a fresh strategy from window params {'short', 'long'}
+        runner: Drives the strategy over a tick sequence
+        description: Short human readable description
+        group: Assignment the strategy belongs to (e.g. 'hw3')
+        complexity: Documented (n, window) exponents of total run time,
+                    e.g. (1, 1) for O(window) work per tick; used by the
+                    scaling sweep to flag contradictions
+
+    Returns:
+        The registered BenchmarkCase
+    """
+    case = BenchmarkCase(name, factory, runner, description, group, complexity)
+    BENCHMARKS[name] = case
+    return case
+
+
+def available_benchmarks(group: Optional[str] = None) -> List[str]:
+    """Names of registered benchmarks, optionally filtered by group."""
+    return [name for name, case in BENCHMARKS.items()
+            if group is None or case.group == group]
+
+
+def _register_defaults() -> None:
+    """Register strategy variants from hw1, hw2, hw3, hw6 and hw8.
+
+    Factories import lazily so a broken or unfinished assignment only fails
+    its own benchmark, not the whole registry.
+    """
+    # Documented per-tick costs from the strategy docstrings: O(window) for
+    # Naive, O(1) for the rest (Cached is O(1) on hits and misses alike)
+    hw3_variants = [
+        ('Naive', NaiveMovingAverageStrategy, 'Baseline O(n)', (1, 1)),
+        ('Windowed', WindowedMovingAverageStrategy, 'Deque + Running Sums', (1, 0)),
+        ('Vectorized', VectorizedMovingAverageStrategy, 'NumPy Batch Processing', (1, 0)),
+        ('Cached', CachedMovingAverageStrategy, 'Shared Prefix-Sum Cache', (1, 0)),
+        ('Streaming', StreamingMovingAverageStrategy, 'Generator-based', (1, 0)),
+        ('Hybrid', HybridOptimizedStrategy, 'Combined Optimizations', (1, 0)),
+        ('Chunked', ChunkedStreamingStrategy, 'Micro-batch Streaming', (1, 0)),
+    ]
+    for name, cls, desc, complexity in hw3_variants:
+        register_benchmark(f'hw3.{name}', lambda p, cls=cls: cls(dict(p)),
+                           run_strategy, desc, 'hw3', complexity)
+
+    def hw1_macd(p):
+        import finm_python.hw2  # hw1.src.strategies imports hw2; initializing hw2 first avoids the cycle
+        from finm_python.hw1 import MACDStrategy
+        return MACDStrategy([], {'short_period': p['short'], 'long_period': p['long']})
+
+    def hw1_momentum(p):
+        import finm_python.hw2
+        from finm_python.hw1 import MomentumStrategy
+        return MomentumStrategy([], {'lookback': p['long'], 'buy_threshold': 0.02,
+                                     'sell_threshold': -0.02})
+
+    register_benchmark('hw1.MACD', hw1_macd, description='MA crossover (list slicing)', group='hw1')
+    register_benchmark('hw1.Momentum', hw1_momentum, description='Rate of change', group='hw1')
+
+    def hw2_factory(cls_name, key_map):
+        def factory(p):
+            from finm_python.hw2.src import strategies
+            params = {key: p[src] for key, src in key_map.items()}
+            return getattr(strategies, cls_name)(params)
+        return factory
+
+    register_benchmark('hw2.MovingAverage',
+                       hw2_factory('MovingAverageStrategy', {'short_ma': 'short', 'long_ma': 'long'}),
+                       description='MA crossover', group='hw2')
+    register_benchmark('hw2.VolatilityBreakout',
+                       hw2_factory('VolatilityBreakoutStrategy', {'lookback': 'long'}),
+                       description='Return vs rolling std', group='hw2')
+    register_benchmark('hw2.MACD',
+                       hw2_factory('MACDStrategy', {}),
+                       description='EMA MACD (fixed 12/26/9)', group='hw2')
+    register_benchmark('hw2.RSI',
+                       hw2_factory('RSIStrategy', {}),
+                       description='Relative strength index', group='hw2')
+
+    def hw6_mean_reversion(p):
+        from finm_python.hw6.patterns.behavioral import MeanReversionStrategy
+        return MeanReversionStrategy(lookback_window=p['long'])
+
+    def hw6_breakout(p):
+        from finm_python.hw6.patterns.behavioral import BreakoutStrategy
+        return BreakoutStrategy(lookback_window=p['long'])
+
+    register_benchmark('hw6.MeanReversion', hw6_mean_reversion,
+                       description='Deviation from MA', group='hw6')
+    register_benchmark('hw6.Breakout', hw6_breakout,
+                       description='Range breakout', group='hw6')
+
+    def hw8_signal_generator(p):
+        from finm_python.hw8.strategy import PriceHistory, SignalGenerator
+        return SignalGenerator(p['short'], p['long']), PriceHistory(max_size=p['long'])
+
+    def run_hw8(state, data):
+        generator, history = state
+        for tick in data:
+            history.add_price(tick.price)
+            generator.price_signal(history)
+
+    register_benchmark('hw8.SignalGenerator', hw8_signal_generator, run_hw8,
+                       'PriceHistory + MA crossover', 'hw8')
+
+
+_register_defaults()
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+@dataclass
+class BenchmarkConfig:
+    """
+    Measurement settings.
+
+    Attributes:
+        warmup: Untimed runs before measuring (JIT-free, but warms caches/allocator)
+        repeats: Timed runs summarized by median/IQR
+        measure_memory: Whether to run the separate tracemalloc pass
+        disable_gc: Disable the cyclic GC during timed runs
+        cpus: CPU ids to pin the process to while benchmarking (None = no pinning)
+        seed: Dataset seed
+    """
+    warmup: int = 1
+    repeats: int = 5
+    measure_memory: bool = True
+    disable_gc: bool = True
+    cpus: Optional[Tuple[int, ...]] = None
+    seed: int = 42
+
+
+@contextmanager
+def cpu_affinity(cpus: Optional[Iterable[int]]):
+    """
+    Temporarily pin this process to the given CPUs.
+
+    No-op when cpus is None; warns and continues on platforms without
+    sched_setaffinity (e.g. macOS).
+    """
+    if cpus is None:
+        yield
+        return
+    if not hasattr(os, 'sched_setaffinity'):
+        warnings.warn("CPU affinity is not supported on this platform; running unpinned")
+        yield
+        return
+
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, set(cpus))
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, previous)
+
+
+def summarize_times(times: Sequence[float]) -> Dict[str, float]:
+    """Robust summary statistics for a list of run times."""
+    arr = np.asarray(times, dtype=np.float64)
+    q1, median, q3 = np.percentile(arr, [25, 50, 75])
+    return {
+        'median': float(median),
+        'q1': float(q1),
+        'q3': float(q3),
+        'iqr': float(q3 - q1),
+        'min': float(arr.min()),
+        'mean': float(arr.mean()),
+    }
+
+
+def _timed_run(case: BenchmarkCase, data, params: dict, disable_gc: bool) -> float:
+    """Build a fresh strategy (untimed) and time one pass over the data."""
+    strategy = case.factory(params)
+    gc.collect()
+    if disable_gc:
+        gc.disable()
+    try:
+        start = time.perf_counter()
+        case.runner(strategy, data)
+        return time.perf_counter() - start
+    finally:
+        if disable_gc:
+            gc.enable()
+
+
+def _memory_run(case: BenchmarkCase, data, params: dict) -> Tuple[float, Any]:
+    """Separate tracemalloc pass; returns (peak MB, strategy)."""
+    strategy = case.factory(params)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case.runner(strategy, data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024 / 1024, strategy
+
+
+def benchmark_case(case, n_ticks: int, params: Optional[dict] = None,
+                   config: Optional[BenchmarkConfig] = None) -> Dict[str, Any]:
+    """
+    Benchmark one strategy on one dataset size.
+
+    Args:
+        case: Registered benchmark name or a BenchmarkCase
+        n_ticks: Number of ticks in the dataset
+        params: Window params {'short', 'long'}
+        config: Measurement settings
+
+    Returns:
+        Dict with timing summary ('median', 'iqr', ...), raw 'times',
+        'time_per_tick' (µs, from the median), 'memory_peak' (MB or None),
+        'cache_info' and 'error' (None on success)
+
+    Raises:
+        KeyError: If the benchmark name is not registered
+    """
+    if isinstance(case, str):
+        case = BENCHMARKS[case]
+    params = params or DEFAULT_PARAMS
+    config = config or BenchmarkConfig()
+    data = market_data(n_ticks, config.seed)
+
+    result: Dict[str, Any] = {'n_ticks': n_ticks, 'error': None}
+    try:
+        with cpu_affinity(config.cpus):
+            for _ in range(config.warmup):
+                _timed_run(case, data, params, config.disable_gc)
+            times = [_timed_run(case, data, params, config.disable_gc)
+                     for _ in range(config.repeats)]
+
+            memory_peak, cache_info = None, None
+            if config.measure_memory:
+                memory_peak, strategy = _memory_run(case, data, params)
+                if hasattr(strategy, 'get_cache_info'):
+                    cache_info = strategy.get_cache_info()
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+        return result
+
+    result.update(summarize_times(times))
+    result['times'] = times
+    result['time_per_tick'] = result['median'] / n_ticks * 1e6
+    result['memory_peak'] = memory_peak
+    result['cache_info'] = cache_info
+    return result
+
+
+def machine_metadata(config: Optional[BenchmarkConfig] = None) -> Dict[str, Any]:
+    """Describe the machine and interpreter the results were measured on."""
+    affinity = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'hostname': socket.gethostname(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'cpu_affinity': affinity,
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'numpy': np.__version__,
+        'config': asdict(config) if config else None,
+    }
+
+
+def run_benchmarks(names: Optional[Iterable[str]] = None,
+                   tick_sizes: Sequence[int] = (1_000, 10_000, 100_000),
+                   params: Optional[dict] = None,
+                   config: Optional[BenchmarkConfig] = None,
+                   verbose: bool = True) -> Dict[str, Any]:
+    """
+    Benchmark several strategies across dataset sizes.
+
+    Returns:
+        {'metadata': ..., 'params': ..., 'tick_sizes': [...],
+         'results': {name: {str(n_ticks): benchmark_case(...)}}}
+    """
+    names = list(names) if names is not None else available_benchmarks()
+    params = params or DEFAULT_PARAMS
+    config = config or BenchmarkConfig()
+
+    output: Dict[str, Any] = {
+        'metadata': machine_metadata(config),
+        'params': dict(params),
+        'tick_sizes': list(tick_sizes),
+        'results': {},
+    }
+    for name in names:
+        output['results'][name] = {}
+        for n_ticks in tick_sizes:
+            result = benchmark_case(name, n_ticks, params, config)
+            output['results'][name][str(n_ticks)] = result
+            if verbose:
+                if result['error']:
+                    print(f"  {name:24} n={n_ticks:>8,}  ✗ {result['error']}")
+                else:
+                    print(f"  {name:24} n={n_ticks:>8,}  {result['median']:.4f}s "
+                          f"(IQR {result['iqr']:.4f}s)")
+    return output
+
+
+def save_results(results: Dict[str, Any], path: Path) -> Path:
+    """Write benchmark results to JSON, creating parent directories."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, default=str)
+    return path
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    """Read benchmark results previously written by save_results."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_to_baseline(results: Dict[str, Any], baseline: Dict[str, Any],
+                        threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    Compare median times against a stored baseline.
+
+    A case regresses when its median exceeds the baseline median by more
+    than `threshold` (relative, 0.10 = 10% slower). Cases missing from the
+    baseline or that errored in either run are skipped.
+
+    Returns:
+        One dict per compared case with 'name', 'n_ticks', 'baseline',
+        'current', 'ratio' and 'regression'
+    """
+    comparisons = []
+    for name, by_size in results['results'].items():
+        base_sizes = baseline.get('results', {}).get(name, {})
+        for size, current in by_size.items():
+            base = base_sizes.get(size)
+            if not base or base.get('error') or current.get('error'):
+                continue
+            ratio = current['median'] / base['median']
+            comparisons.append({
+                'name': name,
+                'n_ticks': int(size),
+                'baseline': base['median'],
+                'current': current['median'],
+                'ratio': ratio,
+                'regression': ratio > 1.0 + threshold,
+            })
+    return comparisons
+
+
+# ============================================================================
+# Scaling Sweeps
+# ============================================================================
+
+def log_grid(start: int, stop: int, num: int) -> List[int]:
+    """Log-spaced integer grid from start to stop (inclusive, deduplicated)."""
+    return sorted(set(np.geomspace(start, stop, num).round().astype(int).tolist()))
+
+
+def window_params(window: int) -> dict:
+    """Window params for a sweep point: long = window, short = window / 4."""
+    return {'short': max(2, window // 4), 'long': window}
+
+
+def fit_exponent(xs: Sequence[float], ys: Sequence[float]) -> Dict[str, float]:
+    """
+    Fit y ~ c * x^k on log-log axes over the upper half of the grid.
+
+    Small inputs are dominated by fixed per-run overhead (strategy setup,
+    NumPy call overhead), which flattens the curve; the asymptotic exponent
+    is better estimated from the larger half of the points.
+
+    Returns:
+        {'exponent': k, 'r2': goodness of fit on the points used}
+    """
+    x = np.log(np.asarray(xs, dtype=np.float64))
+    y = np.log(np.asarray(ys, dtype=np.float64))
+    start = min(len(x) // 2, len(x) - 2)
+    x, y = x[start:], y[start:]
+
+    slope, intercept = np.polyfit(x, y, 1)
+    residual = y - (slope * x + intercept)
+    total = np.sum((y - y.mean()) ** 2)
+    r2 = 1.0 - np.sum(residual ** 2) / total if total > 0 else 1.0
+    return {'exponent': float(slope), 'r2': float(r2)}
+
+
+def check_exponent(measured: float, documented: float, tolerance: float) -> Optional[str]:
+    """
+    Compare a measured exponent with the documented one.
+
+    Big-O is an upper bound, so measuring faster-than-documented growth is
+    only a contradiction when the documented dependence does not show up
+    at all (e.g. Naive not slowing down with the window).
+
+    Returns:
+        A description of the contradiction, or None if consistent
+    """
+    if measured > documented + tolerance:
+        return f"grows faster than documented (x^{measured:.2f} vs x^{documented:g})"
+    if documented > 0 and measured < tolerance:
+        return f"does not grow as documented (x^{measured:.2f} vs x^{documented:g})"
+    return None
+
+
+def run_scaling_sweep(names: Optional[Iterable[str]] = None,
+                      n_grid: Optional[Sequence[int]] = None,
+                      window_grid: Optional[Sequence[int]] = None,
+                      window_n: int = 5_000,
+                      config: Optional[BenchmarkConfig] = None,
+                      tolerance: float = 0.25,
+                      verbose: bool = True) -> Dict[str, Any]:
+    """
+    Sweep input size and window length, fit complexity exponents and flag
+    strategies whose measured scaling contradicts their documented Big-O.
+
+    Args:
+        names: Benchmarks to sweep (default: those registered with a complexity)
+        n_grid: Tick counts for the time-vs-n sweep (window fixed at defaults)
+        window_grid: Long-window lengths for the time-vs-window sweep
+        window_n: Tick count used during the window sweep
+        config: Measurement settings (default: 3 repeats, no memory pass)
+        tolerance: Allowed exponent slack before flagging
+        verbose: Print progress
+
+    Returns:
+        {'n_grid', 'window_grid', 'window_n', 'tolerance',
+         'strategies': {name: {'n': {...}, 'window': {...},
+                               'documented': {'n', 'window'},
+                               'contradictions': [str, ...]}}}
+    """
+    if names is None:
+        names = [name for name, case in BENCHMARKS.items() if case.complexity is not None]
+    n_grid = list(n_grid or log_grid(1_000, 100_000, 5))
+    window_grid = list(window_grid or log_grid(8, 1024, 5))
+    config = config or BenchmarkConfig(warmup=1, repeats=3, measure_memory=False)
+
+    sweep: Dict[str, Any] = {
+        'n_grid': n_grid,
+        'window_grid': window_grid,
+        'window_n': window_n,
+        'tolerance': tolerance,
+        'strategies': {},
+    }
+    for name in names:
+        case = BENCHMARKS[name]
+        entry: Dict[str, Any] = {'contradictions': [], 'error': None}
+        axes = [
+            ('n', n_grid, lambda n: benchmark_case(case, n, DEFAULT_PARAMS, config)),
+            ('window', window_grid, lambda w: benchmark_case(case, window_n, window_params(w), config)),
+        ]
+        for axis, grid, measure in axes:
+            results = [measure(x) for x in grid]
+            errors = [r['error'] for r in results if r['error']]
+            if errors:
+                entry['error'] = errors[0]
+                break
+            times = [r['median'] for r in results]
+            entry[axis] = {'times': times, **fit_exponent(grid, times)}
+
+        if entry['error'] is None and case.complexity is not None:
+            documented = dict(zip(('n', 'window'), case.complexity))
+            entry['documented'] = documented
+            for axis in ('n', 'window'):
+                problem = check_exponent(entry[axis]['exponent'], documented[axis], tolerance)
+                if problem:
+                    entry['contradictions'].append(f"time vs {axis} {problem}")
+
+        sweep['strategies'][name] = entry
+        if verbose:
+            if entry['error']:
+                print(f"  {name:24} ✗ {entry['error']}")
+            else:
+                flag = "; ".join(entry['contradictions']) or "consistent"
+                print(f"  {name:24} n^{entry['n']['exponent']:.2f}  "
+                      f"window^{entry['window']['exponent']:.2f}  {flag}")
+    return sweep
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point; returns 1 if any case regressed."""
+    parser = argparse.ArgumentParser(description="Benchmark registered strategies")
+    parser.add_argument('names', nargs='*', help="Benchmark names (default: all)")
+    parser.add_argument('--group', help="Only run benchmarks from this group (e.g. hw3)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--short', type=int, default=DEFAULT_PARAMS['short'])
+    parser.add_argument('--long', type=int, default=DEFAULT_PARAMS['long'])
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc pass")
+    parser.add_argument('--cpus', type=int, nargs='+', help="Pin to these CPU ids")
+    parser.add_argument('--output', type=Path, help="Write JSON results here")
+    parser.add_argument('--baseline', type=Path, help="Compare against stored JSON results")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Relative slowdown that counts as a regression")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    names = args.names or available_benchmarks(args.group)
+
+    config = BenchmarkConfig(
+        warmup=args.warmup,
+        repeats=args.repeats,
+        measure_memory=not args.no_memory,
+        cpus=tuple(args.cpus) if args.cpus else None,
+    )
+    results = run_benchmarks(names, args.sizes, {'short': args.short, 'long': args.long}, config)
+
+    if args.output:
+        print(f"Results: {save_results(results, args.output)}")
+
+    if args.baseline:
+        comparisons = compare_to_baseline(results, load_results(args.baseline), args.threshold)
+        regressions = [c for c in comparisons if c['regression']]
+        for c in comparisons:
+            flag = "REGRESSION" if c['regression'] else "ok"
+            print(f"  {c['name']:24} n={c['n_ticks']:>8,}  {c['ratio']:.2f}x  {flag}")
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+Shared moving-average indicator service.
+
+Classes:
+- IndicatorService: one prefix-sum ring buffer per symbol, O(1) window means
+
+Running 100 short/long combinations on one symbol with per-strategy buffers
+repeats the same additions 100 times. The service stores one cumulative sum
+per tick per symbol instead; any window mean is then
+
+    (P[end] - P[end - window]) / window
+
+regardless of how many strategies ask or how long their windows are.
+
+Strategies subscribe by (symbol, window) so the ring for each symbol is
+sized to the longest window anyone needs (memory stays O(max window), not
+O(stream)). A subscription with symbol=None covers every symbol, for
+strategies that do not know their symbol until the first tick.
+
+Feeding:
+- An engine can call update(symbol, price) once per tick, or
+- Each strategy calls record(symbol, seq, price) with its own per-symbol
+  tick count; the first caller for a sequence number appends it and the
+  rest are no-ops. This lets unmodified tick-by-tick engines share a
+  service, provided every strategy sees the same ticks in the same order.
+
+Time Complexity: O(1) per tick and per window query
+Space Complexity: O(symbols x max subscribed window)
+"""
+
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+
+class IndicatorService:
+    """
+    Per-symbol prefix sums in ring buffers with (symbol, window) subscriptions.
+
+    Attributes:
+        subscriptions: Counter of (symbol or None, window) -> subscriber count
+    """
+
+    def __init__(self):
+        self.subscriptions: Counter = Counter()
+        self._rings: Dict[str, List[float]] = {}
+        self._last_seq: Dict[str, int] = {}
+        # Oldest prefix sum a grown ring actually holds (slots older than
+        # this were never copied in); absent means nothing was lost
+        self._held_from: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    def _capacity(self, symbol: str) -> int:
+        """Ring length for a symbol: longest subscribed window + 1."""
+        longest = 1
+        for (sub_symbol, window), count in self.subscriptions.items():
+            if count > 0 and sub_symbol in (None, symbol):
+                longest = max(longest, window)
+        # P[end - window] must still be in the ring
+        return longest + 1
+
+    def subscribe(self, symbol: Optional[str], window: int) -> None:
+        """
+        Register interest in means over `window` ticks of `symbol`.
+
+        Args:
+            symbol: Symbol to track, or None for every symbol
+            window: Window length in ticks
+
+        Raises:
+            ValueError: If window is not positive
+        """
+        if window < 1:
+            raise ValueError("Window must be positive")
+        self.subscriptions[(symbol, window)] += 1
+        for existing in list(self._rings):
+            if symbol in (None, existing):
+                self._resize(existing, self._capacity(existing))
+
+    def unsubscribe(self, symbol: Optional[str], window: int) -> None:
+        """Drop one subscription. Rings are not shrunk until data is reset."""
+        key = (symbol, window)
+        if self.subscriptions[key] <= 1:
+            del self.subscriptions[key]
+        else:
+            self.subscriptions[key] -= 1
+
+    def _resize(self, symbol: str, capacity: int) -> None:
+        """Grow a symbol's ring, keeping every prefix sum still held."""
+        ring = self._rings[symbol]
+        old_capacity = len(ring)
+        if capacity <= old_capacity:
+            return
+        last = self._last_seq[symbol]
+        held_from = max(self._held_from.get(symbol, 0), last - old_capacity + 1, 0)
+        grown = [0.0] * capacity
+        for seq in range(held_from, last + 1):
+            grown[seq % capacity] = ring[seq % old_capacity]
+        self._rings[symbol] = grown
+        self._held_from[symbol] = held_from
+
+    # ------------------------------------------------------------------
+    # Feeding
+    # ------------------------------------------------------------------
+
+    def record(self, symbol: str, seq: int, price: float) -> None:
+        """
+        Record tick number `seq` of a symbol; a no-op if already recorded.
+
+        Raises:
+            ValueError: If `seq` skips ahead of the recorded stream
+        """
+        last = self._last_seq.get(symbol, -1)
+        if seq <= last:
+            return
+        if seq != last + 1:
+            raise ValueError(f"Out-of-order tick for {symbol}: got seq {seq}, expected {last + 1}")
+
+        ring = self._rings.get(symbol)
+        if ring is None:
+            ring = self._rings[symbol] = [0.0] * self._capacity(symbol)
+        capacity = len(ring)
+        previous = ring[last % capacity] if last >= 0 else 0.0
+        ring[seq % capacity] = previous + price
+        self._last_seq[symbol] = seq
+
+    def update(self, symbol: str, price: float) -> int:
+        """Append the next tick for a symbol; returns its sequence number."""
+        seq = self._last_seq.get(symbol, -1) + 1
+        self.record(symbol, seq, price)
+        return seq
+
+    def reset(self, symbol: Optional[str] = None) -> None:
+        """Forget recorded prices for one symbol (or all); keeps subscriptions."""
+        symbols = [symbol] if symbol is not None else list(self._rings)
+        for sym in symbols:
+            self._rings.pop(sym, None)
+            self._last_seq.pop(sym, None)
+            self._held_from.pop(sym, None)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def last_seq(self, symbol: str) -> int:
+        """Sequence number of the latest recorded tick (-1 if none)."""
+        return self._last_seq.get(symbol, -1)
+
+    def count(self, symbol: str) -> int:
+        """Number of ticks recorded for a symbol."""
+        return self._last_seq.get(symbol, -1) + 1
+
+    def _oldest_prefix(self, symbol: str) -> int:
+        """Oldest sequence number whose prefix sum the ring still holds."""
+        return max(self._held_from.get(symbol, 0), self._last_seq[symbol] - len(self._rings[symbol]) + 1)
+
+    def _prefix(self, symbol: str, seq: int) -> float:
+        if seq < 0:
+            return 0.0
+        if seq < self._oldest_prefix(symbol):
+            raise ValueError(f"Prefix sum for {symbol} seq {seq} has left the ring; "
+                             f"subscribe to a longer window")
+        return self._rings[symbol][seq % len(self._rings[symbol])]
+
+    def range_sum(self, symbol: str, start: int, end: int) -> float:
+        """Sum of prices with sequence numbers start..end (inclusive)."""
+        if end > self._last_seq.get(symbol, -1):
+            raise ValueError(f"Seq {end} for {symbol} has not been recorded")
+        return self._prefix(symbol, end) - self._prefix(symbol, start - 1)
+
+    def range_mean(self, symbol: str, start: int, end: int) -> float:
+        """Mean of prices with sequence numbers start..end (inclusive)."""
+        return self.range_sum(symbol, start, end) / (end - start + 1)
+
+    def mean(self, symbol: str, window: int, end: Optional[int] = None) -> Optional[float]:
+        """
+        Mean of the `window` ticks ending at `end` (default: latest tick).
+
+        This is the hot path for subscribed strategies, so the prefix
+        lookups are inlined rather than going through range_mean.
+
+        Returns:
+            The mean, or None if fewer than `window` ticks are available
+            (for a window subscribed after updates started: fewer than
+            `window` ticks since the subscription)
+
+        Raises:
+            ValueError: If the window reaches past the ring (window longer
+                        than any subscription) or `end` is not recorded yet
+        """
+        last = self._last_seq.get(symbol, -1)
+        if end is None:
+            end = last
+        elif end > last:
+            raise ValueError(f"Seq {end} for {symbol} has not been recorded")
+        if end + 1 < window:
+            return None
+
+        ring = self._rings[symbol]
+        capacity = len(ring)
+        start = end - window
+        if start < 0:
+            return ring[end % capacity] / window
+        if start <= last - capacity:
+            raise ValueError(f"Prefix sum for {symbol} seq {start} has left the ring; "
+                             f"subscribe to a longer window")
+        if start < self._held_from.get(symbol, 0):
+            # Subscribed late: the ring grew, but this window is still warming up
+            return None
+        return (ring[end % capacity] - ring[start % capacity]) / window
+
+    def crossover_means(self, symbol: str, short: int, long: int,
+                        end: Optional[int] = None) -> Optional[Tuple[float, float]]:
+        """
+        (short mean, long mean) ending at `end` in a single call.
+
+        The common query of MA-crossover strategies; one lookup of the ring
+        and the end prefix serves both windows.
+
+        Returns:
+            The pair, or None while fewer than `long` ticks are available
+            (counted from the subscription if `long` was subscribed late)
+        """
+        last = self._last_seq.get(symbol, -1)
+        if end is None:
+            end = last
+        elif end > last:
+            raise ValueError(f"Seq {end} for {symbol} has not been recorded")
+        if end + 1 < long:
+            return None
+
+        ring = self._rings[symbol]
+        capacity = len(ring)
+        if end - long >= 0 and end - long <= last - capacity:
+            raise ValueError(f"Window {long} for {symbol} exceeds the ring; subscribe to it first")
+        if 0 <= end - long < self._held_from.get(symbol, 0):
+            return None
+        top = ring[end % capacity]
+        start = end - short
+        short_mean = (top - ring[start % capacity] if start >= 0 else top) / short
+        start = end - long
+        long_mean = (top - ring[start % capacity] if start >= 0 else top) / long
+        return short_mean, long_mean
+
+    def means(self, symbol: str, windows: Tuple[int, ...]) -> Tuple[Optional[float], ...]:
+        """Latest means for several windows at once."""
+        return tuple(self.mean(symbol, window) for window in windows)
@@ -5,109 +5,63 @@ Compares all optimization strategies:
 1. Naive (baseline)
 2. Windowed (deque + running sums)
 3. Vectorized (NumPy batch processing)
-4. Cached (LRU memoization)
+4. Cached (shared prefix-sum cache)
 5. Streaming (generator-based)
 6. Hybrid (combined optimizations)
+7. Chunked (micro-batch streaming)
 
 Generates comprehensive comparison report.
 """
 
-import timeit
-import tracemalloc
 from pathlib import Path
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from typing import Dict, Any
+from datetime import datetime
 import cProfile
 import io
 import pstats
-import numpy as np
 # Import optimized strategies
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
-from finm_python.hw3 import (
-MarketDataPoint,
-NaiveMovingAverageStrategy,
-WindowedMovingAverageStrategy,
-VectorizedMovingAverageStrategy,
-CachedMovingAverageStrategy,
-StreamingMovingAverageStrategy,
-HybridOptimizedStrategy, Strategy,
+from finm_python.hw3.src.benchmark import (
+    BENCHMARKS,
+    BenchmarkCase,
+    BenchmarkConfig,
+    available_benchmarks,
+    benchmark_case,
+    market_data,
 )
+from finm_python.hw3.src.sampling_profiler import SamplingProfiler
+from finm_python.hw3.src.reporting import generate_flamegraph
 
-def generate_market_data(n_ticks: int, seed: int = 42) -> List[MarketDataPoint]:
-    """Generate synthetic market data."""
-    np.random.seed(seed)
-    returns = np.random.normal(loc=0.0001, scale=0.02, size=n_ticks)
-    prices = 100.0 * np.exp(np.cumsum(returns))
-    base_time = datetime(2025, 1, 1, 9, 30, 0)
+def benchmark_strategy(case: BenchmarkCase, n_ticks: int, params: dict,
+                       config: BenchmarkConfig = None) -> Dict:
+    """
+    Benchmark a single strategy.
 
-    result = []
-    for i, price in enumerate(prices.tolist()):
-        data_point = MarketDataPoint(
-            timestamp=base_time + timedelta(seconds=i),
-            symbol='AAPL',
-            price=price
-        )
-        result.append(data_point)
-
-    return result
-
-
-def run_strategy(strat: Strategy, data: List[MarketDataPoint]) -> None:
-    if isinstance(strat, VectorizedMovingAverageStrategy):
-        strat.process_batch(data)
-    elif isinstance(strat, StreamingMovingAverageStrategy):
-        for signal in strat.stream_signals(iter(data)):
-            pass  # consume generator
-    else:
-        for tick in data:
-            strat.generate_signals(tick)
-
-def benchmark_strategy(strategy_class, n_ticks: int, params: dict) -> Dict:
-    """Benchmark a single strategy."""
-    # Generate data
-    data = generate_market_data(n_ticks)
-
-    # Time measurement
-    strategy = strategy_class(params)
-
-    start_time = timeit.default_timer()
-    run_strategy(strategy, data)
-    end_time = timeit.default_timer()
-
-    execution_time = end_time - start_time
-
-    # Memory measurement
-    strategy = strategy_class(params)
-    tracemalloc.start()
-
-    run_strategy(strategy, data)
-
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-
-    # Cache info (if applicable)
-    cache_info = None
-    if hasattr(strategy, 'get_cache_info'):
-        cache_info = strategy.get_cache_info()
+    Uses the shared benchmark subsystem: cached dataset, warmup, repeated
+    timed runs (reported as the median) and a separate tracemalloc pass.
+    """
+    result = benchmark_case(case, n_ticks, params, config)
+    if result['error']:
+        raise RuntimeError(result['error'])
 
     return {
-        'time': execution_time,
-        'time_per_tick': execution_time / n_ticks * 1e6,  # microseconds
-        'memory_current': current / 1024 / 1024,  # MB
-        'memory_peak': peak / 1024 / 1024,  # MB
-        'cache_info': cache_info
+        'time': result['median'],
+        'time_iqr': result['iqr'],
+        'time_per_tick': result['time_per_tick'],  # microseconds
+        'memory_peak': result['memory_peak'],  # MB
+        'cache_info': result['cache_info']
     }
 
 
-def benchmark_cprofile(strategy_class, n_ticks: int, params: dict, profile_dir: Path) -> tuple:
+def benchmark_cprofile(case: BenchmarkCase, n_ticks: int, params: dict, profile_dir: Path) -> tuple:
     """Benchmark a single strategy using cProfile."""
-    data = generate_market_data(n_ticks)
-    strategy = strategy_class(params)
+    data = market_data(n_ticks)
+    strategy = case.factory(params)
     profile = cProfile.Profile()
     profile.enable()
-    run_strategy(strategy, data)
+    case.runner(strategy, data)
     profile.disable()
     s = io.StringIO()
     sortby = 'cumulative'
@@ -118,15 +72,52 @@ def benchmark_cprofile(strategy_class, n_ticks: int, params: dict, profile_dir:
     return ps, profile_text
 
 
-def run_comprehensive_benchmark():
+def benchmark_sampling(strategies, n_ticks: int, params: dict, output_prefix: Path,
+                       interval: float = 0.0005) -> Dict:
+    """
+    Profile strategies with the low-overhead sampling profiler.
+
+    All strategies run under one profiler, each inside its own label, so the
+    resulting flamegraph attributes samples per strategy side by side.
+
+    Args:
+        strategies: Iterable of (name, BenchmarkCase) pairs
+        n_ticks: Dataset size
+        params: Strategy parameters
+        output_prefix: Path prefix for the .folded, .svg and .html outputs
+        interval: Sampling interval in seconds
+
+    Returns:
+        Dict with output paths, total samples and samples per strategy
+    """
+    data = market_data(n_ticks)
+    profiler = SamplingProfiler(interval=interval)
+    with profiler:
+        for name, case in strategies:
+            strategy = case.factory(params)
+            with profiler.label(name):
+                case.runner(strategy, data)
+
+    folded = profiler.write_collapsed(Path(output_prefix).with_suffix('.folded'))
+    svg, html = generate_flamegraph(
+        profiler.collapsed(), output_prefix,
+        title=f"Strategy samples ({n_ticks:,} ticks, {interval * 1e3:g} ms interval)"
+    )
+    return {
+        'folded': folded,
+        'svg': svg,
+        'html': html,
+        'total_samples': profiler.total_samples,
+        'samples_by_strategy': profiler.by_label(),
+    }
+
 
+def run_comprehensive_benchmark(config: BenchmarkConfig = None):
+
+    # The hw3 variants registered in benchmark.py, named without the group prefix
     strategies = [
-        ('Naive', NaiveMovingAverageStrategy, 'Baseline O(n)'),
-        ('Windowed', WindowedMovingAverageStrategy, 'Deque + Running Sums'),
-        ('Vectorized', VectorizedMovingAverageStrategy, 'NumPy Batch Processing'),
-        ('Cached', CachedMovingAverageStrategy, 'LRU Memoization'),
-        ('Streaming', StreamingMovingAverageStrategy, 'Generator-based'),
-        ('Hybrid', HybridOptimizedStrategy, 'Combined Optimizations')
+        (name.split('.', 1)[1], BENCHMARKS[name], BENCHMARKS[name].description)
+        for name in available_benchmarks('hw3')
     ]
 
     tick_sizes = [1_000, 10_000, 100_000]
@@ -146,7 +137,7 @@ def run_comprehensive_benchmark():
         results['data'][name] = {
             'times': [],
             'times_per_tick': [],
-            'memory_current': [],
+            'times_iqr': [],
             'memory_peak': [],
             'cache_info': []
         }
@@ -163,22 +154,23 @@ def run_comprehensive_benchmark():
         print(f"Benchmarking with {n_ticks:,} ticks")
         print(f"{'='*80}")
 
-        for name, strategy_class, description in strategies:
+        for name, case, description in strategies:
             print(f"\n  {name} ({description}):")
 
             try:
-                result = benchmark_strategy(strategy_class, n_ticks, params)
+                result = benchmark_strategy(case, n_ticks, params, config)
 
                 results['data'][name]['times'].append(result['time'])
                 results['data'][name]['times_per_tick'].append(result['time_per_tick'])
-                results['data'][name]['memory_current'].append(result['memory_current'])
+                results['data'][name]['times_iqr'].append(result['time_iqr'])
                 results['data'][name]['memory_peak'].append(result['memory_peak'])
                 results['data'][name]['cache_info'].append(result['cache_info'])
 
                 if n_ticks == 10_000:
                     profile_dir = Path("./output/profiles/")
+                    profile_dir.mkdir(parents=True, exist_ok=True)
                     stats, profile_text = benchmark_cprofile(
-                        strategy_class,
+                        case,
                         n_ticks,
                         params,
                         profile_dir
@@ -195,7 +187,8 @@ def run_comprehensive_benchmark():
                     results['data'][name]['profile_logs'] = profile_text
                     results['data'][name]['profile_files'] = f"profiles/{name}_{n_ticks}_ticks.txt"
 
-                print(f"    ✓ Time: {result['time']:.4f}s ({result['time_per_tick']:.2f} µs/tick)")
+                print(f"    ✓ Time: {result['time']:.4f}s median, IQR {result['time_iqr']:.4f}s "
+                      f"({result['time_per_tick']:.2f} µs/tick)")
                 print(f"    ✓ Memory: {result['memory_peak']:.4f} MB peak")
 
                 if result['cache_info']:
@@ -205,8 +198,20 @@ def run_comprehensive_benchmark():
                 print(f"    ✗ Error: {e}")
                 results['data'][name]['times'].append(None)
                 results['data'][name]['times_per_tick'].append(None)
-                results['data'][name]['memory_current'].append(None)
+                results['data'][name]['times_iqr'].append(None)
                 results['data'][name]['memory_peak'].append(None)
                 results['data'][name]['cache_info'].append(None)
 
+    # Sampling profile of every strategy at the largest size
+    print(f"\n{'='*80}")
+    print("Sampling profiler (flamegraph)")
+    print(f"{'='*80}")
+    sampling = benchmark_sampling(
+        [(name, case) for name, case, _ in strategies],
+        tick_sizes[-1], params, Path("./output/profiles/flamegraph")
+    )
+    results['flamegraph'] = f"profiles/{sampling['svg'].name}"
+    results['samples_by_strategy'] = sampling['samples_by_strategy']
+    print(f"  ✓ {sampling['total_samples']:,} samples -> {sampling['html']}")
+
     return results
\ No newline at end of file
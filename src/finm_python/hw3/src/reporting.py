@@ -4,10 +4,14 @@ Report generation and visualization.
 Functions:
 - generate_complexity_report(results: dict, output_path: str)
 - generate_plots(results: dict)
+- generate_scaling_plots(scaling: dict, plot_dir: Path)
+- generate_flamegraph(collapsed: dict, output_prefix: Path, title: str)
 """
 
+import html
+import zlib
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -20,7 +24,7 @@ def generate_plots(results: Dict, plot_dir: Path):
 
     strategies = results['strategies']
     tick_sizes = results['tick_sizes']
-    colors = ['#e74c3c', '#2ecc71', '#3498db', '#9b59b6', '#f39c12', '#1abc9c']
+    colors = ['#e74c3c', '#2ecc71', '#3498db', '#9b59b6', '#f39c12', '#1abc9c', '#34495e']
 
     # Plot 1: Execution Time Comparison
     ax1 = plt.subplot(2, 3, 1)
@@ -137,6 +141,36 @@ def generate_plots(results: Dict, plot_dir: Path):
     return 'optimization_comparison.png'
 
 
+def generate_scaling_plots(scaling: Dict, plot_dir: Path) -> str:
+    """Log-log plots of run time vs n and vs window from run_scaling_sweep."""
+    sns.set_style("whitegrid")
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    sweeps = [
+        (axes[0], 'n', scaling['n_grid'], 'Number of Ticks (log)'),
+        (axes[1], 'window', scaling['window_grid'],
+         f"Long Window (log, {scaling['window_n']:,} ticks)"),
+    ]
+    for ax, axis, grid, xlabel in sweeps:
+        for name, entry in scaling['strategies'].items():
+            if entry['error']:
+                continue
+            fit = entry[axis]
+            ax.loglog(grid, fit['times'], 'o-', linewidth=2, markersize=6,
+                      label=f"{name} (k={fit['exponent']:.2f})")
+        ax.set_xlabel(xlabel, fontsize=11, fontweight='bold')
+        ax.set_ylabel('Time (seconds, log)', fontsize=11, fontweight='bold')
+        ax.set_title(f'Empirical Scaling: Time vs {axis}', fontsize=12, fontweight='bold')
+        ax.legend(fontsize=8, loc='upper left')
+        ax.grid(True, alpha=0.3, which='both')
+
+    plt.tight_layout()
+    plot_path = plot_dir / 'scaling_curves.png'
+    plt.savefig(plot_path, dpi=200, bbox_inches='tight')
+    plt.close()
+
+    return 'scaling_curves.png'
+
+
 def generate_complexity_report(results: Dict, plot_filename: str, output_dir: Path) -> Path:
     """Generate comprehensive markdown report."""
     md = []
@@ -160,17 +194,33 @@ def generate_complexity_report(results: Dict, plot_filename: str, output_dir: Pa
         elif name == 'Vectorized':
             md.append("NumPy vectorization |\n")
         elif name == 'Cached':
-            md.append("LRU cache memoization |\n")
+            md.append("Shared prefix sums + bounded mean cache |\n")
         elif name == 'Streaming':
             md.append("Generator lazy evaluation |\n")
         elif name == 'Hybrid':
             md.append("Circular buffers + NumPy |\n")
+        elif name == 'Chunked':
+            md.append("Chunked prefix sums + carried tail |\n")
     md.append("\n")
 
     # Performance Visualization
     md.append("## Performance Comparison\n\n")
     md.append(f"![Optimization Comparison](plots/{plot_filename})\n\n")
 
+    # Sampling profile
+    if results.get('flamegraph'):
+        md.append("## Sampling Profile\n\n")
+        md.append("Low-overhead stack sampling of every strategy at the largest input size. ")
+        md.append("Each strategy is a root frame, so widths are directly comparable.\n\n")
+        md.append(f"![Flamegraph]({results['flamegraph']})\n\n")
+        samples = results.get('samples_by_strategy', {})
+        if samples:
+            md.append("| Strategy | Samples |\n")
+            md.append("|----------|---------|\n")
+            for name in results['strategies']:
+                md.append(f"| {name} | {samples.get(name, 0):,} |\n")
+            md.append("\n")
+
     # cProfile Results
     strategies = results['strategies']
     md.append("## cProfile Results\n\n")
@@ -302,9 +352,37 @@ def generate_complexity_report(results: Dict, plot_filename: str, output_dir: Pa
     md.append("- **Real-time Trading (HFT)**: Use **Windowed** or **Hybrid** for O(1) performance\n")
     md.append("- **Backtesting Large Datasets**: Use **Vectorized** for NumPy acceleration\n")
     md.append("- **Low-Memory Environments**: Use **Streaming** for minimal footprint\n")
+    md.append("- **Replaying Long Streams**: Use **Chunked** for batch speed at bounded memory\n")
     md.append("- **Synthetic Data/Testing**: Consider **Cached** for repeated patterns\n")
     md.append("- **Production Systems**: Use **Hybrid** for best overall performance\n\n")
 
+    # Empirical Scaling
+    scaling = results.get('scaling')
+    if scaling:
+        md.append("## Empirical Scaling\n\n")
+        md.append(f"Time vs n over {scaling['n_grid']} ticks (windows {results['params']['short']}/"
+                  f"{results['params']['long']}); time vs long window over {scaling['window_grid']} "
+                  f"at {scaling['window_n']:,} ticks (short = long / 4). ")
+        md.append("Exponents k are fitted as time ~ x^k on the upper half of each grid. ")
+        md.append(f"A strategy is flagged when k exceeds its documented exponent by more than "
+                  f"{scaling['tolerance']}, or a documented dependence does not show up at all.\n\n")
+        if results.get('scaling_plot'):
+            md.append(f"![Scaling Curves](plots/{results['scaling_plot']})\n\n")
+        md.append("| Strategy | k (n) | Documented | k (window) | Documented | Verdict |\n")
+        md.append("|----------|-------|------------|------------|------------|---------|\n")
+        for name, entry in scaling['strategies'].items():
+            if entry['error']:
+                md.append(f"| {name} | N/A | | N/A | | Error: {entry['error']} |\n")
+                continue
+            documented = entry.get('documented', {})
+            verdict = "; ".join(entry['contradictions']) or "Consistent"
+            if entry['contradictions']:
+                verdict = f"**Contradiction:** {verdict}"
+            md.append(f"| {name} | {entry['n']['exponent']:.2f} | {documented.get('n', '?')} | "
+                      f"{entry['window']['exponent']:.2f} | {documented.get('window', '?')} | "
+                      f"{verdict} |\n")
+        md.append("\n")
+
     # Complexity Summary
     md.append("## Complexity Summary\n\n")
     md.append("| Strategy | Time Complexity | Space Complexity | Notes |\n")
@@ -312,15 +390,157 @@ def generate_complexity_report(results: Dict, plot_filename: str, output_dir: Pa
     md.append("| Naive | O(n) | O(n) | Baseline, recalculates everything |\n")
     md.append("| Windowed | O(1) | O(k) | Optimal for streaming |\n")
     md.append("| Vectorized | O(n)* | O(n) | NumPy acceleration |\n")
-    md.append("| Cached | O(1)** | O(k+c) | Depends on cache hits |\n")
+    md.append("| Cached | O(1) | O(k+c) | Shared prefix sums, hit or miss |\n")
     md.append("| Streaming | O(1) | O(k) | Generator-based |\n")
-    md.append("| Hybrid | O(1) | O(k) | Best overall |\n\n")
-    md.append("*With NumPy C-level optimization  \n")
-    md.append("**O(n) on cache misses\n\n")
+    md.append("| Hybrid | O(1) | O(k) | Best overall |\n")
+    md.append("| Chunked | O(1)* | O(c+k) | Micro-batch streaming |\n\n")
+    md.append("*With NumPy C-level optimization\n\n")
 
     # Write report
     report_path = output_dir / 'optimization_challenge_report.md'
     with open(report_path, 'w') as f:
         f.write(''.join(md))
 
-    return report_path
\ No newline at end of file
+    return report_path
+
+
+# ============================================================================
+# Flamegraphs
+# ============================================================================
+
+FLAME_WIDTH = 1200
+FRAME_HEIGHT = 16
+FONT_SIZE = 11
+CHAR_WIDTH = 6.5  # approximate width of one character at FONT_SIZE
+
+
+def _build_stack_tree(collapsed: Dict[str, int]) -> dict:
+    """Merge collapsed stacks into a tree of {'name', 'value', 'children'}."""
+    root = {'name': 'all', 'value': 0, 'children': {}}
+    for stack, count in collapsed.items():
+        root['value'] += count
+        node = root
+        for frame in stack.split(';'):
+            child = node['children'].get(frame)
+            if child is None:
+                child = node['children'][frame] = {'name': frame, 'value': 0, 'children': {}}
+            child['value'] += count
+            node = child
+    return root
+
+
+def _frame_color(name: str) -> str:
+    """Stable warm colour per frame name (classic flamegraph palette)."""
+    h = zlib.crc32(name.encode())
+    r = 205 + h % 50
+    g = 80 + (h >> 8) % 130
+    b = (h >> 16) % 55
+    return f"rgb({r},{g},{b})"
+
+
+def _flame_rects(node: dict, x: float, depth: int, scale: float, rects: list) -> int:
+    """Lay out frames depth-first; children sorted by name like flamegraph.pl."""
+    rects.append((node['name'], node['value'], x, depth, node['value'] * scale))
+    max_depth = depth
+    child_x = x
+    for name in sorted(node['children']):
+        child = node['children'][name]
+        max_depth = max(max_depth, _flame_rects(child, child_x, depth + 1, scale, rects))
+        child_x += child['value'] * scale
+    return max_depth
+
+
+def render_flamegraph_svg(collapsed: Dict[str, int], title: str = 'Flame Graph') -> str:
+    """
+    Render collapsed stacks as a standalone SVG flamegraph.
+
+    Root at the bottom, width proportional to samples; hovering a frame
+    shows its sample count and share via an SVG <title> tooltip.
+    """
+    tree = _build_stack_tree(collapsed)
+    total = tree['value'] or 1
+    scale = FLAME_WIDTH / total
+
+    rects = []
+    max_depth = _flame_rects(tree, 0.0, 0, scale, rects)
+    top = 40
+    height = top + (max_depth + 1) * FRAME_HEIGHT + 10
+
+    svg = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{FLAME_WIDTH}" height="{height}" '
+        f'font-family="Verdana, sans-serif" font-size="{FONT_SIZE}">',
+        f'<rect width="100%" height="100%" fill="#f8f8f8"/>',
+        f'<text x="{FLAME_WIDTH / 2}" y="24" text-anchor="middle" font-size="16">'
+        f'{html.escape(title)}</text>',
+    ]
+    for name, value, x, depth, width in rects:
+        if width < 0.5:
+            continue
+        y = height - 10 - (depth + 1) * FRAME_HEIGHT
+        label = html.escape(name)
+        svg.append('<g>')
+        svg.append(f'<title>{label} ({value:,} samples, {100 * value / total:.2f}%)</title>')
+        svg.append(f'<rect x="{x:.2f}" y="{y}" width="{width:.2f}" height="{FRAME_HEIGHT - 1}" '
+                   f'fill="{_frame_color(name)}" rx="2"/>')
+        max_chars = int((width - 6) / CHAR_WIDTH)
+        if max_chars >= 3:
+            text = name if len(name) <= max_chars else name[:max_chars - 2] + '..'
+            svg.append(f'<text x="{x + 3:.2f}" y="{y + FRAME_HEIGHT - 4}">{html.escape(text)}</text>')
+        svg.append('</g>')
+    svg.append('</svg>')
+    return '\n'.join(svg)
+
+
+def generate_flamegraph(collapsed: Dict[str, int], output_prefix: Path,
+                        title: str = 'Flame Graph') -> Tuple[Path, Path]:
+    """
+    Write an SVG flamegraph and an HTML page embedding it.
+
+    The HTML page adds a per-root breakdown (e.g. samples per strategy when
+    the profiler labelled them) below the graph.
+
+    Args:
+        collapsed: Collapsed stacks ("a;b;c" -> samples), e.g. from
+                   SamplingProfiler.collapsed()
+        output_prefix: Path without suffix; '.svg' and '.html' are appended
+        title: Graph title
+
+    Returns:
+        (svg_path, html_path)
+    """
+    output_prefix = Path(output_prefix)
+    output_prefix.parent.mkdir(parents=True, exist_ok=True)
+    svg = render_flamegraph_svg(collapsed, title)
+
+    svg_path = output_prefix.with_suffix('.svg')
+    with open(svg_path, 'w') as f:
+        f.write(svg)
+
+    total = sum(collapsed.values()) or 1
+    roots: Dict[str, int] = {}
+    for stack, count in collapsed.items():
+        root = stack.split(';', 1)[0]
+        roots[root] = roots.get(root, 0) + count
+
+    rows = ''.join(
+        f"<tr><td>{html.escape(name)}</td><td>{count:,}</td><td>{100 * count / total:.1f}%</td></tr>"
+        for name, count in sorted(roots.items(), key=lambda item: -item[1])
+    )
+    page = (
+        "<!DOCTYPE html>\n<html><head><meta charset='utf-8'>"
+        f"<title>{html.escape(title)}</title>"
+        "<style>body{font-family:sans-serif;margin:20px}"
+        "table{border-collapse:collapse}td,th{padding:4px 12px;border-bottom:1px solid #ddd}</style>"
+        "</head><body>"
+        f"<h1>{html.escape(title)}</h1>"
+        f"<p>{total:,} samples. Hover a frame for details.</p>"
+        f"{svg}"
+        "<h2>Samples by root frame</h2>"
+        f"<table><tr><th>Root</th><th>Samples</th><th>Share</th></tr>{rows}</table>"
+        "</body></html>\n"
+    )
+    html_path = output_prefix.with_suffix('.html')
+    with open(html_path, 'w') as f:
+        f.write(page)
+
+    return svg_path, html_path
@@ -0,0 +1,256 @@
+"""
+Low-overhead in-process sampling profiler.
+
+Classes:
+- SamplingProfiler: signal-driven stack sampler producing collapsed stacks
+
+Functions:
+- profile_call(fn, *args, **kwargs): run any callable under the sampler
+
+Unlike cProfile, which instruments every call and so inflates the cost of
+tiny per-tick functions, the sampler only looks at the stack every
+`interval` seconds. A timer signal (SIGPROF for CPU time, SIGALRM for wall
+time) interrupts the main thread, the handler records the interrupted
+frame chain as a tuple of code objects, and formatting is deferred until
+the run is over. Overhead is a few microseconds per sample, i.e. ~1% at
+the default 1ms interval.
+
+Samples can be attributed to a label (e.g. a strategy name) with
+`profiler.label(name)`; the label becomes the root frame of every stack
+recorded inside it, so one flamegraph can compare several strategies.
+
+Limitations:
+- POSIX only (uses signal.setitimer)
+- Samples the main thread only, since Python runs signal handlers there
+- Effective resolution is bounded by the kernel timer tick (often 1-4ms)
+- Time inside a long C call (e.g. one NumPy kernel) is charged to the
+  Python frame that made it, since handlers run between bytecodes
+
+Usage:
+    profiler = SamplingProfiler(interval=0.001)
+    with profiler:
+        with profiler.label('Hybrid'):
+            run_strategy(strategy, data)
+    profiler.write_collapsed(Path('hybrid.folded'))
+
+    # Profile any module's entry point, e.g. the hw6 engine demo
+    python -m finm_python.hw3.src.sampling_profiler -o out/hw6 finm_python.hw6.main strategy
+"""
+
+import argparse
+import os
+import runpy
+import signal
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+
+MODES = {
+    'cpu': (signal.ITIMER_PROF, signal.SIGPROF) if hasattr(signal, 'SIGPROF') else None,
+    'wall': (signal.ITIMER_REAL, signal.SIGALRM) if hasattr(signal, 'SIGALRM') else None,
+}
+
+
+def _frame_name(code: CodeType) -> str:
+    """Readable frame label: function (file:line)."""
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    Signal-based statistical profiler.
+
+    Attributes:
+        interval: Seconds between samples
+        mode: 'cpu' (process CPU time, SIGPROF) or 'wall' (real time, SIGALRM)
+        samples: Counter of (label, code-object stack) -> sample count
+    """
+
+    def __init__(self, interval: float = 0.001, mode: str = 'cpu'):
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode} (expected one of {list(MODES)})")
+        if MODES[mode] is None:
+            raise RuntimeError(f"Sampling mode '{mode}' is not supported on this platform")
+        if interval <= 0:
+            raise ValueError("Interval must be positive")
+
+        self.interval = interval
+        self.mode = mode
+        self.samples: Counter = Counter()
+        self._label: Optional[str] = None
+        self._root: Optional[FrameType] = None
+        self._previous_handler = None
+        self._running = False
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    def _handle(self, signum, frame: Optional[FrameType]) -> None:
+        """Signal handler: record the interrupted stack (innermost last)."""
+        codes = []
+        root = self._root
+        while frame is not None:
+            codes.append(frame.f_code)
+            if frame is root:
+                break
+            frame = frame.f_back
+        codes.reverse()
+        self.samples[(self._label, tuple(codes))] += 1
+
+    def start(self, root: Optional[FrameType] = None) -> None:
+        """
+        Install the signal handler and start the interval timer.
+
+        Args:
+            root: Frame at which recorded stacks are truncated (kept as the
+                  outermost frame). Defaults to the caller's frame, which
+                  hides the harness that started profiling.
+
+        Raises:
+            RuntimeError: If already running or not called from the main thread
+        """
+        if self._running:
+            raise RuntimeError("Profiler is already running")
+        timer, signum = MODES[self.mode]
+        self._root = root if root is not None else sys._getframe(1)
+        # signal.signal raises ValueError outside the main thread
+        try:
+            self._previous_handler = signal.signal(signum, self._handle)
+        except ValueError as e:
+            raise RuntimeError("SamplingProfiler must be started from the main thread") from e
+        signal.setitimer(timer, self.interval, self.interval)
+        self._running = True
+
+    def stop(self) -> None:
+        """Stop the timer and restore the previous signal handler."""
+        if not self._running:
+            return
+        timer, signum = MODES[self.mode]
+        signal.setitimer(timer, 0, 0)
+        signal.signal(signum, self._previous_handler)
+        self._running = False
+        self._root = None
+
+    def __enter__(self) -> 'SamplingProfiler':
+        self.start(root=sys._getframe(1))
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    @contextmanager
+    def label(self, name: str):
+        """Attribute samples taken inside the block to `name`."""
+        previous = self._label
+        self._label = name
+        try:
+            yield
+        finally:
+            self._label = previous
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    @property
+    def total_samples(self) -> int:
+        return sum(self.samples.values())
+
+    def collapsed(self) -> Dict[str, int]:
+        """
+        Samples in collapsed-stack form ("root;child;leaf" -> count).
+
+        This is the input format of Brendan Gregg's flamegraph.pl and of
+        reporting.generate_flamegraph. Labelled samples get the label as
+        their root frame.
+        """
+        stacks: Counter = Counter()
+        names: Dict[CodeType, str] = {}
+        for (label, codes), count in self.samples.items():
+            frames = [names.setdefault(code, _frame_name(code)) for code in codes]
+            if label is not None:
+                frames.insert(0, label)
+            # ';' separates frames in the collapsed format
+            stacks[';'.join(f.replace(';', ':') for f in frames)] += count
+        return dict(stacks)
+
+    def by_label(self) -> Dict[Optional[str], int]:
+        """Total samples per label (None = unlabelled)."""
+        totals: Counter = Counter()
+        for (label, _), count in self.samples.items():
+            totals[label] += count
+        return dict(totals)
+
+    def self_counts(self, top: int = 20) -> Sequence[Tuple[str, int]]:
+        """Frames ranked by samples in which they were the innermost frame."""
+        totals: Counter = Counter()
+        for (_, codes), count in self.samples.items():
+            if codes:
+                totals[_frame_name(codes[-1])] += count
+        return totals.most_common(top)
+
+    def write_collapsed(self, path: Path) -> Path:
+        """Write collapsed stacks, one "stack count" line each."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            for stack, count in sorted(self.collapsed().items()):
+                f.write(f"{stack} {count}\n")
+        return path
+
+
+def profile_call(fn: Callable, *args, interval: float = 0.001, mode: str = 'cpu',
+                 label: Optional[str] = None, **kwargs) -> Tuple[Any, SamplingProfiler]:
+    """
+    Run `fn(*args, **kwargs)` under a fresh SamplingProfiler.
+
+    Returns:
+        (fn's return value, the profiler holding the samples)
+    """
+    profiler = SamplingProfiler(interval=interval, mode=mode)
+    profiler.start(root=sys._getframe(0))
+    try:
+        if label is None:
+            result = fn(*args, **kwargs)
+        else:
+            with profiler.label(label):
+                result = fn(*args, **kwargs)
+    finally:
+        profiler.stop()
+    return result, profiler
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Profile a module run as `python -m <module> [args...]`."""
+    parser = argparse.ArgumentParser(description="Sample a Python module's execution")
+    parser.add_argument('module', help="Module to run, e.g. finm_python.hw6.main")
+    parser.add_argument('args', nargs=argparse.REMAINDER, help="Arguments for the module")
+    parser.add_argument('-o', '--output', type=Path, default=Path('./output/profiles/sampled'),
+                        help="Output prefix for .folded/.svg/.html files")
+    parser.add_argument('--interval', type=float, default=0.001)
+    parser.add_argument('--mode', choices=list(MODES), default='cpu')
+    args = parser.parse_args(argv)
+
+    from finm_python.hw3.src.reporting import generate_flamegraph
+
+    sys.argv = [args.module, *args.args]
+    profiler = SamplingProfiler(interval=args.interval, mode=args.mode)
+    try:
+        with profiler:
+            runpy.run_module(args.module, run_name='__main__', alter_sys=True)
+    except SystemExit:
+        pass
+
+    folded = profiler.write_collapsed(args.output.with_suffix('.folded'))
+    svg, html = generate_flamegraph(profiler.collapsed(), args.output, title=args.module)
+    print(f"{profiler.total_samples} samples -> {folded}, {svg}, {html}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
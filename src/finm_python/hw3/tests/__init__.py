@@ -0,0 +1 @@
+"""Unit tests for HW3 trading strategies and indicators."""
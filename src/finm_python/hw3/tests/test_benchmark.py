@@ -0,0 +1,125 @@
+"""
+Unit Tests for the Benchmark Subsystem
+
+Tests to validate:
+- Timing summaries and the shape of benchmark results
+- Baseline regression detection
+- Complexity exponent fits and their checks
+"""
+
+import pytest
+import numpy as np
+
+from finm_python.hw3.src.benchmark import (
+    BenchmarkCase, BenchmarkConfig, benchmark_case, check_exponent, compare_to_baseline,
+    fit_exponent, load_results, log_grid, run_benchmarks, save_results, summarize_times,
+)
+
+
+QUICK = BenchmarkConfig(warmup=0, repeats=3, seed=1)
+
+
+def _results(medians):
+    """Minimal run_benchmarks-style results: {name: {size: median or error}}."""
+    return {'results': {
+        name: {size: ({'error': value} if isinstance(value, str) else {'median': value, 'error': None})
+               for size, value in by_size.items()}
+        for name, by_size in medians.items()
+    }}
+
+
+class TestMeasurement:
+    """Tests for timing summaries and single-case results."""
+
+    def test_summarize_times(self):
+        """Test that the summary reports median and interquartile range."""
+        summary = summarize_times([5.0, 1.0, 3.0, 2.0, 4.0])
+        assert summary['median'] == 3.0
+        assert (summary['q1'], summary['q3'], summary['iqr']) == (2.0, 4.0, 2.0)
+        assert summary['min'] == 1.0 and summary['mean'] == 3.0
+
+    def test_benchmark_case_shape(self):
+        """Test that a case reports every timing field and no error."""
+        case = BenchmarkCase('noop', lambda p: None, lambda strategy, data: None)
+        result = benchmark_case(case, 100, config=QUICK)
+        assert result['error'] is None
+        assert result['n_ticks'] == 100 and len(result['times']) == QUICK.repeats
+        for key in ('median', 'iqr', 'q1', 'q3', 'min', 'mean', 'time_per_tick', 'memory_peak'):
+            assert result[key] >= 0
+        assert result['cache_info'] is None
+
+    def test_benchmark_case_captures_errors(self):
+        """Test that a failing strategy is reported rather than raised."""
+        def runner(strategy, data):
+            raise RuntimeError("boom")
+
+        result = benchmark_case(BenchmarkCase('broken', lambda p: None, runner), 100, config=QUICK)
+        assert result['error'] == "RuntimeError: boom"
+        assert 'median' not in result
+
+    def test_results_round_trip(self, tmp_path):
+        """Test that run_benchmarks output survives save/load as JSON."""
+        results = run_benchmarks(['hw3.Windowed'], tick_sizes=(200,), config=QUICK, verbose=False)
+        assert set(results) == {'metadata', 'params', 'tick_sizes', 'results'}
+        assert results['metadata']['config']['repeats'] == QUICK.repeats
+
+        loaded = load_results(save_results(results, tmp_path / 'out' / 'results.json'))
+        assert loaded['tick_sizes'] == [200]
+        assert loaded['results']['hw3.Windowed']['200']['median'] == pytest.approx(
+            results['results']['hw3.Windowed']['200']['median'])
+
+
+class TestCompareToBaseline:
+    """Tests for regression flags against a stored baseline."""
+
+    def test_threshold(self):
+        """Test that only slowdowns beyond the threshold are regressions."""
+        baseline = _results({'A': {'100': 1.0, '1000': 1.0}, 'B': {'100': 2.0}})
+        current = _results({'A': {'100': 1.05, '1000': 1.2}, 'B': {'100': 1.0}})
+
+        flags = {(c['name'], c['n_ticks']): c['regression']
+                 for c in compare_to_baseline(current, baseline, threshold=0.10)}
+        assert flags == {('A', 100): False, ('A', 1000): True, ('B', 100): False}
+
+        looser = compare_to_baseline(current, baseline, threshold=0.25)
+        assert not any(c['regression'] for c in looser)
+
+    def test_comparison_shape(self):
+        """Test that each comparison carries both medians and their ratio."""
+        [comparison] = compare_to_baseline(_results({'A': {'100': 3.0}}), _results({'A': {'100': 2.0}}))
+        assert comparison == {'name': 'A', 'n_ticks': 100, 'baseline': 2.0, 'current': 3.0,
+                              'ratio': 1.5, 'regression': True}
+
+    def test_skips_missing_and_errored_cases(self):
+        """Test that cases without a usable baseline or result are left out."""
+        baseline = _results({'A': {'100': 1.0, '1000': 'ValueError: x'}})
+        current = _results({'A': {'100': 'RuntimeError: y', '1000': 1.0}, 'B': {'100': 1.0}})
+        assert compare_to_baseline(current, baseline) == []
+
+
+class TestScalingFit:
+    """Tests for empirical complexity exponents."""
+
+    @pytest.mark.parametrize("exponent", [1.0, 2.0])
+    def test_fit_recovers_exponent(self, exponent):
+        """Test that synthetic c * n^k timings give back k."""
+        n = np.array(log_grid(1_000, 100_000, 8), dtype=float)
+        fit = fit_exponent(n, 3e-7 * n ** exponent)
+        assert fit['exponent'] == pytest.approx(exponent)
+        assert fit['r2'] == pytest.approx(1.0)
+
+    def test_fit_ignores_small_input_overhead(self):
+        """Test that fixed overhead at small n doesn't flatten the fit."""
+        n = np.array(log_grid(100, 1_000_000, 10), dtype=float)
+        noise = 1 + 0.01 * np.random.default_rng(0).standard_normal(len(n))
+        fit = fit_exponent(n, (1e-4 + 1e-7 * n) * noise)
+        assert fit['exponent'] == pytest.approx(1.0, abs=0.1)
+
+    def test_check_exponent(self):
+        """Test that fits outside the tolerance are flagged, others pass."""
+        assert check_exponent(1.1, 1.0, 0.25) is None
+        assert check_exponent(0.9, 1.0, 0.25) is None
+        assert "faster" in check_exponent(2.0, 1.0, 0.25)
+        assert "does not grow" in check_exponent(0.05, 1.0, 0.25)
+        # A documented O(1) dependence only fails by growing, never by being flat
+        assert check_exponent(0.05, 0.0, 0.25) is None
@@ -0,0 +1,76 @@
+"""
+Unit Tests for the Shared Indicator Service
+
+Tests to validate:
+- Window means against direct averages
+- Late subscriptions to longer windows
+"""
+
+import pytest
+import numpy as np
+
+from finm_python.hw3.src.indicators import IndicatorService
+
+
+PRICES = [float(p) for p in range(1, 201)]
+
+
+class TestIndicatorService:
+    """Tests for prefix-sum window means."""
+
+    def test_mean_matches_direct_average(self):
+        """Test that window means equal averages of the last ticks."""
+        service = IndicatorService()
+        service.subscribe(None, 20)
+        for price in PRICES[:100]:
+            service.update("X", price)
+        assert service.mean("X", 20) == pytest.approx(np.mean(PRICES[80:100]))
+        assert service.crossover_means("X", 5, 20) == pytest.approx((np.mean(PRICES[95:100]), np.mean(PRICES[80:100])))
+
+    def test_mean_none_during_warm_up(self):
+        """Test that means are None until the window is full."""
+        service = IndicatorService()
+        service.subscribe(None, 20)
+        for price in PRICES[:19]:
+            service.update("X", price)
+        assert service.mean("X", 20) is None
+
+    def test_unsubscribed_window_raises(self):
+        """Test that a window longer than the ring is rejected."""
+        service = IndicatorService()
+        service.subscribe(None, 5)
+        for price in PRICES[:100]:
+            service.update("X", price)
+        with pytest.raises(ValueError):
+            service.mean("X", 50)
+
+    def test_late_subscription_warms_up(self):
+        """Test that a longer window subscribed mid-stream never returns stale means."""
+        service = IndicatorService()
+        service.subscribe(None, 5)
+        for price in PRICES[:100]:
+            service.update("X", price)
+        service.subscribe(None, 50)
+
+        # Only the last 6 prefix sums survived the resize
+        assert service.mean("X", 50) is None
+        for i in range(100, 144):
+            service.update("X", PRICES[i])
+            assert service.mean("X", 50) is None
+            assert service.crossover_means("X", 5, 50) is None
+            assert service.mean("X", 5) == pytest.approx(np.mean(PRICES[i - 4:i + 1]))
+
+        for i in range(144, 200):
+            service.update("X", PRICES[i])
+            assert service.mean("X", 50) == pytest.approx(np.mean(PRICES[i - 49:i + 1]))
+            assert service.crossover_means("X", 5, 50) == pytest.approx(
+                (np.mean(PRICES[i - 4:i + 1]), np.mean(PRICES[i - 49:i + 1])))
+
+    def test_subscription_before_updates_is_immediate(self):
+        """Test that windows subscribed before any tick need no extra warm-up."""
+        service = IndicatorService()
+        service.subscribe("X", 5)
+        service.subscribe(None, 50)
+        for price in PRICES[:50]:
+            service.update("X", price)
+        assert service.mean("X", 50) == pytest.approx(np.mean(PRICES[:50]))
@@ -0,0 +1,77 @@
+"""
+Unit Tests for the Sampling Profiler and Flamegraph Output
+
+Tests to validate:
+- Samples of a busy function land in its collapsed stacks
+- Labels become root frames
+- Flamegraph SVG and HTML files are written
+"""
+
+import signal
+import time
+
+import pytest
+
+from finm_python.hw3.src.reporting import generate_flamegraph
+from finm_python.hw3.src.sampling_profiler import MODES, SamplingProfiler, profile_call
+
+
+requires_sigprof = pytest.mark.skipif(MODES['cpu'] is None, reason="SIGPROF is not available")
+
+
+def _busy_loop(seconds):
+    """Spin on the CPU so the process timer keeps firing."""
+    deadline = time.process_time() + seconds
+    total = 0
+    while time.process_time() < deadline:
+        total += 1
+    return total
+
+
+class TestSamplingProfiler:
+    """Tests for signal-driven stack sampling."""
+
+    @requires_sigprof
+    def test_busy_function_in_collapsed_stacks(self):
+        """Test that sampling a busy function records stacks ending in it."""
+        result, profiler = profile_call(_busy_loop, 0.3, interval=0.005, label='busy')
+        assert result > 0
+        assert profiler.total_samples > 0
+        assert profiler.by_label() == {'busy': profiler.total_samples}
+
+        collapsed = profiler.collapsed()
+        assert sum(collapsed.values()) == profiler.total_samples
+        busy = [stack for stack in collapsed if '_busy_loop (test_sampling_profiler.py:' in stack]
+        assert busy and all(stack.startswith('busy;') for stack in busy)
+        assert profiler.self_counts(1)[0][0].startswith('_busy_loop')
+
+    @requires_sigprof
+    def test_stop_restores_signal_handler(self):
+        """Test that the previous SIGPROF handler is back after profiling."""
+        previous = signal.getsignal(signal.SIGPROF)
+        with SamplingProfiler(interval=0.005):
+            _busy_loop(0.02)
+        assert signal.getsignal(signal.SIGPROF) is previous
+
+    def test_invalid_settings_rejected(self):
+        """Test that unknown modes and non-positive intervals raise."""
+        with pytest.raises(ValueError):
+            SamplingProfiler(mode='gpu')
+        with pytest.raises(ValueError):
+            SamplingProfiler(interval=0)
+
+
+class TestFlamegraph:
+    """Tests for flamegraph rendering."""
+
+    def test_writes_svg_and_html(self, tmp_path):
+        """Test that both files are written and name every root frame."""
+        collapsed = {'Naive;run;mean': 30, 'Hybrid;run': 10}
+        svg_path, html_path = generate_flamegraph(collapsed, tmp_path / 'out' / 'flame', title='Test')
+
+        assert (svg_path.name, html_path.name) == ('flame.svg', 'flame.html')
+        svg = svg_path.read_text()
+        assert svg.lstrip().startswith('<svg') and 'Naive' in svg and 'mean' in svg
+        page = html_path.read_text()
+        assert '<svg' in page
+        assert '<td>Naive</td><td>30</td><td>75.0%</td>' in page
@@ -0,0 +1,120 @@
+"""
+Unit Tests for the Vectorized Moving Average Strategies
+
+Tests to validate:
+- Batch crossover signals against the per-tick windowed strategy
+- Flat price series produce no spurious crossovers
+- Chunked streaming signals across chunk boundaries
+- Shared prefix-sum cache hits, misses and evictions
+"""
+
+import numpy as np
+from datetime import datetime
+
+from finm_python.hw3 import MarketDataPoint
+from finm_python.hw3.src.strategies import (
+    BUY, HOLD, SELL, SIGNAL_ACTIONS,
+    VectorizedMovingAverageStrategy, WindowedMovingAverageStrategy,
+    ChunkedStreamingStrategy, CachedMovingAverageStrategy, PrefixSumCache,
+    CacheInfo, crossover_signals,
+)
+
+
+PARAMS = {'short': 5, 'long': 20}
+
+
+class TestCrossoverSignals:
+    """Tests for prefix-sum batch signals."""
+
+    def test_matches_windowed_strategy(self):
+        """Test that batch signals equal the per-tick deque strategy."""
+        prices = 100 + np.random.default_rng(0).normal(0, 1, 2000).cumsum()
+        windowed = WindowedMovingAverageStrategy(PARAMS)
+        expected = [
+            windowed.generate_signals(MarketDataPoint(datetime(2024, 1, 1), "X", float(p)))[0]
+            for p in prices
+        ]
+        signals = VectorizedMovingAverageStrategy(PARAMS).process_batch(prices)
+        assert [SIGNAL_ACTIONS[s] for s in signals] == expected
+
+    def test_flat_series_holds(self):
+        """Test that a constant series never crosses over."""
+        prices = np.full(100_000, 100.1)
+        assert not crossover_signals(prices, 5, 20).any()
+        assert not ChunkedStreamingStrategy(PARAMS, chunk_size=4096).process_chunk(prices).any()
+
+    def test_flat_stretches_after_moves_hold(self):
+        """Test that plateaus between price moves are ties, not crossovers."""
+        rng = np.random.default_rng(1)
+        levels = 5000.37 + np.round(rng.normal(0, 5, 200), 2).cumsum()
+        prices = np.repeat(levels, 500)
+        signals = crossover_signals(np.column_stack((prices, prices / 50)), 5, 20)
+
+        # Each plateau is flat once the long window lies entirely inside it
+        settled = (np.arange(len(prices)) % 500) >= 19
+        assert (signals[settled] == HOLD).all()
+        assert {BUY, SELL} <= set(np.unique(signals))
+
+
+class TestChunkedStreaming:
+    """Tests for micro-batch signals across chunk boundaries."""
+
+    def test_chunks_match_batch_and_single_ticks(self):
+        """Test that chunk edges inside a window don't change any signal."""
+        params = {'short': 5, 'long': 50}
+        prices = 100 + np.random.default_rng(3).normal(0, 1, 1000).cumsum()
+        ticks = [MarketDataPoint(datetime(2024, 1, 1), "X", float(p)) for p in prices]
+        batch = crossover_signals(prices, params['short'], params['long'])
+
+        # 7 divides neither n nor the window, so boundaries land everywhere
+        chunked = np.concatenate(list(ChunkedStreamingStrategy(params, chunk_size=7).stream_signals(iter(ticks))))
+        single = ChunkedStreamingStrategy(params, chunk_size=7)
+        per_tick = [single.generate_signals(tick)[0] for tick in ticks]
+
+        np.testing.assert_array_equal(chunked, batch)
+        assert per_tick == [SIGNAL_ACTIONS[s] for s in batch]
+
+
+class TestPrefixSumCache:
+    """Tests for the shared window-mean cache."""
+
+    def _cache(self, max_entries):
+        cache = PrefixSumCache(max_entries=max_entries)
+        cache.require(10)
+        for seq in range(10):
+            cache.record("X", seq, float(seq))
+        return cache
+
+    def test_window_mean_matches_direct_average(self):
+        """Test that cached means equal averages of the recorded prices."""
+        cache = self._cache(4)
+        assert cache.window_mean("X", 2, 6) == np.mean(range(2, 7))
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused mean is evicted past max_entries."""
+        cache = self._cache(2)
+        cache.window_mean("X", 0, 4)
+        cache.window_mean("X", 1, 5)
+        cache.window_mean("X", 0, 4)  # hit: (1, 5) is now the oldest
+        cache.window_mean("X", 2, 6)  # evicts (1, 5)
+        assert cache.cache_info() == CacheInfo(hits=1, misses=3, evictions=1, maxsize=2, currsize=2)
+
+        cache.window_mean("X", 0, 4)
+        cache.window_mean("X", 1, 5)  # recomputed, evicts (2, 6)
+        assert cache.cache_info() == CacheInfo(hits=2, misses=4, evictions=2, maxsize=2, currsize=2)
+
+    def test_shared_cache_counts(self):
+        """Test that variants sharing a short window hit each other's means."""
+        cache = PrefixSumCache()
+        fast = CachedMovingAverageStrategy({'short': 5, 'long': 20}, cache=cache)
+        slow = CachedMovingAverageStrategy({'short': 5, 'long': 30}, cache=cache)
+        prices = 100 + np.random.default_rng(2).normal(0, 1, 100).cumsum()
+        for price in prices:
+            tick = MarketDataPoint(datetime(2024, 1, 1), "X", float(price))
+            fast.generate_signals(tick)
+            slow.generate_signals(tick)
+
+        # fast misses both means from tick 19; slow reuses fast's short mean from tick 29
+        info = slow.get_cache_info()
+        assert (info.hits, info.misses, info.evictions) == (71, 81 * 2 + 71, 0)
+        assert info.currsize == 81 * 2 + 71
@@ -5,13 +5,19 @@ Provides convenience functions for adding analytics capabilities
 to instruments without modifying their base classes.
 """
 
-from typing import Optional
+from typing import Any, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 from .models import Instrument
 from .patterns.structural import (
     VolatilityDecorator,
     BetaDecorator,
-    DrawdownDecorator
+    DrawdownDecorator,
+    FullAnalyticsDecorator,
+    ANNUALIZATION_FACTOR,
+    fused_analytics_state
 )
 
 
@@ -77,7 +83,8 @@ def add_full_analytics(
     """
     Add all analytics decorators to an instrument.
 
-    Stacks volatility, beta, and drawdown decorators.
+    Uses a single FullAnalyticsDecorator rather than stacking the volatility,
+    beta, and drawdown decorators, so the data is scanned once.
 
     Args:
         instrument: Base instrument.
@@ -99,53 +106,124 @@ def add_full_analytics(
         >>> metrics = decorated.get_metrics()
         >>> # metrics now includes volatility, beta, and max_drawdown
     """
-    # Stack decorators
-    decorated = VolatilityDecorator(instrument, historical_returns)
-    decorated = BetaDecorator(decorated, historical_returns, market_returns)
-    decorated = DrawdownDecorator(decorated, price_history)
-    return decorated
+    return FullAnalyticsDecorator(instrument, historical_returns, market_returns, price_history)
 
 
-def calculate_returns(prices: list[float]) -> list[float]:
+def add_universe_analytics(
+    instruments: list[Instrument],
+    returns: ArrayLike,
+    market_returns: Optional[ArrayLike] = None,
+    prices: Optional[ArrayLike] = None
+) -> list[FullAnalyticsDecorator]:
     """
-    Calculate simple returns from price series.
+    Add full analytics to a whole universe with one vectorized call.
 
     Args:
-        prices: List of historical prices.
+        instruments: Instruments to decorate, one per matrix column.
+        returns: (time x instrument) return matrix.
+        market_returns: Market benchmark returns aligned with the rows.
+        prices: (time x instrument) price matrix for drawdown.
 
     Returns:
-        List of simple returns (percentage changes).
+        Decorated instruments in the same order as ``instruments``.
+    """
+    return FullAnalyticsDecorator.from_universe(instruments, returns, market_returns, prices)
+
+
+def _price_pairs(prices: ArrayLike) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split a price series into (previous, current, valid) arrays.
+
+    ``valid`` masks out any period where either price is non-positive.
     """
-    if len(prices) < 2:
-        return []
+    prices = np.asarray(prices, dtype=float)
+    previous = prices[:-1]
+    current = prices[1:]
+    valid = (previous > 0) & (current > 0)
+    return previous, current, valid
+
 
-    returns = []
-    for i in range(1, len(prices)):
-        ret = (prices[i] - prices[i - 1]) / prices[i - 1]
-        returns.append(ret)
+def calculate_returns(prices: ArrayLike) -> np.ndarray:
+    """
+    Calculate simple returns from price series.
 
-    return returns
+    Periods touching a non-positive price are reported as NaN rather than
+    dropped, so the output stays aligned with the input.
 
+    Args:
+        prices: 1-D price series or 2-D (time x instrument) price matrix.
 
-def calculate_log_returns(prices: list[float]) -> list[float]:
+    Returns:
+        Array of simple returns with one fewer row than ``prices``.
+    """
+    previous, current, valid = _price_pairs(prices)
+    returns = np.full_like(current, np.nan)
+    return np.divide(current - previous, previous, out=returns, where=valid)
+
+
+def calculate_log_returns(prices: ArrayLike) -> np.ndarray:
     """
     Calculate logarithmic returns from price series.
 
+    Periods touching a non-positive price are reported as NaN rather than
+    dropped, so the output stays aligned with the input.
+
     Args:
-        prices: List of historical prices.
+        prices: 1-D price series or 2-D (time x instrument) price matrix.
 
     Returns:
-        List of log returns.
+        Array of log returns with one fewer row than ``prices``.
     """
-    import math
+    previous, current, valid = _price_pairs(prices)
+    ratio = np.divide(current, previous, out=np.full_like(current, np.nan), where=valid)
+    return np.log(ratio, out=ratio, where=valid)
+
 
-    if len(prices) < 2:
-        return []
+def batch_full_analytics(
+    instruments: list[Instrument],
+    price_matrix: ArrayLike,
+    market_returns: Optional[ArrayLike] = None
+) -> dict[str, Any]:
+    """
+    Compute volatility, beta and max drawdown for a whole universe at once.
 
-    returns = []
-    for i in range(1, len(prices)):
-        if prices[i - 1] > 0 and prices[i] > 0:
-            ret = math.log(prices[i] / prices[i - 1])
-            returns.append(ret)
+    Returns are derived from the price matrix and all three metrics come out
+    of one fused vectorized pass, without building per-instrument decorators.
+    Instruments whose prices contain non-positive values get NaN metrics.
 
-    return returns
+    Args:
+        instruments: Instruments, one per price matrix column.
+        price_matrix: (time x instrument) price matrix.
+        market_returns: Market benchmark returns aligned with the return rows
+                        (one fewer than the price rows).
+
+    Returns:
+        Dictionary with "symbol" (list) and "volatility", "beta",
+        "max_drawdown" arrays aligned with ``instruments``.
+
+    Raises:
+        ValueError: If the matrix columns don't match the instruments.
+    """
+    prices = np.asarray(price_matrix, dtype=float)
+    if prices.ndim != 2 or prices.shape[1] != len(instruments):
+        raise ValueError(
+            f"Expected a (time x {len(instruments)}) price matrix, got shape {prices.shape}"
+        )
+
+    # Returns already mask non-positive prices; mask drawdown input the same
+    # way so those instruments come out NaN across all three metrics
+    returns = calculate_returns(prices)
+    drawdown_prices = np.where((prices > 0).all(axis=0), prices, np.nan)
+    moments, covariance, drawdown = fused_analytics_state(returns, market_returns, drawdown_prices)
+
+    if covariance is None:
+        beta = np.ones(len(instruments))
+    else:
+        beta = np.asarray(covariance.beta(), dtype=float)
+
+    return {
+        "symbol": [inst.symbol for inst in instruments],
+        "volatility": np.sqrt(np.asarray(moments.sample_variance())) * ANNUALIZATION_FACTOR,
+        "beta": beta,
+        "max_drawdown": np.asarray(drawdown.value(), dtype=float),
+    }
@@ -10,8 +10,12 @@ These functions demonstrate how to use the patterns you implement.
 """
 
 import csv
+import os
+import pickle
+from collections.abc import Mapping
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, Optional
 
 from .models import Instrument, MarketDataPoint
 from .patterns.creational import InstrumentFactory
@@ -45,6 +49,146 @@ def load_instruments_from_csv(filepath: str | Path) -> list[Instrument]:
     return instruments
 
 
+# Columns parsed as floats by the columnar loader (empty cells become 0.0)
+NUMERIC_INSTRUMENT_COLUMNS = ("price", "coupon", "expense_ratio")
+
+INSTRUMENT_CACHE_VERSION = 1
+
+
+def read_instrument_columns(filepath: str | Path) -> dict[str, list]:
+    """
+    Read an instrument CSV into columns instead of per-row dicts.
+
+    Args:
+        filepath: Path to CSV file with instrument data.
+
+    Returns:
+        Mapping of column name to list of values, with numeric columns
+        converted to float.
+    """
+    with open(filepath, "r", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        rows = list(reader)
+
+    # One C-level pass per column (much cheaper than zip(*rows) on large files)
+    columns = {name: list(map(itemgetter(j), rows)) for j, name in enumerate(header)}
+    for name in NUMERIC_INSTRUMENT_COLUMNS:
+        if name in columns:
+            columns[name] = [float(v) if v else 0.0 for v in columns[name]]
+    return columns
+
+
+def _source_key(filepath: str | Path) -> tuple[str, int, int]:
+    """Identify a source file by resolved path, mtime and size."""
+    stat = os.stat(filepath)
+    return str(Path(filepath).resolve()), stat.st_mtime_ns, stat.st_size
+
+
+def load_instrument_columns(filepath: str | Path,
+                            cache_path: Optional[str | Path] = None) -> dict[str, list]:
+    """
+    Read instrument columns, reusing a binary cache when it is still valid.
+
+    The cache stores the parsed columns together with the source file's
+    path, modification time and size; any change to the CSV triggers a
+    re-parse and rewrites the cache.
+
+    Args:
+        filepath: Path to CSV file with instrument data.
+        cache_path: Optional path of the binary (pickle) cache file.
+
+    Returns:
+        Mapping of column name to list of values.
+    """
+    source = _source_key(filepath)
+    if cache_path is not None and Path(cache_path).exists():
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if (cached.get("version") == INSTRUMENT_CACHE_VERSION
+                    and cached.get("source") == source):
+                return cached["columns"]
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            pass
+
+    columns = read_instrument_columns(filepath)
+    if cache_path is not None:
+        with open(cache_path, "wb") as f:
+            pickle.dump(
+                {"version": INSTRUMENT_CACHE_VERSION, "source": source, "columns": columns},
+                f, protocol=pickle.HIGHEST_PROTOCOL
+            )
+    return columns
+
+
+def load_instruments_columnar(filepath: str | Path,
+                              cache_path: Optional[str | Path] = None) -> list[Instrument]:
+    """
+    Load instruments in bulk: columnar parse, then per-type batch creation.
+
+    Unlike ``load_instruments_from_csv``, numeric columns are parsed to
+    floats.
+
+    Args:
+        filepath: Path to CSV file with instrument data.
+        cache_path: Optional binary cache of the parsed columns.
+
+    Returns:
+        List of Instrument instances in file order.
+    """
+    columns = load_instrument_columns(filepath, cache_path)
+    if not columns.get("symbol"):
+        return []
+    return InstrumentFactory.create_instruments(columns)
+
+
+class InstrumentTable(Mapping):
+    """
+    Read-only symbol -> Instrument mapping backed by columnar data.
+
+    The symbol index is built in one step; Instrument objects are only
+    created (and then memoized) when a symbol is first accessed, so a large
+    instrument master can be loaded without constructing every object.
+    """
+
+    def __init__(self, columns: dict[str, list]):
+        """
+        Initialize table from parsed columns.
+
+        Args:
+            columns: Mapping of column name to list of values.
+        """
+        self._columns = columns
+        symbols = columns.get("symbol", [])
+        self._index = dict(zip(symbols, range(len(symbols))))
+        self._objects: dict[str, Instrument] = {}
+
+    def __getitem__(self, symbol: str) -> Instrument:
+        instrument = self._objects.get(symbol)
+        if instrument is None:
+            row = self._index[symbol]
+            instrument = InstrumentFactory.create_instrument(
+                {name: values[row] for name, values in self._columns.items()}
+            )
+            self._objects[symbol] = instrument
+        return instrument
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._index
+
+    @property
+    def materialized(self) -> int:
+        """Number of Instrument objects created so far."""
+        return len(self._objects)
+
+
 def load_market_data_from_csv(filepath: str | Path) -> Iterator[MarketDataPoint]:
     """
     Load market data from CSV file.
@@ -152,19 +296,33 @@ class DataLoader:
 
     def __init__(self):
         """Initialize data loader."""
-        self._instruments: dict[str, Instrument] = {}
+        self._instruments: dict[str, Instrument] | InstrumentTable = {}
         self._adapters: dict[str, any] = {}
 
-    def load_instruments(self, filepath: str | Path) -> None:
+    def load_instruments(self, filepath: str | Path,
+                         cache_path: Optional[str | Path] = None,
+                         lazy: bool = False) -> None:
         """
         Load instruments from CSV and cache them.
 
+        Uses the bulk columnar loader and builds the symbol index in one
+        step.
+
         Args:
             filepath: Path to instruments CSV.
+            cache_path: Optional binary cache so restarts skip parsing.
+            lazy: Keep the columns as an InstrumentTable and create objects
+                  on first access (only when nothing is loaded yet).
         """
-        instruments = load_instruments_from_csv(filepath)
-        for inst in instruments:
-            self._instruments[inst.symbol] = inst
+        columns = load_instrument_columns(filepath, cache_path)
+        if lazy and not self._instruments:
+            self._instruments = InstrumentTable(columns)
+            return
+
+        if not isinstance(self._instruments, dict):
+            self._instruments = dict(self._instruments)
+        instruments = InstrumentFactory.create_instruments(columns) if columns.get("symbol") else []
+        self._instruments.update(zip((inst.symbol for inst in instruments), instruments))
 
     def get_instrument(self, symbol: str) -> Instrument | None:
         """
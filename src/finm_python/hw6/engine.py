@@ -11,12 +11,10 @@ from typing import Any, Optional
 from .models import MarketDataPoint
 from .patterns.behavioral import (
     Strategy,
-    MeanReversionStrategy,
-    BreakoutStrategy,
     SignalPublisher,
     Observer
 )
-from .patterns.creational import Config
+from .patterns.creational import Config, ConfigSnapshot, StrategyRegistry
 
 
 class StrategyEngine:
@@ -33,6 +31,8 @@ class StrategyEngine:
         self._active_strategy: Optional[Strategy] = None
         self._publisher = SignalPublisher()
         self._signal_history: list[dict] = []
+        self._config: Optional[Config] = None
+        self._config_default_strategy: Optional[str] = None
 
     def register_strategy(self, name: str, strategy: Strategy) -> None:
         """
@@ -58,6 +58,48 @@ class StrategyEngine:
             raise KeyError(f"Strategy '{name}' not registered")
         self._active_strategy = self._strategies[name]
 
+    def bind_config(self, config: Config) -> None:
+        """
+        Follow configuration changes without restarting the engine.
+
+        The engine applies the current snapshot immediately and then every
+        snapshot the config publishes (e.g. from a hot reload). The config
+        holds the subscription weakly: dropping the engine ends it.
+
+        Args:
+            config: Config instance to subscribe to.
+        """
+        self.unbind_config()
+        self._config = config
+        self._config_default_strategy = None
+        config.subscribe(self.on_config_change)
+        self.on_config_change(config.snapshot)
+
+    def unbind_config(self) -> None:
+        """Stop following configuration changes."""
+        if self._config is not None:
+            self._config.unsubscribe(self.on_config_change)
+            self._config = None
+
+    def on_config_change(self, snapshot: ConfigSnapshot) -> None:
+        """
+        Apply a new configuration snapshot.
+
+        Switches the active strategy when ``default_strategy`` changed
+        since the previous snapshot and names a registered strategy, so
+        unrelated config writes keep a strategy chosen with
+        set_active_strategy().
+
+        Args:
+            snapshot: Newly published configuration.
+        """
+        default_strategy = snapshot.get("default_strategy")
+        if default_strategy == self._config_default_strategy:
+            return
+        self._config_default_strategy = default_strategy
+        if default_strategy in self._strategies:
+            self._active_strategy = self._strategies[default_strategy]
+
     def get_active_strategy(self) -> Optional[Strategy]:
         """Get the currently active strategy."""
         return self._active_strategy
@@ -126,6 +168,9 @@ class StrategyEngine:
         """
         Create engine from configuration files.
 
+        The config file is only re-parsed if it changed since it was last
+        loaded, and the engine stays subscribed to later config changes.
+
         Args:
             config_path: Path to main config JSON.
             strategy_params_path: Path to strategy parameters JSON.
@@ -144,31 +189,13 @@ class StrategyEngine:
         # Create engine
         engine = cls()
 
-        # Register strategies with parameters
-        if "MeanReversionStrategy" in strategy_params:
-            params = strategy_params["MeanReversionStrategy"]
-            engine.register_strategy(
-                "MeanReversionStrategy",
-                MeanReversionStrategy(
-                    lookback_window=params.get("lookback_window", 20),
-                    threshold=params.get("threshold", 0.02)
-                )
-            )
-
-        if "BreakoutStrategy" in strategy_params:
-            params = strategy_params["BreakoutStrategy"]
-            engine.register_strategy(
-                "BreakoutStrategy",
-                BreakoutStrategy(
-                    lookback_window=params.get("lookback_window", 15),
-                    threshold=params.get("threshold", 0.03)
-                )
-            )
-
-        # Set default strategy from config
-        default_strategy = config.get("default_strategy")
-        if default_strategy and default_strategy in engine._strategies:
-            engine.set_active_strategy(default_strategy)
+        # Register every strategy the registry knows about
+        for name, params in strategy_params.items():
+            if StrategyRegistry.is_registered(name):
+                engine.register_strategy(name, create_strategy(name, params))
+
+        # Set default strategy from config and follow later reloads
+        engine.bind_config(config)
 
         return engine
 
@@ -177,6 +204,9 @@ def create_strategy(name: str, params: dict) -> Strategy:
     """
     Factory function for creating strategy instances.
 
+    Looks the name up in the StrategyRegistry, importing the defining
+    module on first use.
+
     Args:
         name: Strategy type name.
         params: Strategy parameters.
@@ -187,15 +217,4 @@ def create_strategy(name: str, params: dict) -> Strategy:
     Raises:
         ValueError: If strategy type unknown.
     """
-    if name == "MeanReversionStrategy":
-        return MeanReversionStrategy(
-            lookback_window=params.get("lookback_window", 20),
-            threshold=params.get("threshold", 0.02)
-        )
-    elif name == "BreakoutStrategy":
-        return BreakoutStrategy(
-            lookback_window=params.get("lookback_window", 15),
-            threshold=params.get("threshold", 0.03)
-        )
-    else:
-        raise ValueError(f"Unknown strategy type: {name}")
+    return StrategyRegistry.create(name, params)
@@ -0,0 +1,168 @@
+"""
+Array-backed portfolio representation.
+
+FlatPortfolio is a structure-of-arrays alternative to the Portfolio /
+PortfolioGroup composite tree. It lives in its own module so that the
+core models stay importable without NumPy.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from .models import Portfolio, PortfolioGroup, Position
+
+
+@dataclass(eq=False)
+class FlatPortfolio:
+    """
+    Array-backed portfolio equivalent to a Portfolio tree.
+
+    Positions are stored as parallel arrays in depth-first order, with each
+    group's direct positions ahead of its sub-groups. Every group's subtree
+    therefore occupies the contiguous slice ``[group_start, group_end)`` of
+    the position arrays, which turns aggregation into a prefix-sum lookup.
+    """
+    name: str
+    owner: str
+    symbols: list[str]
+    symbol_id: np.ndarray
+    quantity: np.ndarray
+    price: np.ndarray
+    parent: np.ndarray
+    group_names: list[str]
+    group_parent: np.ndarray
+    group_start: np.ndarray
+    group_end: np.ndarray
+    _symbol_lookup: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._symbol_lookup = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+    @classmethod
+    def from_portfolio(cls, portfolio: Portfolio) -> "FlatPortfolio":
+        """
+        Flatten a Portfolio tree with an iterative depth-first walk.
+
+        Args:
+            portfolio: Portfolio to flatten.
+
+        Returns:
+            Equivalent FlatPortfolio.
+        """
+        symbol_lookup: dict[str, int] = {}
+        symbol_id, quantity, price, parent = [], [], [], []
+        group_names, group_parent, group_start, group_end = [], [], [], []
+
+        # A None node is the exit marker that closes the group's slice
+        stack: list[tuple[Optional[PortfolioGroup], int]] = [(portfolio.root, -1)]
+        while stack:
+            group, parent_id = stack.pop()
+            if group is None:
+                group_end[parent_id] = len(quantity)
+                continue
+
+            gid = len(group_names)
+            group_names.append(group.name)
+            group_parent.append(parent_id)
+            group_start.append(len(quantity))
+            group_end.append(0)
+            stack.append((None, gid))
+
+            sub_groups = []
+            for component in group.components:
+                if isinstance(component, PortfolioGroup):
+                    sub_groups.append(component)
+                else:
+                    symbol_id.append(symbol_lookup.setdefault(component.symbol, len(symbol_lookup)))
+                    quantity.append(component.quantity)
+                    price.append(component.price)
+                    parent.append(gid)
+            stack.extend((sub, gid) for sub in reversed(sub_groups))
+
+        return cls(
+            name=portfolio.name,
+            owner=portfolio.owner,
+            symbols=list(symbol_lookup),
+            symbol_id=np.array(symbol_id, dtype=np.int32),
+            quantity=np.array(quantity, dtype=np.int64),
+            price=np.array(price, dtype=np.float64),
+            parent=np.array(parent, dtype=np.int32),
+            group_names=group_names,
+            group_parent=np.array(group_parent, dtype=np.int32),
+            group_start=np.array(group_start, dtype=np.int64),
+            group_end=np.array(group_end, dtype=np.int64)
+        )
+
+    def to_portfolio(self) -> Portfolio:
+        """
+        Rebuild the equivalent Portfolio tree.
+
+        Returns:
+            Portfolio whose groups list direct positions before sub-groups.
+        """
+        groups = [PortfolioGroup(name) for name in self.group_names]
+        for i in range(len(self.quantity)):
+            groups[self.parent[i]].add(Position(
+                self.symbols[self.symbol_id[i]], int(self.quantity[i]), float(self.price[i])
+            ))
+        # Pre-order numbering guarantees parents come before their children
+        for gid in range(1, len(groups)):
+            groups[self.group_parent[gid]].add(groups[gid])
+        return Portfolio(name=self.name, owner=self.owner, root=groups[0])
+
+    def position_values(self) -> np.ndarray:
+        """Return quantity * price for every position."""
+        return self.quantity * self.price
+
+    def get_value(self) -> float:
+        """Get total portfolio value."""
+        return float(self.quantity @ self.price)
+
+    def get_position_count(self) -> int:
+        """Get number of positions in portfolio."""
+        return len(self.quantity)
+
+    def group_values(self) -> np.ndarray:
+        """
+        Return the total (subtree) value of every group.
+
+        Computed as differences of one prefix sum over the position values.
+        """
+        cumulative = np.concatenate(([0.0], np.cumsum(self.position_values())))
+        return cumulative[self.group_end] - cumulative[self.group_start]
+
+    def direct_values(self) -> np.ndarray:
+        """Return the value of each group's direct positions (excluding sub-groups)."""
+        return np.bincount(self.parent, weights=self.position_values(),
+                           minlength=len(self.group_names))
+
+    def symbol_quantities(self) -> dict[str, int]:
+        """Return net quantity per symbol across the whole book."""
+        totals = np.bincount(self.symbol_id, weights=self.quantity, minlength=len(self.symbols))
+        return {symbol: int(total) for symbol, total in zip(self.symbols, totals)}
+
+    def apply_prices(self, price_map: dict[str, float]) -> int:
+        """
+        Update prices for all positions in the listed symbols.
+
+        Args:
+            price_map: Mapping of symbol to new price.
+
+        Returns:
+            Number of positions updated.
+        """
+        known = {self._symbol_lookup[s]: p for s, p in price_map.items() if s in self._symbol_lookup}
+        if not known:
+            return 0
+        new_prices = np.full(len(self.symbols), np.nan)
+        new_prices[list(known)] = list(known.values())
+        mapped = new_prices[self.symbol_id]
+        mask = ~np.isnan(mapped)
+        self.price[mask] = mapped[mask]
+        return int(mask.sum())
+
+    def __repr__(self) -> str:
+        return (f"FlatPortfolio(name={self.name}, owner={self.owner}, "
+                f"positions={self.get_position_count()}, groups={len(self.group_names)})")
@@ -9,7 +9,12 @@ in the pattern modules. Each demo function shows how the patterns should
 be used once completed.
 
 Usage:
-    python -m finm_python.hw6.main
+    python -m finm_python.hw6.main                 # run every demo
+    python -m finm_python.hw6.main factory command # run selected demos
+
+Modules with heavy dependencies (NumPy-backed analytics and adapters) are
+imported inside the demos that use them, so a CLI run only pays import
+cost for the demos it executes.
 
 Patterns demonstrated:
 - Factory: Creating instruments
@@ -23,20 +28,16 @@ Patterns demonstrated:
 - Command: Order execution with undo/redo
 """
 
+import argparse
 import json
 from pathlib import Path
 from datetime import datetime, timedelta
+from typing import Optional
 
-# Import all pattern implementations
+# Import lightweight pattern implementations (NumPy-backed ones are
+# imported lazily by the demos that need them)
 from .models import Stock, Bond, ETF, MarketDataPoint, Position, PortfolioGroup
 from .patterns.creational import InstrumentFactory, Config, PortfolioBuilder
-from .patterns.structural import (
-    VolatilityDecorator,
-    BetaDecorator,
-    DrawdownDecorator,
-    YahooFinanceAdapter,
-    BloombergXMLAdapter
-)
 from .patterns.behavioral import (
     MeanReversionStrategy,
     BreakoutStrategy,
@@ -47,8 +48,6 @@ from .patterns.behavioral import (
     CommandInvoker,
     Order
 )
-from .data_loader import load_instruments_from_csv
-from .analytics import calculate_returns
 
 
 def get_data_path() -> Path:
@@ -174,6 +173,9 @@ def demo_decorator_pattern():
     print("DECORATOR PATTERN: Instrument Analytics")
     print("=" * 60)
 
+    from .patterns.structural import VolatilityDecorator, BetaDecorator, DrawdownDecorator
+    from .analytics import calculate_returns
+
     # Create base instrument
     stock = Stock("AAPL", 172.35, "Technology", "Apple Inc.")
     print(f"Base instrument: {stock}")
@@ -210,6 +212,8 @@ def demo_adapter_pattern():
     print("ADAPTER PATTERN: External Data Integration")
     print("=" * 60)
 
+    from .patterns.structural import YahooFinanceAdapter
+
     # Yahoo Finance JSON format
     yahoo_data = {
         "ticker": "AAPL",
@@ -385,13 +389,36 @@ def demo_command_pattern():
     print(f"\nCommand history size: {len(invoker.get_history())}")
 
 
-def main():
+DEMOS = {
+    "factory": demo_factory_pattern,
+    "singleton": demo_singleton_pattern,
+    "builder": demo_builder_pattern,
+    "decorator": demo_decorator_pattern,
+    "adapter": demo_adapter_pattern,
+    "composite": demo_composite_pattern,
+    "strategy": demo_strategy_pattern,
+    "observer": demo_observer_pattern,
+    "command": demo_command_pattern,
+}
+
+
+def main(argv: Optional[list[str]] = None):
     """
-    Main entry point - run all pattern demonstrations.
+    Main entry point - run the selected pattern demonstrations.
 
-    NOTE: This will raise NotImplementedError until you implement
-    the TODO sections in each pattern module.
+    Args:
+        argv: Command-line arguments (defaults to sys.argv). Each argument
+              names a demo; with none, every demo runs.
     """
+    parser = argparse.ArgumentParser(description="HW6 design pattern demos")
+    parser.add_argument("demos", nargs="*", metavar="DEMO",
+                        help=f"Demos to run: {', '.join(DEMOS)} (default: all)")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.demos if name not in DEMOS]
+    if unknown:
+        parser.error(f"unknown demo(s): {', '.join(unknown)}")
+    selected = args.demos or list(DEMOS)
+
     print("=" * 60)
     print("HW6: Design Patterns in Financial Software Architecture")
     print("=" * 60)
@@ -400,15 +427,8 @@ def main():
 
     try:
         # All patterns are now implemented
-        demo_factory_pattern()
-        demo_singleton_pattern()
-        demo_builder_pattern()
-        demo_decorator_pattern()
-        demo_adapter_pattern()
-        demo_composite_pattern()
-        demo_strategy_pattern()
-        demo_observer_pattern()
-        demo_command_pattern()
+        for name in selected:
+            DEMOS[name]()
 
     except NotImplementedError as e:
         print(f"\n*** Implementation needed: {e} ***")
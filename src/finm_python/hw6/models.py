@@ -123,7 +123,14 @@ class ETF(Instrument):
 # ============================================================================
 
 class PortfolioComponent(ABC):
-    """Abstract component for Composite pattern."""
+    """
+    Abstract component for Composite pattern.
+
+    Every component knows its parent group so that a change at a leaf can
+    invalidate the cached aggregates of its ancestors only.
+    """
+
+    parent: Optional["PortfolioGroup"] = None
 
     @abstractmethod
     def get_value(self) -> float:
@@ -135,55 +142,130 @@ class PortfolioComponent(ABC):
         """Return list of position information."""
         pass
 
+    @abstractmethod
+    def get_position_count(self) -> int:
+        """Return the number of positions under this component."""
+        pass
+
     @abstractmethod
     def __repr__(self) -> str:
         pass
 
+    def _invalidate_value(self) -> None:
+        """Mark ancestor values dirty, stopping at the first already-dirty one."""
+        node = self.parent
+        while node is not None and not node._value_dirty:
+            node._value_dirty = True
+            node = node.parent
+
+    def _invalidate_structure(self) -> None:
+        """Drop cached counts and symbol indexes of all ancestors."""
+        self._invalidate_value()
+        node = self.parent
+        while node is not None and (node._position_count is not None
+                                    or node._symbol_index is not None):
+            node._position_count = None
+            node._symbol_index = None
+            node = node.parent
+
 
 class Position(PortfolioComponent):
-    """Leaf node: single position in the portfolio tree."""
+    """
+    Leaf node: single position in the portfolio tree.
+
+    Setting ``price`` or ``quantity`` invalidates the cached values of the
+    groups above this position.
+    """
 
     def __init__(self, symbol: str, quantity: int, price: float):
         self.symbol = symbol
-        self.quantity = quantity
-        self.price = price
+        self._quantity = quantity
+        self._price = price
+
+    @property
+    def quantity(self) -> int:
+        return self._quantity
+
+    @quantity.setter
+    def quantity(self, value: int) -> None:
+        if value != self._quantity:
+            self._quantity = value
+            self._invalidate_value()
+
+    @property
+    def price(self) -> float:
+        return self._price
+
+    @price.setter
+    def price(self, value: float) -> None:
+        if value != self._price:
+            self._price = value
+            self._invalidate_value()
 
     def get_value(self) -> float:
         """Return position value (quantity * price)."""
-        return self.quantity * self.price
+        return self._quantity * self._price
 
     def get_positions(self) -> list[dict]:
         """Return this position as a single-item list."""
         return [
             {
                 "symbol": self.symbol,
-                "quantity": self.quantity,
-                "price": self.price
+                "quantity": self._quantity,
+                "price": self._price
             }
         ]
 
+    def get_position_count(self) -> int:
+        """A leaf is a single position."""
+        return 1
+
     def __repr__(self) -> str:
         return f"Position({self.symbol}, qty={self.quantity}, price={self.price})"
 
 
 class PortfolioGroup(PortfolioComponent):
-    """Composite node: group of positions and/or sub-portfolios."""
+    """
+    Composite node: group of positions and/or sub-portfolios.
+
+    Caches its aggregate value and position count. Price/quantity changes
+    mark only the ancestors of the changed leaf dirty, so revaluing the
+    tree recomputes just the dirty path and reuses every clean subtree.
+    """
 
     def __init__(self, name: str):
         self.name = name
         self.components: list[PortfolioComponent] = []
+        self._value = 0.0
+        self._value_dirty = False
+        self._position_count: Optional[int] = 0
+        self._symbol_index: Optional[dict[str, list[Position]]] = {}
 
     def add(self, component: PortfolioComponent) -> None:
         """Add a child component."""
         self.components.append(component)
+        component.parent = self
+        self._value_dirty = True
+        self._position_count = None
+        self._symbol_index = None
+        self._invalidate_structure()
 
     def remove(self, component: PortfolioComponent) -> None:
         """Remove a child component."""
         self.components.remove(component)
+        if component.parent is self:
+            component.parent = None
+        self._value_dirty = True
+        self._position_count = None
+        self._symbol_index = None
+        self._invalidate_structure()
 
     def get_value(self) -> float:
-        """Recursively calculate total value of all components."""
-        return sum(c.get_value() for c in self.components)
+        """Return total value, recomputing only dirty subtrees."""
+        if self._value_dirty:
+            self._value = sum(c.get_value() for c in self.components)
+            self._value_dirty = False
+        return self._value
 
     def get_positions(self) -> list[dict]:
         """Recursively collect all positions from child components."""
@@ -192,6 +274,47 @@ class PortfolioGroup(PortfolioComponent):
             positions.extend(component.get_positions())
         return positions
 
+    def get_position_count(self) -> int:
+        """Return the cached number of positions in this subtree."""
+        if self._position_count is None:
+            self._position_count = sum(c.get_position_count() for c in self.components)
+        return self._position_count
+
+    def _get_symbol_index(self) -> dict[str, list[Position]]:
+        """Return the cached symbol -> positions index for this subtree."""
+        if self._symbol_index is None:
+            index: dict[str, list[Position]] = {}
+            for component in self.components:
+                if isinstance(component, PortfolioGroup):
+                    for symbol, positions in component._get_symbol_index().items():
+                        index.setdefault(symbol, []).extend(positions)
+                else:
+                    index.setdefault(component.symbol, []).append(component)
+            self._symbol_index = index
+        return self._symbol_index
+
+    def apply_prices(self, price_map: dict[str, float]) -> int:
+        """
+        Update prices for every position in this subtree in one pass.
+
+        Positions are found through the cached symbol index and only their
+        ancestors are marked dirty, so the cost scales with the number of
+        positions touched rather than the size of the tree.
+
+        Args:
+            price_map: Mapping of symbol to new price.
+
+        Returns:
+            Number of positions updated.
+        """
+        index = self._get_symbol_index()
+        updated = 0
+        for symbol, price in price_map.items():
+            for position in index.get(symbol, ()):
+                position.price = price
+                updated += 1
+        return updated
+
     def __repr__(self) -> str:
         return f"PortfolioGroup({self.name}, components={len(self.components)})"
 
@@ -218,5 +341,13 @@ class Portfolio:
         """Get all positions in portfolio."""
         return self.root.get_positions()
 
+    def get_position_count(self) -> int:
+        """Get number of positions in portfolio."""
+        return self.root.get_position_count()
+
+    def apply_prices(self, price_map: dict[str, float]) -> int:
+        """Apply new prices to all matching positions (see PortfolioGroup.apply_prices)."""
+        return self.root.apply_prices(price_map)
+
     def __repr__(self) -> str:
         return f"Portfolio(name={self.name}, owner={self.owner}, value={self.get_value():.2f})"
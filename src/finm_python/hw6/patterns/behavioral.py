@@ -7,10 +7,12 @@ Behavioral Design Patterns
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from ..models import MarketDataPoint
+from .creational import register_strategy
 
 
 # ============================================================================
@@ -43,6 +45,7 @@ class Strategy(ABC):
         pass
 
 
+@register_strategy("MeanReversionStrategy")
 class MeanReversionStrategy(Strategy):
     """
     Mean reversion trading strategy.
@@ -130,6 +133,7 @@ class MeanReversionStrategy(Strategy):
         self.symbol = None
 
 
+@register_strategy("BreakoutStrategy")
 class BreakoutStrategy(Strategy):
     """
     Breakout trading strategy.
@@ -396,6 +400,15 @@ class Command(ABC):
         """Undo the command."""
         pass
 
+    def touched_orders(self) -> Optional[list["Order"]]:
+        """
+        Orders whose state this command changes.
+
+        Used by the invoker's compact undo log. Returns None when the command
+        has effects beyond order state and must be kept whole.
+        """
+        return None
+
 
 class Order:
     """
@@ -484,6 +497,10 @@ class ExecuteOrderCommand(Command):
         # Return the order
         return self.order
 
+    def touched_orders(self) -> list[Order]:
+        """Only the wrapped order changes."""
+        return [self.order]
+
 
 class CancelOrderCommand(Command):
     """
@@ -536,18 +553,177 @@ class CancelOrderCommand(Command):
         # Return the order
         return self.order
 
+    def touched_orders(self) -> list[Order]:
+        """Only the wrapped order changes."""
+        return [self.order]
+
+
+class BatchCommand(Command):
+    """
+    Command that applies a group of commands atomically.
+
+    If any command fails, the ones already executed are undone in reverse
+    order before the error propagates.
+    """
+
+    def __init__(self, commands: Iterable[Command]):
+        """
+        Initialize batch with its commands.
+
+        Args:
+            commands: Commands to apply, in order.
+        """
+        self.commands = list(commands)
+
+    def execute(self) -> list[Any]:
+        """
+        Execute every command, rolling back on failure.
+
+        Returns:
+            List of individual command results.
+        """
+        results = []
+        executed = []
+        try:
+            for command in self.commands:
+                results.append(command.execute())
+                executed.append(command)
+        except Exception:
+            for command in reversed(executed):
+                command.undo()
+            raise
+        return results
+
+    def undo(self) -> list[Any]:
+        """
+        Undo every command in reverse order.
+
+        Returns:
+            List of individual undo results (in undo order).
+        """
+        return [command.undo() for command in reversed(self.commands)]
+
+    def touched_orders(self) -> Optional[list[Order]]:
+        """Union of the orders touched by each command, if all are known."""
+        orders = []
+        for command in self.commands:
+            touched = command.touched_orders()
+            if touched is None:
+                return None
+            orders.extend(touched)
+        return orders
+
+
+class OrderStateLog(Command):
+    """
+    Compact undo record of order state changes.
+
+    Holds only the before/after (status, executed_at) of orders whose state
+    actually changed, once per order, instead of the command objects, so
+    undoing or redoing it just restores the recorded state.
+    """
+
+    def __init__(self, orders: list[Order],
+                 before: list[tuple[str, Optional[datetime]]],
+                 after: list[tuple[str, Optional[datetime]]]):
+        """
+        Initialize log with state snapshots.
+
+        Args:
+            orders: Distinct orders whose state changed.
+            before: (status, executed_at) of each order before execution.
+            after: (status, executed_at) of each order after execution.
+        """
+        self.orders = orders
+        self.before = before
+        self.after = after
+
+    @classmethod
+    def from_snapshot(cls, orders: list[Order],
+                      before: list[tuple[str, Optional[datetime]]]) -> "OrderStateLog":
+        """
+        Build a log from a pre-execution snapshot of the touched orders.
+
+        Orders touched more than once keep their first (pre-execution)
+        state; orders whose state is unchanged are dropped.
+
+        Args:
+            orders: Orders touched, possibly with repeats.
+            before: snapshot(orders) taken before execution.
+        """
+        changed, prior, after = [], [], []
+        seen = set()
+        for order, state in zip(orders, before):
+            if id(order) in seen:
+                continue
+            seen.add(id(order))
+            current = (order.status, order.executed_at)
+            if current != state:
+                changed.append(order)
+                prior.append(state)
+                after.append(current)
+        return cls(changed, prior, after)
+
+    @staticmethod
+    def snapshot(orders: list[Order]) -> list[tuple[str, Optional[datetime]]]:
+        """Capture (status, executed_at) of each order."""
+        return [(order.status, order.executed_at) for order in orders]
+
+    @staticmethod
+    def _restore(orders: Iterable[Order],
+                 states: Iterable[tuple[str, Optional[datetime]]]) -> None:
+        for order, (status, executed_at) in zip(orders, states):
+            order.status = status
+            order.executed_at = executed_at
+
+    def execute(self) -> list[Order]:
+        """
+        Reapply the recorded state changes (redo).
+
+        Returns:
+            The touched orders.
+        """
+        self._restore(self.orders, self.after)
+        print(f"Redoing state change of {len(self.orders)} order(s)")
+        return self.orders
+
+    def undo(self) -> list[Order]:
+        """
+        Restore the recorded prior state.
+
+        Returns:
+            The touched orders.
+        """
+        self._restore(self.orders, self.before)
+        print(f"Undoing state change of {len(self.orders)} order(s)")
+        return self.orders
+
+    def touched_orders(self) -> list[Order]:
+        """Orders covered by this log."""
+        return self.orders
+
 
 class CommandInvoker:
     """
     Invoker that manages command execution history.
 
-    Supports undo and redo operations.
+    Supports undo and redo operations, atomic batches, a bounded history
+    depth and an optional compact undo log that stores order state deltas
+    instead of command objects.
     """
 
-    def __init__(self):
-        """Initialize empty command history."""
-        self._history: list[Command] = []
-        self._redo_stack: list[Command] = []
+    def __init__(self, max_history: Optional[int] = None, compact: bool = False):
+        """
+        Initialize empty command history.
+
+        Args:
+            max_history: Maximum undo depth (oldest entries are dropped).
+                         None keeps an unbounded history.
+            compact: Record order-only commands as OrderStateLog deltas.
+        """
+        self.compact = compact
+        self._history: deque[Command] = deque(maxlen=max_history)
+        self._redo_stack: deque[Command] = deque(maxlen=max_history)
 
     def execute(self, command: Command) -> Any:
         """
@@ -559,10 +735,15 @@ class CommandInvoker:
         Returns:
             Result of command execution.
         """
+        orders = command.touched_orders() if self.compact else None
+        before = OrderStateLog.snapshot(orders) if orders is not None else None
+
         # Call command.execute()
         result = command.execute()
 
-        # Append command to history
+        # Append command (or its compact delta) to history
+        if orders is not None:
+            command = OrderStateLog.from_snapshot(orders, before)
         self._history.append(command)
 
         # Clear redo stack (new command invalidates redo)
@@ -571,6 +752,20 @@ class CommandInvoker:
         # Return result
         return result
 
+    def execute_batch(self, commands: Iterable[Command]) -> list[Any]:
+        """
+        Execute a group of commands atomically as one history entry.
+
+        Undo and redo then treat the whole batch as a single operation.
+
+        Args:
+            commands: Commands to execute, in order.
+
+        Returns:
+            List of individual command results.
+        """
+        return self.execute(BatchCommand(commands))
+
     def undo(self) -> Optional[Any]:
         """
         Undo the last command.
@@ -621,7 +816,7 @@ class CommandInvoker:
 
     def get_history(self) -> list[Command]:
         """Get command history."""
-        return self._history.copy()
+        return list(self._history)
 
     def clear_history(self) -> None:
         """Clear command history and redo stack."""
@@ -1,20 +1,30 @@
 """
 Creational Design Patterns
 
-- Factory: Create instrument instances from raw data
-- Singleton: Centralized configuration management
+- Factory: Create instrument instances from raw data; strategy registry
+- Singleton: Centralized configuration management (hot-reloadable snapshots)
 - Builder: Construct complex portfolio structures
 """
 
+import importlib
+import inspect
 import json
+import os
+import threading
+import timeit
+import weakref
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from ..models import (
     Instrument, Stock, Bond, ETF,
     Portfolio, PortfolioGroup, Position
 )
 
+if TYPE_CHECKING:
+    from ..flat_portfolio import FlatPortfolio
+    from .behavioral import Strategy
+
 
 # ============================================================================
 # Factory Pattern
@@ -78,21 +88,281 @@ class InstrumentFactory:
         else:
             raise ValueError(f"Unknown instrument type: {instrument_type}")
 
+    @staticmethod
+    def create_instruments(columns: dict[str, list]) -> list[Instrument]:
+        """
+        Create many instruments from columnar data in per-type batches.
+
+        Rows are grouped by instrument type once, then each group is
+        constructed in a single loop over the column lists, avoiding a
+        dict and a type dispatch per row.
+
+        Args:
+            columns: Mapping of column name to equal-length lists. Must
+                     include 'symbol', 'type', and 'price'; optional
+                     columns fall back to the same defaults as
+                     ``create_instrument``.
+
+        Returns:
+            Instruments in the same order as the input rows.
+
+        Raises:
+            ValueError: If any instrument type is unknown.
+        """
+        symbols = columns["symbol"]
+        prices = columns["price"]
+        n = len(symbols)
+
+        groups: dict[str, list[int]] = {}
+        for i, instrument_type in enumerate(columns["type"]):
+            groups.setdefault(instrument_type.lower(), []).append(i)
+        unknown = set(groups) - {"stock", "bond", "etf"}
+        if unknown:
+            raise ValueError(f"Unknown instrument type: {sorted(unknown)[0]}")
+
+        def column(name: str, default: Any) -> list:
+            values = columns.get(name)
+            return values if values is not None else [default] * n
+
+        sectors = column("sector", "")
+        issuers = column("issuer", "")
+        instruments: list[Optional[Instrument]] = [None] * n
+
+        for i in groups.get("stock", ()):
+            instruments[i] = Stock(symbols[i], prices[i], sectors[i], issuers[i])
+
+        if "bond" in groups:
+            maturities = column("maturity", "")
+            coupons = column("coupon", 0.0)
+            for i in groups["bond"]:
+                instruments[i] = Bond(symbols[i], prices[i], issuers[i], maturities[i], coupons[i])
+
+        if "etf" in groups:
+            expense_ratios = column("expense_ratio", 0.0)
+            for i in groups["etf"]:
+                instruments[i] = ETF(symbols[i], prices[i], sectors[i], issuers[i], expense_ratios[i])
+
+        return instruments
+
+
+class StrategyRegistry:
+    """
+    Factory registry mapping strategy names to Strategy classes.
+
+    Strategies register themselves with the ``register_strategy`` decorator.
+    Modules are only imported when one of their strategies is first
+    requested: built-ins are listed in ``_lazy_modules`` and third-party
+    packages can expose strategies through the
+    ``finm_python.hw6.strategies`` entry point group.
+
+    Usage:
+        @register_strategy("MyStrategy")
+        class MyStrategy(Strategy):
+            ...
+
+        strategy = StrategyRegistry.create("MyStrategy", {"window": 10})
+    """
+
+    ENTRY_POINT_GROUP = "finm_python.hw6.strategies"
+
+    _strategies: dict[str, type] = {}
+    _lazy_modules: dict[str, str] = {
+        "MeanReversionStrategy": f"{__package__}.behavioral",
+        "BreakoutStrategy": f"{__package__}.behavioral",
+    }
+
+    @classmethod
+    def register(cls, name: Optional[str] = None) -> Callable[[type], type]:
+        """
+        Class decorator registering a strategy under ``name``.
+
+        Args:
+            name: Registry name (defaults to the class name).
+
+        Returns:
+            Decorator that returns the class unchanged.
+        """
+        def decorator(strategy_cls: type) -> type:
+            cls._strategies[name or strategy_cls.__name__] = strategy_cls
+            return strategy_cls
+        return decorator
+
+    @classmethod
+    def register_lazy(cls, name: str, module: str) -> None:
+        """
+        Declare the module that registers ``name`` without importing it.
+
+        Args:
+            name: Strategy name.
+            module: Absolute module path imported on first use.
+        """
+        cls._lazy_modules[name] = module
+
+    @classmethod
+    def get(cls, name: str) -> type:
+        """
+        Resolve a strategy class, importing its module on first use.
+
+        Args:
+            name: Strategy name.
+
+        Returns:
+            Strategy class.
+
+        Raises:
+            ValueError: If no strategy is registered under ``name``.
+        """
+        strategy_cls = cls._strategies.get(name)
+        if strategy_cls is not None:
+            return strategy_cls
+
+        if name in cls._lazy_modules:
+            importlib.import_module(cls._lazy_modules[name])
+        else:
+            from importlib.metadata import entry_points
+            for entry_point in entry_points(group=cls.ENTRY_POINT_GROUP, name=name):
+                cls._strategies.setdefault(name, entry_point.load())
+
+        if name not in cls._strategies:
+            raise ValueError(f"Unknown strategy type: {name}")
+        return cls._strategies[name]
+
+    @classmethod
+    def is_registered(cls, name: str) -> bool:
+        """Check whether ``name`` resolves to a strategy."""
+        try:
+            cls.get(name)
+        except ValueError:
+            return False
+        return True
+
+    @classmethod
+    def create(cls, name: str, params: Optional[dict] = None) -> "Strategy":
+        """
+        Instantiate a registered strategy.
+
+        Args:
+            name: Strategy name.
+            params: Keyword arguments for the strategy constructor. Keys the
+                    constructor does not accept are ignored, so one params
+                    block can carry settings for other consumers.
+
+        Returns:
+            Strategy instance.
+
+        Raises:
+            ValueError: If no strategy is registered under ``name``.
+        """
+        strategy_cls = cls.get(name)
+        params = params or {}
+        accepted = inspect.signature(strategy_cls).parameters
+        if not any(p.kind is inspect.Parameter.VAR_KEYWORD for p in accepted.values()):
+            params = {key: value for key, value in params.items() if key in accepted}
+        return strategy_cls(**params)
+
+    @classmethod
+    def available(cls) -> list[str]:
+        """List known strategy names without importing their modules."""
+        return sorted(set(cls._strategies) | set(cls._lazy_modules))
+
+
+register_strategy = StrategyRegistry.register
+
 
 # ============================================================================
 # Singleton Pattern
 # ============================================================================
 
+class ConfigSnapshot:
+    """
+    Immutable, attribute-access view of a loaded configuration.
+
+    Values are compiled once at load time: nested objects become nested
+    snapshots and lists become tuples. They live in a private mapping, so
+    a key such as "get" cannot shadow a method; attribute access falls
+    back to it. Since a snapshot never changes it can be shared across
+    threads without locking.
+
+    Usage:
+        snapshot = Config.get_instance().snapshot
+        level = snapshot.log_level
+    """
+
+    def __init__(self, data: dict):
+        """
+        Compile a configuration dictionary.
+
+        Args:
+            data: Parsed configuration (e.g. from JSON).
+        """
+        values = {key: self._compile(value) for key, value in data.items()}
+        object.__setattr__(self, "_values", values)
+
+    @staticmethod
+    def _compile(value: Any) -> Any:
+        if isinstance(value, dict):
+            return ConfigSnapshot(value)
+        if isinstance(value, list):
+            return tuple(ConfigSnapshot._compile(v) for v in value)
+        return value
+
+    @staticmethod
+    def _thaw(value: Any) -> Any:
+        if isinstance(value, ConfigSnapshot):
+            return value.to_dict()
+        if isinstance(value, tuple):
+            return [ConfigSnapshot._thaw(v) for v in value]
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal lookup fails, i.e. never for methods
+        if name == "_values":
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(f"No configuration key '{name}'") from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ConfigSnapshot is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("ConfigSnapshot is immutable")
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._values
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value by key (for keys that aren't valid identifiers)."""
+        return self._values.get(key, default)
+
+    def to_dict(self) -> dict:
+        """Return a mutable deep copy as plain dicts and lists."""
+        return {key: self._thaw(value) for key, value in self._values.items()}
+
+    def __repr__(self) -> str:
+        return f"ConfigSnapshot({self.to_dict()})"
+
+
 class Config:
     """
     Singleton configuration manager.
 
-    Ensures all modules access the same configuration instance.
+    Ensures all modules access the same configuration instance. The data
+    lives in an immutable ConfigSnapshot; loads and writes build a new
+    snapshot and swap the reference, so readers never take a lock.
 
     Usage:
         config = Config.get_instance()
         config.load("config.json")
         log_level = config.get("log_level")
+        log_level = config.snapshot.log_level   # hot-path access
+
+        config.subscribe(lambda snap: print("reloaded", snap))
+        watcher = config.watch("config.json")   # hot reload on file change
     """
 
     _instance: Optional["Config"] = None
@@ -109,7 +379,10 @@ class Config:
         """Initialize configuration data (only once)."""
         # Use Config._initialized flag to track this
         if not Config._initialized:
-            self._data: dict = {}
+            self._snapshot = ConfigSnapshot({})
+            self._source: Optional[tuple[str, int, int]] = None
+            self._subscribers: tuple[Callable[[ConfigSnapshot], None], ...] = ()
+            self._write_lock = threading.Lock()
             Config._initialized = True
 
     @classmethod
@@ -117,15 +390,37 @@ class Config:
         """Get the singleton instance."""
         return cls()
 
-    def load(self, filepath: str | Path) -> None:
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """Current immutable configuration snapshot."""
+        return self._snapshot
+
+    def load(self, filepath: str | Path, force: bool = False) -> bool:
         """
         Load configuration from JSON file.
 
+        The file is skipped when it is the same file, unchanged since the
+        last load (same path, modification time and size), and no set()
+        has changed the configuration since.
+
         Args:
             filepath: Path to JSON configuration file.
+            force: Reload even if the file looks unchanged.
+
+        Returns:
+            True if a new snapshot was published.
         """
-        with open(filepath) as json_file:
-            self._data = json.load(json_file)
+        stat = os.stat(filepath)
+        source = (str(Path(filepath).resolve()), stat.st_mtime_ns, stat.st_size)
+        with self._write_lock:
+            if not force and source == self._source:
+                return False
+            with open(filepath) as json_file:
+                snapshot = ConfigSnapshot(json.load(json_file))
+            self._source = source
+            self._snapshot = snapshot
+        self._notify(snapshot)
+        return True
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -138,21 +433,98 @@ class Config:
         Returns:
             Configuration value or default.
         """
-        return self._data.get(key, default)
+        return self._snapshot.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """
         Set configuration value.
 
+        Publishes a new snapshot; existing snapshot references are unchanged.
+        The next load() re-reads its file even if the file is unchanged.
+
         Args:
             key: Configuration key.
             value: Value to set.
         """
-        self._data[key] = value
+        with self._write_lock:
+            data = self._snapshot.to_dict()
+            data[key] = value
+            snapshot = ConfigSnapshot(data)
+            self._snapshot = snapshot
+            # The snapshot no longer matches the last loaded file
+            self._source = None
+        self._notify(snapshot)
 
     def get_all(self) -> dict:
         """Get all configuration data."""
-        return self._data.copy()
+        return self._snapshot.to_dict()
+
+    @staticmethod
+    def _ref(callback: Callable[[ConfigSnapshot], None]) -> Any:
+        return weakref.WeakMethod(callback) if inspect.ismethod(callback) else callback
+
+    @property
+    def subscribers(self) -> tuple[Callable[[ConfigSnapshot], None], ...]:
+        """Live subscribed callbacks (bound methods of collected objects drop out)."""
+        callbacks = (ref() if isinstance(ref, weakref.WeakMethod) else ref for ref in self._subscribers)
+        return tuple(c for c in callbacks if c is not None)
+
+    def subscribe(self, callback: Callable[[ConfigSnapshot], None]) -> None:
+        """
+        Register a callback invoked with each newly published snapshot.
+
+        Bound methods are held weakly, so subscribing does not keep their
+        object alive (an engine that is dropped stops being notified).
+        Plain functions and lambdas are held strongly. A callback that
+        raises does not stop the others; load() and set() re-raise its
+        error once all of them have run.
+
+        Args:
+            callback: Function taking the new ConfigSnapshot.
+        """
+        with self._write_lock:
+            callbacks = self.subscribers
+            if callback not in callbacks:
+                # Rebuilt from live callbacks only, which also prunes dead refs
+                self._subscribers = tuple(map(self._ref, callbacks + (callback,)))
+
+    def unsubscribe(self, callback: Callable[[ConfigSnapshot], None]) -> None:
+        """
+        Remove a previously registered callback.
+
+        Args:
+            callback: Callback to remove.
+        """
+        with self._write_lock:
+            self._subscribers = tuple(self._ref(c) for c in self.subscribers if c != callback)
+
+    def watch(self, filepath: str | Path, interval: float = 1.0) -> "ConfigWatcher":
+        """
+        Start a background thread that reloads the file when it changes.
+
+        Args:
+            filepath: Path to JSON configuration file.
+            interval: Polling interval in seconds.
+
+        Returns:
+            The started ConfigWatcher (call ``stop()`` to end it).
+        """
+        watcher = ConfigWatcher(self, filepath, interval)
+        watcher.start()
+        return watcher
+
+    def _notify(self, snapshot: ConfigSnapshot) -> None:
+        # A failing subscriber must not starve the others; the first error
+        # is re-raised once every callback has run
+        error = None
+        for callback in self.subscribers:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
 
     @classmethod
     def reset(cls) -> None:
@@ -161,6 +533,47 @@ class Config:
         cls._initialized = False
 
 
+class ConfigWatcher(threading.Thread):
+    """
+    Daemon thread that polls a config file and hot-reloads it on change.
+
+    A file that fails to parse is ignored and the previous snapshot stays
+    active. That error, or one raised by a subscriber while handling a
+    reload, is kept in ``last_error`` until the next successful reload;
+    the watcher keeps polling either way.
+    """
+
+    def __init__(self, config: Config, filepath: str | Path, interval: float = 1.0):
+        """
+        Initialize watcher.
+
+        Args:
+            config: Config instance to reload.
+            filepath: Path to JSON configuration file.
+            interval: Polling interval in seconds.
+        """
+        super().__init__(name="ConfigWatcher", daemon=True)
+        self.config = config
+        self.filepath = filepath
+        self.interval = interval
+        self.last_error: Optional[Exception] = None
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                if self.config.load(self.filepath):
+                    self.last_error = None
+            except Exception as e:
+                self.last_error = e
+            self._stop_event.wait(self.interval)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling and wait for the thread to exit."""
+        self._stop_event.set()
+        self.join(timeout)
+
+
 # ============================================================================
 # Builder Pattern
 # ============================================================================
@@ -252,6 +665,17 @@ class PortfolioBuilder:
             root = self.root
         )
 
+    def build_flat(self) -> "FlatPortfolio":
+        """
+        Construct the portfolio as an array-backed FlatPortfolio.
+
+        Returns:
+            FlatPortfolio equivalent to ``build()``.
+        """
+        from ..flat_portfolio import FlatPortfolio
+
+        return FlatPortfolio.from_portfolio(self.build())
+
     @staticmethod
     def from_dict(data: dict) -> "PortfolioBuilder":
         """
@@ -281,4 +705,89 @@ class PortfolioBuilder:
             name = sub_data.get("name", "Portfolio")
             builder.add_subportfolio(name, sub_builder)
 
-        return builder
\ No newline at end of file
+        return builder
+
+    @staticmethod
+    def generate(n_positions: int, fanout: int = 10, n_symbols: int = 500,
+                 name: str = "Generated") -> "PortfolioBuilder":
+        """
+        Create a balanced synthetic book, mainly for benchmarks.
+
+        Args:
+            n_positions: Total number of positions.
+            fanout: Maximum children per group.
+            n_symbols: Number of distinct symbols to cycle through.
+            name: Name of the root portfolio.
+
+        Returns:
+            Configured PortfolioBuilder.
+        """
+        builder = PortfolioBuilder(name)
+        if n_positions <= fanout:
+            for i in range(n_positions):
+                builder.add_position(f"SYM{i % n_symbols}", 10 + i % 90, 50.0 + i % 200)
+            return builder
+
+        chunk = -(-n_positions // fanout)
+        for k, start in enumerate(range(0, n_positions, chunk)):
+            size = min(chunk, n_positions - start)
+            sub_name = f"{name}.{k}"
+            builder.add_subportfolio(
+                sub_name, PortfolioBuilder.generate(size, fanout, n_symbols, sub_name)
+            )
+        return builder
+
+
+def benchmark_flat_portfolio(n_positions: int = 100_000, fanout: int = 10,
+                             repeats: int = 5) -> dict[str, float]:
+    """
+    Compare full-book revaluation of the composite tree and the flat book.
+
+    Each run reprices every symbol, then computes the total value and the
+    value of every group.
+
+    Args:
+        n_positions: Number of positions in the generated book.
+        fanout: Maximum children per group.
+        repeats: Number of timed runs (best is reported).
+
+    Returns:
+        Dictionary with best times in seconds and the speedup.
+    """
+    from ..flat_portfolio import FlatPortfolio
+
+    builder = PortfolioBuilder.generate(n_positions, fanout)
+    tree = builder.build()
+    flat = FlatPortfolio.from_portfolio(tree)
+
+    groups = []
+    stack = [tree.root]
+    while stack:
+        group = stack.pop()
+        groups.append(group)
+        stack.extend(c for c in group.components if isinstance(c, PortfolioGroup))
+
+    bump = iter(range(1, 10 ** 9))
+
+    def revalue_tree():
+        step = next(bump)
+        tree.apply_prices({s: 50.0 + step for s in flat.symbols})
+        tree.get_value()
+        return [g.get_value() for g in groups]
+
+    def revalue_flat():
+        step = next(bump)
+        flat.apply_prices({s: 50.0 + step for s in flat.symbols})
+        flat.get_value()
+        return flat.group_values()
+
+    tree_time = min(timeit.repeat(revalue_tree, number=1, repeat=repeats))
+    flat_time = min(timeit.repeat(revalue_flat, number=1, repeat=repeats))
+
+    return {
+        "n_positions": n_positions,
+        "n_groups": len(groups),
+        "tree_seconds": tree_time,
+        "flat_seconds": flat_time,
+        "speedup": tree_time / flat_time if flat_time > 0 else float("inf")
+    }
@@ -12,11 +12,186 @@ from abc import abstractmethod, ABC
 from datetime import datetime
 from pathlib import Path
 from sys import flags
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 from ..models import Instrument, MarketDataPoint
 
 
+# ============================================================================
+# Running Statistics (state behind the analytics decorators)
+# ============================================================================
+
+ANNUALIZATION_FACTOR = 252 ** 0.5
+
+
+def _as_array(values: Optional[ArrayLike]) -> np.ndarray:
+    """Convert an optional series to a float array (empty when None)."""
+    if values is None:
+        return np.empty(0)
+    return np.asarray(values, dtype=float)
+
+
+class RunningMoments:
+    """
+    Welford accumulator for the mean and variance of a return series.
+
+    ``mean`` and ``m2`` are scalars for a single series or arrays with one
+    entry per instrument when built from a (time x instrument) matrix.
+    """
+
+    def __init__(self, count: int = 0, mean: Any = 0.0, m2: Any = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def update(self, value: float) -> None:
+        """Fold one observation into the state in O(1)."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def sample_variance(self) -> Any:
+        """Return the sample variance (zero with fewer than two observations)."""
+        if self.count < 2:
+            return np.zeros_like(np.asarray(self.m2, dtype=float))[()]
+        return self.m2 / (self.count - 1)
+
+
+class RunningCovariance:
+    """
+    Welford-style accumulator for the co-moment of instrument vs market returns.
+
+    Tracks just enough state to produce beta (cov / market variance) and to
+    absorb a new (instrument, market) return pair in O(1).
+    """
+
+    def __init__(self, count: int = 0, mean_x: Any = 0.0, mean_y: Any = 0.0,
+                 c_xy: Any = 0.0, m2_y: Any = 0.0):
+        self.count = count
+        self.mean_x = mean_x
+        self.mean_y = mean_y
+        self.c_xy = c_xy
+        self.m2_y = m2_y
+
+    def update(self, x: float, y: float) -> None:
+        """Fold one (instrument, market) return pair into the state."""
+        self.count += 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / self.count
+        self.mean_y += dy / self.count
+        self.c_xy += dx * (y - self.mean_y)
+        self.m2_y += dy * (y - self.mean_y)
+
+    def beta(self) -> Any:
+        """Return beta, falling back to 1.0 when the market variance is zero."""
+        c_xy = np.asarray(self.c_xy, dtype=float)
+        m2_y = np.asarray(self.m2_y, dtype=float)
+        if self.count < 2:
+            return np.ones_like(c_xy)[()]
+        safe_m2_y = np.where(m2_y == 0, 1.0, m2_y)
+        return np.where(m2_y == 0, 1.0, c_xy / safe_m2_y)[()]
+
+
+class RunningDrawdown:
+    """
+    Running-peak accumulator for maximum drawdown.
+    """
+
+    def __init__(self, count: int = 0, peak: Any = 0.0, max_drawdown: Any = 0.0):
+        self.count = count
+        self.peak = peak
+        self.max_drawdown = max_drawdown
+
+    @classmethod
+    def from_array(cls, prices: ArrayLike) -> "RunningDrawdown":
+        """
+        Build state from a full price series in one vectorized pass.
+
+        Args:
+            prices: 1-D series or 2-D (time x instrument) matrix.
+        """
+        prices = np.asarray(prices, dtype=float)
+        count = prices.shape[0]
+        if count == 0:
+            zeros = np.zeros(prices.shape[1:])
+            return cls(0, zeros[()], zeros.copy()[()])
+
+        running_peak = np.maximum.accumulate(prices, axis=0)
+        drawdowns = (prices - running_peak) / running_peak
+        max_drawdown = np.minimum(drawdowns.min(axis=0), 0.0)
+        return cls(count, running_peak[-1][()], max_drawdown[()])
+
+    def update(self, price: float) -> None:
+        """Fold one price into the state in O(1)."""
+        self.peak = price if self.count == 0 else max(self.peak, price)
+        self.count += 1
+        self.max_drawdown = min(self.max_drawdown, (price - self.peak) / self.peak)
+
+    def value(self) -> Any:
+        """Return the maximum drawdown (zero with fewer than two prices)."""
+        if self.count < 2:
+            return np.zeros_like(np.asarray(self.max_drawdown, dtype=float))[()]
+        return self.max_drawdown
+
+
+def fused_analytics_state(
+    returns: ArrayLike,
+    market_returns: Optional[ArrayLike] = None,
+    prices: Optional[ArrayLike] = None
+) -> tuple[RunningMoments, Optional[RunningCovariance], RunningDrawdown]:
+    """
+    Build volatility, beta and drawdown state in a single pass over the data.
+
+    The demeaned return series is computed once and shared by the variance
+    and covariance reductions. Inputs may be 1-D series or 2-D
+    (time x instrument) matrices; ``market_returns`` is always 1-D.
+
+    Args:
+        returns: Instrument returns.
+        market_returns: Market benchmark returns aligned with ``returns``.
+        prices: Price history for drawdown.
+
+    Returns:
+        Tuple of (moments, covariance, drawdown). Covariance is None when the
+        market series is missing or not aligned with the returns.
+    """
+    returns = _as_array(returns)
+    market_returns = _as_array(market_returns)
+    count = returns.shape[0]
+
+    if count == 0:
+        mean = np.zeros(returns.shape[1:])[()]
+        deviations = returns
+    else:
+        mean = returns.mean(axis=0)[()]
+        deviations = returns - mean
+    m2 = np.einsum("i...,i...->...", deviations, deviations)[()]
+    moments = RunningMoments(count, mean, m2)
+
+    covariance = None
+    if market_returns.shape == (count,):
+        mean_y = market_returns.mean() if count else 0.0
+        market_deviations = market_returns - mean_y
+        covariance = RunningCovariance(
+            count=count,
+            mean_x=np.copy(mean)[()],
+            mean_y=mean_y,
+            c_xy=(market_deviations @ deviations)[()],
+            m2_y=market_deviations @ market_deviations
+        )
+
+    if prices is None:
+        prices = np.empty((0,) + returns.shape[1:])
+    drawdown = RunningDrawdown.from_array(prices)
+
+    return moments, covariance, drawdown
+
+
 # ============================================================================
 # Decorator Pattern
 # ============================================================================
@@ -26,7 +201,8 @@ class InstrumentDecorator(Instrument):
     Base decorator for adding functionality to instruments.
 
     Wraps an instrument and delegates base operations while allowing
-    extension of behavior.
+    extension of behavior. Metric values are cached against a data version
+    counter that subclasses bump whenever new observations arrive.
     """
 
     def __init__(self, instrument: Instrument):
@@ -37,6 +213,8 @@ class InstrumentDecorator(Instrument):
             instrument: The instrument to decorate.
         """
         self._instrument = instrument
+        self._version = 0
+        self._metric_cache: dict[str, tuple[int, float]] = {}
         # Delegate basic properties
         super().__init__(instrument.symbol, instrument.price)
 
@@ -48,12 +226,22 @@ class InstrumentDecorator(Instrument):
         """Get metrics from a wrapped instrument (to be extended by subclasses)."""
         return self._instrument.get_metrics()
 
+    def _cached(self, name: str, compute: Callable[[], float]) -> float:
+        """Return a cached metric, recomputing only if the data version changed."""
+        entry = self._metric_cache.get(name)
+        if entry is not None and entry[0] == self._version:
+            return entry[1]
+        value = float(compute())
+        self._metric_cache[name] = (self._version, value)
+        return value
+
 
 class VolatilityDecorator(InstrumentDecorator):
     """
     Decorator that adds volatility calculation to an instrument.
 
-    Computes annualized volatility based on historical returns.
+    Computes annualized volatility based on historical returns. New returns
+    can be appended with ``add_return`` without rescanning the history.
     """
 
     def __init__(self, instrument: Instrument, historical_returns: Optional[list[float]] = None):
@@ -65,7 +253,17 @@ class VolatilityDecorator(InstrumentDecorator):
             historical_returns: Optional list of historical returns for calculation.
         """
         super().__init__(instrument)
-        self._historical_returns = historical_returns or []
+        self._moments, _, _ = fused_analytics_state(historical_returns)
+
+    def add_return(self, ret: float) -> None:
+        """
+        Append a return and update the running variance in O(1).
+
+        Args:
+            ret: New periodic return.
+        """
+        self._moments.update(ret)
+        self._version += 1
 
     def calculate_volatility(self) -> float:
         """
@@ -74,15 +272,10 @@ class VolatilityDecorator(InstrumentDecorator):
         Returns:
             Annualized volatility (assuming 252 trading days).
         """
-        rets = self._historical_returns
-        n = len(rets)
-        if n < 2:
-            return 0.0
-        mean_ret = sum(rets) / n
-        sample_var = sum([(ret - mean_ret) ** 2 for ret in rets]) / (n - 1)
-        daily_vol = sample_var ** 0.5
-        annualized_vol = daily_vol * 252 ** 0.5
-        return annualized_vol
+        return self._cached(
+            "volatility",
+            lambda: np.sqrt(self._moments.sample_variance()) * ANNUALIZATION_FACTOR
+        )
 
     def get_metrics(self) -> dict:
         """Add volatility metric to base metrics."""
@@ -95,7 +288,8 @@ class BetaDecorator(InstrumentDecorator):
     """
     Decorator that adds beta calculation to an instrument.
 
-    Beta measures systematic risk relative to market benchmark.
+    Beta measures systematic risk relative to market benchmark. New return
+    pairs can be appended with ``add_returns`` in O(1).
     """
 
     def __init__(self, instrument: Instrument,
@@ -110,8 +304,23 @@ class BetaDecorator(InstrumentDecorator):
             market_returns: Historical returns of the market benchmark.
         """
         super().__init__(instrument)
-        self._instrument_returns = instrument_returns or []
-        self._market_returns = market_returns or []
+        _, self._covariance, _ = fused_analytics_state(instrument_returns, market_returns)
+
+    def add_returns(self, instrument_return: float, market_return: float) -> None:
+        """
+        Append an (instrument, market) return pair and update beta in O(1).
+
+        Ignored when the initial series were misaligned, since beta is
+        undefined for them.
+
+        Args:
+            instrument_return: New instrument return.
+            market_return: Market return for the same period.
+        """
+        if self._covariance is None:
+            return
+        self._covariance.update(instrument_return, market_return)
+        self._version += 1
 
     def calculate_beta(self) -> float:
         """
@@ -120,28 +329,9 @@ class BetaDecorator(InstrumentDecorator):
         Returns:
             Beta value (covariance / market variance).
         """
-        if (not self._instrument_returns or not self._market_returns
-                or len(self._instrument_returns) != len(self._market_returns)
-                or len(self._instrument_returns) < 2):
-            return 1.0
-
-        n = len(self._instrument_returns)
-        mean_ins = sum(self._instrument_returns) / n
-        mean_mkt = sum(self._market_returns) / n
-
-        cov = sum(
-            (self._instrument_returns[i] - mean_ins) * (self._market_returns[i] - mean_mkt)
-            for i in range(n)
-        ) / (n - 1)
-
-        var = sum(
-            (self._market_returns[i] - mean_mkt) ** 2 for i in range(n)
-        ) / (n - 1)
-
-        if var == 0:
+        if self._covariance is None:
             return 1.0
-
-        return cov / var
+        return self._cached("beta", self._covariance.beta)
 
     def get_metrics(self) -> dict:
         """Add beta metric to base metrics."""
@@ -154,7 +344,8 @@ class DrawdownDecorator(InstrumentDecorator):
     """
     Decorator that adds maximum drawdown calculation to an instrument.
 
-    Maximum drawdown measures the largest peak-to-trough decline.
+    Maximum drawdown measures the largest peak-to-trough decline. New prices
+    can be appended with ``add_price`` in O(1).
     """
 
     def __init__(self, instrument: Instrument, price_history: Optional[list[float]] = None):
@@ -166,7 +357,17 @@ class DrawdownDecorator(InstrumentDecorator):
             price_history: Historical price series.
         """
         super().__init__(instrument)
-        self._price_history = price_history or []
+        self._drawdown = RunningDrawdown.from_array(_as_array(price_history))
+
+    def add_price(self, price: float) -> None:
+        """
+        Append a price and update the running peak and drawdown in O(1).
+
+        Args:
+            price: New price observation.
+        """
+        self._drawdown.update(price)
+        self._version += 1
 
     def calculate_max_drawdown(self) -> float:
         """
@@ -175,29 +376,142 @@ class DrawdownDecorator(InstrumentDecorator):
         Returns:
             Maximum drawdown as a negative percentage.
         """
-        n = len(self._price_history)
-        if n < 2:
-            return 0.0
+        return self._cached("max_drawdown", self._drawdown.value)
+
+    def get_metrics(self) -> dict:
+        """Add maximum drawdown metric to base metrics."""
+        metrics = super().get_metrics()
+        metrics["max_drawdown"] = self.calculate_max_drawdown()
+        return metrics
+
+
+class FullAnalyticsDecorator(InstrumentDecorator):
+    """
+    Decorator that adds volatility, beta and maximum drawdown in one layer.
+
+    Produces the same metrics as stacking the three single-metric decorators,
+    but builds its state in one fused pass over the data.
+    """
+
+    def __init__(self, instrument: Instrument,
+                 historical_returns: Optional[list[float]] = None,
+                 market_returns: Optional[list[float]] = None,
+                 price_history: Optional[list[float]] = None):
+        """
+        Initialize full analytics decorator.
 
-        peak = self._price_history[0]
-        max_dd = 0
-        for i, price in enumerate(self._price_history):
-            if price > peak:
-                peak = price
+        Args:
+            instrument: The instrument to decorate.
+            historical_returns: Historical returns for volatility/beta.
+            market_returns: Market benchmark returns for beta.
+            price_history: Price history for drawdown.
+        """
+        super().__init__(instrument)
+        self._moments, self._covariance, self._drawdown = fused_analytics_state(
+            historical_returns, market_returns, _as_array(price_history)
+        )
 
-            drawdown = (price - peak) / peak
-            if drawdown < max_dd:
-                max_dd = drawdown
+    @classmethod
+    def from_universe(cls, instruments: list[Instrument], returns: ArrayLike,
+                      market_returns: Optional[ArrayLike] = None,
+                      prices: Optional[ArrayLike] = None) -> list["FullAnalyticsDecorator"]:
+        """
+        Decorate a whole universe from one vectorized analytics call.
 
-        return max_dd
+        Args:
+            instruments: Instruments to decorate, one per matrix column.
+            returns: (time x instrument) return matrix.
+            market_returns: Market benchmark returns aligned with the rows.
+            prices: (time x instrument) price matrix for drawdown.
+
+        Returns:
+            List of decorators in the same order as ``instruments``.
+
+        Raises:
+            ValueError: If matrix columns don't match the instruments.
+        """
+        returns = _as_array(returns)
+        if returns.ndim != 2 or returns.shape[1] != len(instruments):
+            raise ValueError(
+                f"Expected a (time x {len(instruments)}) return matrix, got shape {returns.shape}"
+            )
+        if prices is not None and np.shape(prices)[1:] != (len(instruments),):
+            raise ValueError(
+                f"Expected a (time x {len(instruments)}) price matrix, got shape {np.shape(prices)}"
+            )
+
+        moments, covariance, drawdown = fused_analytics_state(returns, market_returns, prices)
+
+        decorated = []
+        for i, instrument in enumerate(instruments):
+            item = cls.__new__(cls)
+            InstrumentDecorator.__init__(item, instrument)
+            item._moments = RunningMoments(moments.count, float(moments.mean[i]), float(moments.m2[i]))
+            item._covariance = None if covariance is None else RunningCovariance(
+                covariance.count, float(covariance.mean_x[i]), float(covariance.mean_y),
+                float(covariance.c_xy[i]), float(covariance.m2_y)
+            )
+            item._drawdown = RunningDrawdown(
+                drawdown.count, float(drawdown.peak[i]), float(drawdown.max_drawdown[i])
+            )
+            decorated.append(item)
+        return decorated
+
+    def add_return(self, ret: float, market_return: Optional[float] = None) -> None:
+        """
+        Append a return (and the matching market return) in O(1).
+
+        Args:
+            ret: New instrument return.
+            market_return: Market return for the same period. Required once
+                           the decorator tracks beta, so the volatility and
+                           beta samples stay aligned.
+
+        Raises:
+            ValueError: If beta is tracked and market_return is missing.
+        """
+        if self._covariance is not None:
+            if market_return is None:
+                raise ValueError("market_return is required when beta is tracked")
+            self._covariance.update(ret, market_return)
+        self._moments.update(ret)
+        self._version += 1
+
+    def add_price(self, price: float) -> None:
+        """
+        Append a price and update the running drawdown in O(1).
+
+        Args:
+            price: New price observation.
+        """
+        self._drawdown.update(price)
+        self._version += 1
+
+    def calculate_volatility(self) -> float:
+        """Annualized volatility (assuming 252 trading days)."""
+        return self._cached(
+            "volatility",
+            lambda: np.sqrt(self._moments.sample_variance()) * ANNUALIZATION_FACTOR
+        )
+
+    def calculate_beta(self) -> float:
+        """Beta versus the market benchmark (1.0 when undefined)."""
+        if self._covariance is None:
+            return 1.0
+        return self._cached("beta", self._covariance.beta)
+
+    def calculate_max_drawdown(self) -> float:
+        """Maximum drawdown as a negative percentage."""
+        return self._cached("max_drawdown", self._drawdown.value)
 
     def get_metrics(self) -> dict:
-        """Add maximum drawdown metric to base metrics."""
+        """Add volatility, beta and maximum drawdown to base metrics."""
         metrics = super().get_metrics()
+        metrics["volatility"] = self.calculate_volatility()
+        metrics["beta"] = self.calculate_beta()
         metrics["max_drawdown"] = self.calculate_max_drawdown()
         return metrics
 
-
 # ============================================================================
 # Adapter Pattern
 # ============================================================================
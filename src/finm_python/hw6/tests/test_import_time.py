@@ -0,0 +1,61 @@
+"""
+Import-time budget tests for HW6.
+
+Runs ``python -X importtime`` in a subprocess and checks that the
+strategy engine and the CLI entry point stay cheap to import: NumPy-backed
+modules must only be loaded by the demos and helpers that need them.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_ROOT = Path(__file__).resolve().parents[3]
+
+# Cumulative import budget in microseconds (generous to absorb slow CI disks)
+IMPORT_BUDGET_US = 500_000
+
+
+def import_profile(module: str) -> dict[str, int]:
+    """
+    Import ``module`` in a fresh interpreter and parse ``-X importtime``.
+
+    Args:
+        module: Dotted module path to import.
+
+    Returns:
+        Mapping of imported module name to cumulative import time (us).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", [
+    "finm_python.hw6.engine",
+    "finm_python.hw6.main",
+])
+def test_import_within_budget(module):
+    """Module imports stay within the startup budget."""
+    times = import_profile(module)
+    assert times[module] < IMPORT_BUDGET_US
+
+
+@pytest.mark.parametrize("module", [
+    "finm_python.hw6.engine",
+    "finm_python.hw6.main",
+    "finm_python.hw6.patterns.creational",
+])
+def test_numpy_not_imported_eagerly(module):
+    """NumPy is only imported by the analytics paths that use it."""
+    assert "numpy" not in import_profile(module)
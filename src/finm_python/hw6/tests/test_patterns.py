@@ -22,8 +22,14 @@ Tests cover:
 """
 
 import pytest
+import gc
 import json
+import numpy as np
+import pickle
 import tempfile
+import time
+import warnings
+import weakref
 from datetime import datetime
 from pathlib import Path
 
@@ -32,17 +38,26 @@ from ..models import (
     Stock, Bond, ETF, MarketDataPoint,
     Position, PortfolioGroup, Portfolio
 )
-from ..patterns.creational import InstrumentFactory, Config, PortfolioBuilder
+from ..flat_portfolio import FlatPortfolio
+from ..patterns.creational import (
+    InstrumentFactory, Config, ConfigSnapshot, ConfigWatcher, PortfolioBuilder, benchmark_flat_portfolio,
+    StrategyRegistry, register_strategy
+)
+from ..engine import StrategyEngine, create_strategy
+from ..data_loader import (
+    DataLoader, InstrumentTable, load_instrument_columns, load_instruments_columnar
+)
 from ..patterns.structural import (
-    VolatilityDecorator, BetaDecorator, DrawdownDecorator,
+    VolatilityDecorator, BetaDecorator, DrawdownDecorator, FullAnalyticsDecorator,
     YahooFinanceAdapter, BloombergXMLAdapter
 )
 from ..patterns.behavioral import (
     MeanReversionStrategy, BreakoutStrategy,
     SignalPublisher, LoggerObserver, AlertObserver,
-    Order, ExecuteOrderCommand, CancelOrderCommand, CommandInvoker
+    Order, ExecuteOrderCommand, CancelOrderCommand, CommandInvoker,
+    Command, OrderStateLog
 )
-from ..analytics import calculate_returns
+from ..analytics import calculate_returns, calculate_log_returns, batch_full_analytics
 
 
 # =============================================================================
@@ -110,6 +125,29 @@ class TestFactoryPattern:
         with pytest.raises(ValueError, match="Unknown instrument type: unknown"):
             InstrumentFactory.create_instrument(data)
 
+    def test_create_instruments_batch(self):
+        """Batch creation preserves row order and per-type attributes."""
+        columns = {
+            "symbol": ["AAPL", "US10Y", "SPY", "MSFT"],
+            "type": ["Stock", "Bond", "ETF", "stock"],
+            "price": [172.35, 100.0, 430.5, 328.1],
+            "issuer": ["Apple Inc.", "US Treasury", "State Street", "Microsoft"],
+            "maturity": ["", "2035-10-01", "", ""],
+        }
+        instruments = InstrumentFactory.create_instruments(columns)
+
+        assert [type(i) for i in instruments] == [Stock, Bond, ETF, Stock]
+        assert [i.symbol for i in instruments] == columns["symbol"]
+        assert instruments[1].maturity == "2035-10-01"
+        assert instruments[1].coupon == 0.0
+        assert instruments[2].expense_ratio == 0.0
+
+    def test_create_instruments_unknown_type(self):
+        """Batch creation rejects unknown types."""
+        columns = {"symbol": ["XXX"], "type": ["Option"], "price": [1.0]}
+        with pytest.raises(ValueError, match="Unknown instrument type: option"):
+            InstrumentFactory.create_instruments(columns)
+
 
 # =============================================================================
 # Singleton Pattern Tests
@@ -158,6 +196,207 @@ class TestSingletonPattern:
         config = Config.get_instance()
         assert config.get("nonexistent", "default") == "default"
 
+    def test_snapshot_attribute_access(self):
+        """Snapshots expose compiled, immutable attribute access."""
+        snapshot = ConfigSnapshot({"log_level": "INFO", "limits": {"max_qty": 100},
+                                   "symbols": ["AAPL", "MSFT"]})
+
+        assert snapshot.log_level == "INFO"
+        assert snapshot.limits.max_qty == 100
+        assert snapshot.symbols == ("AAPL", "MSFT")
+        assert snapshot.to_dict()["limits"] == {"max_qty": 100}
+        with pytest.raises(AttributeError):
+            snapshot.log_level = "DEBUG"
+
+    def test_set_publishes_new_snapshot(self):
+        """Writes swap in a new snapshot and notify subscribers."""
+        config = Config.get_instance()
+        received = []
+        config.subscribe(received.append)
+
+        before = config.snapshot
+        config.set("log_level", "DEBUG")
+
+        assert config.snapshot.log_level == "DEBUG"
+        assert "log_level" not in before
+        assert received == [config.snapshot]
+
+    def test_load_skips_unchanged_file(self, tmp_path):
+        """Loading the same unchanged file does not re-parse it."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"log_level": "INFO"}))
+        config = Config.get_instance()
+
+        assert config.load(path) is True
+        assert config.load(path) is False
+        assert config.load(path, force=True) is True
+
+    def test_watcher_hot_reload_updates_engine(self, tmp_path):
+        """A file change is picked up by the watcher and the bound engine."""
+        path = tmp_path / "config.json"
+        params = tmp_path / "strategy_params.json"
+        path.write_text(json.dumps({"default_strategy": "MeanReversionStrategy"}))
+        params.write_text(json.dumps({"MeanReversionStrategy": {}, "BreakoutStrategy": {}}))
+
+        engine = StrategyEngine.from_config(path, params)
+        assert isinstance(engine.get_active_strategy(), MeanReversionStrategy)
+
+        watcher = Config.get_instance().watch(path, interval=0.01)
+        try:
+            path.write_text(json.dumps({"default_strategy": "BreakoutStrategy", "v": 2}))
+            deadline = time.time() + 5
+            while (not isinstance(engine.get_active_strategy(), BreakoutStrategy)
+                   and time.time() < deadline):
+                time.sleep(0.01)
+        finally:
+            watcher.stop()
+
+        assert isinstance(engine.get_active_strategy(), BreakoutStrategy)
+        assert Config.get_instance().snapshot.v == 2
+        engine.unbind_config()
+
+    def test_snapshot_keys_do_not_shadow_methods(self):
+        """A config key named like a method stays reachable by key only."""
+        snapshot = ConfigSnapshot({"get": 1, "a": 2})
+        assert snapshot.get("a") == 2
+        assert snapshot["get"] == 1
+        with pytest.raises(AttributeError):
+            snapshot.missing
+
+    def test_load_after_set_restores_file(self, tmp_path):
+        """Reloading an unchanged file after set() brings back its values."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"log_level": "INFO"}))
+        config = Config.get_instance()
+        config.load(path)
+        config.set("log_level", "DEBUG")
+
+        assert config.load(path) is True
+        assert config.get("log_level") == "INFO"
+
+    def test_failing_subscriber_keeps_watcher_alive(self, tmp_path):
+        """A subscriber error is recorded; other subscribers and polling go on."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"log_level": "INFO"}))
+        config = Config.get_instance()
+        seen = []
+
+        def failing(snapshot):
+            raise RuntimeError("subscriber failed")
+
+        config.subscribe(failing)
+        config.subscribe(seen.append)
+        watcher = ConfigWatcher(config, path, interval=0.01)
+        watcher.start()
+        try:
+            deadline = time.monotonic() + 5
+            while watcher.last_error is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert isinstance(watcher.last_error, RuntimeError)
+            assert seen and seen[-1].log_level == "INFO"
+
+            config.unsubscribe(failing)
+            path.write_text(json.dumps({"log_level": "DEBUG", "extra": 1}))
+            while config.get("log_level") != "DEBUG" and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert watcher.is_alive()
+            assert seen[-1].log_level == "DEBUG"
+        finally:
+            watcher.stop(timeout=1)
+
+    def test_unrelated_change_keeps_active_strategy(self, tmp_path):
+        """Only a changed default_strategy overrides set_active_strategy()."""
+        path = tmp_path / "config.json"
+        params = tmp_path / "strategy_params.json"
+        path.write_text(json.dumps({"default_strategy": "MeanReversionStrategy"}))
+        params.write_text(json.dumps({"MeanReversionStrategy": {}, "BreakoutStrategy": {}}))
+        engine = StrategyEngine.from_config(path, params)
+
+        engine.set_active_strategy("BreakoutStrategy")
+        Config.get_instance().set("log_level", "DEBUG")
+        assert isinstance(engine.get_active_strategy(), BreakoutStrategy)
+
+        Config.get_instance().set("default_strategy", "MeanReversionStrategy")
+        assert isinstance(engine.get_active_strategy(), BreakoutStrategy)
+        engine.unbind_config()
+
+    def test_dropped_engine_is_unsubscribed(self, tmp_path):
+        """Config does not keep engines from from_config() alive."""
+        path = tmp_path / "config.json"
+        params = tmp_path / "strategy_params.json"
+        path.write_text(json.dumps({"default_strategy": "MeanReversionStrategy"}))
+        params.write_text(json.dumps({"MeanReversionStrategy": {}}))
+        config = Config.get_instance()
+
+        engine = StrategyEngine.from_config(path, params)
+        ref = weakref.ref(engine)
+        assert len(config.subscribers) == 1
+        del engine
+        gc.collect()
+
+        assert ref() is None
+        assert config.subscribers == ()
+        config.set("log_level", "DEBUG")
+
+
+class TestBulkInstrumentLoading:
+    """Test columnar instrument loading and the binary cache."""
+
+    @pytest.fixture
+    def instrument_csv(self, tmp_path):
+        path = tmp_path / "instruments.csv"
+        path.write_text(
+            "symbol,type,price,sector,issuer,maturity\n"
+            "AAPL,Stock,172.35,Technology,Apple Inc.,\n"
+            "US10Y,Bond,100.00,Government,US Treasury,2035-10-01\n"
+            "SPY,ETF,430.50,Index,State Street,\n"
+        )
+        return path
+
+    def test_columnar_load(self, instrument_csv):
+        """Columnar loader parses numbers and builds typed instruments."""
+        instruments = load_instruments_columnar(instrument_csv)
+
+        assert [i.symbol for i in instruments] == ["AAPL", "US10Y", "SPY"]
+        assert instruments[0].price == 172.35
+        assert isinstance(instruments[1], Bond)
+
+    def test_binary_cache_reused_and_invalidated(self, instrument_csv, tmp_path):
+        """The cache is reused until the source file changes."""
+        cache = tmp_path / "instruments.cache"
+        load_instrument_columns(instrument_csv, cache)
+        assert cache.exists()
+
+        # Tag the cached columns: a cache hit returns them without re-parsing
+        cached = pickle.loads(cache.read_bytes())
+        cached["columns"]["sector"][0] = "FROM_CACHE"
+        cache.write_bytes(pickle.dumps(cached))
+        assert load_instrument_columns(instrument_csv, cache)["sector"][0] == "FROM_CACHE"
+
+        with open(instrument_csv, "a") as f:
+            f.write("MSFT,Stock,328.10,Technology,Microsoft Corp.,\n")
+        assert load_instrument_columns(instrument_csv, cache)["symbol"][-1] == "MSFT"
+
+    def test_data_loader_lazy_table(self, instrument_csv):
+        """Lazy loading only creates objects that are accessed."""
+        loader = DataLoader()
+        loader.load_instruments(instrument_csv, lazy=True)
+
+        table = loader._instruments
+        assert isinstance(table, InstrumentTable)
+        assert table.materialized == 0
+        assert loader.get_instrument("SPY").get_type() == "ETF"
+        assert loader.get_instrument("NOPE") is None
+        assert table.materialized == 1
+        assert len(loader.get_all_instruments()) == 3
+
+    def test_data_loader_eager_index(self, instrument_csv):
+        """Eager loading indexes every instrument by symbol."""
+        loader = DataLoader()
+        loader.load_instruments(instrument_csv)
+        assert loader.get_instrument("AAPL").sector == "Technology"
+        assert len(loader.get_all_instruments()) == 3
+
 
 # =============================================================================
 # Builder Pattern Tests
@@ -218,6 +457,60 @@ class TestBuilderPattern:
         assert portfolio.owner == "jsonuser"
         assert portfolio.get_value() == 500.0
 
+    def test_build_flat(self):
+        """build_flat produces arrays equivalent to the composite tree."""
+        builder = (PortfolioBuilder("Main")
+                   .set_owner("user1")
+                   .add_position("AAPL", 10, 100.0)
+                   .add_subportfolio("Tech",
+                                     PortfolioBuilder("Tech")
+                                     .add_position("MSFT", 5, 200.0)
+                                     .add_position("AAPL", 2, 100.0))
+                   .add_position("SPY", 1, 400.0))
+        flat = builder.build_flat()
+
+        assert flat.get_value() == 10 * 100.0 + 5 * 200.0 + 2 * 100.0 + 400.0
+        assert flat.get_position_count() == 4
+        assert flat.group_names == ["Main", "Tech"]
+        assert list(flat.group_values()) == [2600.0, 1200.0]
+        assert list(flat.direct_values()) == [1400.0, 1200.0]
+        assert flat.symbol_quantities() == {"AAPL": 12, "SPY": 1, "MSFT": 5}
+
+    def test_flat_round_trip(self):
+        """FlatPortfolio converts back to an equivalent tree."""
+        tree = PortfolioBuilder.generate(250, fanout=4, n_symbols=30).build()
+        flat = FlatPortfolio.from_portfolio(tree)
+        rebuilt = flat.to_portfolio()
+
+        assert rebuilt.get_value() == pytest.approx(tree.get_value())
+        assert rebuilt.get_position_count() == 250
+        assert sorted(p["symbol"] for p in rebuilt.get_positions()) == \
+            sorted(p["symbol"] for p in tree.get_positions())
+
+        child_values = {g.name: g.get_value() for g in rebuilt.root.components
+                        if isinstance(g, PortfolioGroup)}
+        group_values = flat.group_values()
+        assert group_values[0] == pytest.approx(tree.get_value())
+        for gid, name in enumerate(flat.group_names):
+            if name in child_values:
+                assert group_values[gid] == pytest.approx(child_values[name])
+
+    def test_flat_apply_prices(self):
+        """FlatPortfolio.apply_prices matches the tree version."""
+        tree = PortfolioBuilder.generate(100, fanout=5, n_symbols=7).build()
+        flat = FlatPortfolio.from_portfolio(tree)
+        prices = {"SYM0": 10.0, "SYM3": 99.0, "UNKNOWN": 1.0}
+
+        assert flat.apply_prices(prices) == tree.apply_prices(prices)
+        assert flat.get_value() == pytest.approx(tree.get_value())
+
+    def test_benchmark_flat_portfolio(self):
+        """Benchmark reports timings for both representations."""
+        result = benchmark_flat_portfolio(n_positions=500, fanout=5, repeats=1)
+        assert result["n_positions"] == 500
+        assert result["tree_seconds"] > 0
+        assert result["flat_seconds"] > 0
+
 
 # =============================================================================
 # Decorator Pattern Tests
@@ -290,6 +583,104 @@ class TestDecoratorPattern:
         assert "max_drawdown" in metrics
         assert decorated.get_type() == "Stock"
 
+    def test_incremental_updates_match_full_recompute(self):
+        """Appending observations gives the same metrics as rebuilding."""
+        stock = Stock("TEST", 100.0, "Tech", "Test Inc")
+        returns = [0.01, -0.02, 0.015, -0.01, 0.025]
+        market = [0.005, -0.01, 0.008, -0.004, 0.012]
+        prices = [100.0, 110.0, 105.0, 95.0, 100.0]
+
+        vol = VolatilityDecorator(stock, returns[:2])
+        beta = BetaDecorator(stock, returns[:2], market[:2])
+        drawdown = DrawdownDecorator(stock, prices[:2])
+        for ret, mkt in zip(returns[2:], market[2:]):
+            vol.add_return(ret)
+            beta.add_returns(ret, mkt)
+        for price in prices[2:]:
+            drawdown.add_price(price)
+
+        assert vol.calculate_volatility() == pytest.approx(
+            VolatilityDecorator(stock, returns).calculate_volatility())
+        assert beta.calculate_beta() == pytest.approx(
+            BetaDecorator(stock, returns, market).calculate_beta())
+        assert drawdown.calculate_max_drawdown() == pytest.approx((95.0 - 110.0) / 110.0)
+
+    def test_metric_cache_invalidated_by_new_data(self):
+        """Cached metrics are reused until new data arrives."""
+        stock = Stock("TEST", 100.0, "Tech", "Test Inc")
+        decorated = VolatilityDecorator(stock, [0.01, -0.02, 0.015])
+
+        first = decorated.calculate_volatility()
+        assert decorated.calculate_volatility() == first
+
+        decorated.add_return(0.10)
+        assert decorated.calculate_volatility() > first
+
+    def test_full_analytics_matches_stacked(self):
+        """FullAnalyticsDecorator reports the same metrics as a stack."""
+        stock = Stock("TEST", 100.0, "Tech", "Test Inc")
+        returns = [0.01, -0.02, 0.015, -0.01]
+        market = [0.005, -0.01, 0.008, -0.004]
+        prices = [100.0, 102.0, 99.0, 101.0, 97.0]
+
+        stacked = DrawdownDecorator(
+            BetaDecorator(VolatilityDecorator(stock, returns), returns, market),
+            prices
+        ).get_metrics()
+        fused = FullAnalyticsDecorator(stock, returns, market, prices).get_metrics()
+
+        for key in ("volatility", "beta", "max_drawdown"):
+            assert fused[key] == pytest.approx(stacked[key])
+
+    def test_full_analytics_add_return_requires_market(self):
+        """Beta-tracking decorators reject returns without a market return."""
+        stock = Stock("TEST", 100.0, "Tech", "Test Inc")
+        returns = [0.01, -0.02, 0.015]
+        market = [0.005, -0.01, 0.008]
+        fused = FullAnalyticsDecorator(stock, returns, market)
+
+        with pytest.raises(ValueError):
+            fused.add_return(-0.01)
+        fused.add_return(-0.01, -0.004)
+
+        expected = FullAnalyticsDecorator(stock, returns + [-0.01], market + [-0.004])
+        assert fused.calculate_volatility() == pytest.approx(expected.calculate_volatility())
+        assert fused.calculate_beta() == pytest.approx(expected.calculate_beta())
+
+        no_market = FullAnalyticsDecorator(stock, returns)
+        no_market.add_return(-0.01)
+        assert no_market.calculate_beta() == 1.0
+
+    def test_full_analytics_from_universe(self):
+        """A universe is decorated from one vectorized call."""
+        instruments = [Stock(s, 100.0) for s in ("A", "B", "C")]
+        returns = [[0.01, 0.02, -0.01],
+                   [-0.02, 0.01, 0.00],
+                   [0.015, -0.01, 0.02],
+                   [-0.01, 0.00, 0.01]]
+        market = [0.005, -0.01, 0.008, -0.004]
+        prices = [[100.0, 50.0, 20.0],
+                  [101.0, 51.0, 19.8],
+                  [99.0, 51.5, 19.8],
+                  [100.5, 51.0, 20.2],
+                  [99.5, 51.0, 20.4]]
+
+        decorated = FullAnalyticsDecorator.from_universe(instruments, returns, market, prices)
+
+        assert [d.symbol for d in decorated] == ["A", "B", "C"]
+        for i, item in enumerate(decorated):
+            single = FullAnalyticsDecorator(
+                instruments[i], [row[i] for row in returns], market, [row[i] for row in prices]
+            ).get_metrics()
+            metrics = item.get_metrics()
+            for key in ("volatility", "beta", "max_drawdown"):
+                assert metrics[key] == pytest.approx(single[key])
+
+    def test_full_analytics_from_universe_shape_mismatch(self):
+        """from_universe rejects matrices that don't match the instruments."""
+        with pytest.raises(ValueError):
+            FullAnalyticsDecorator.from_universe([Stock("A", 1.0)], [[0.01, 0.02]])
+
 
 # =============================================================================
 # Adapter Pattern Tests
@@ -399,6 +790,62 @@ class TestCompositePattern:
         assert "A" in symbols
         assert "B" in symbols
 
+    def test_cached_value_tracks_leaf_changes(self):
+        """Changing a leaf revalues only the dirty path."""
+        root = PortfolioGroup("Root")
+        left = PortfolioGroup("Left")
+        right = PortfolioGroup("Right")
+        pos_a = Position("A", 10, 100.0)
+        left.add(pos_a)
+        right.add(Position("B", 20, 50.0))
+        root.add(left)
+        root.add(right)
+        assert root.get_value() == 2000.0
+
+        pos_a.price = 110.0
+        assert root._value_dirty and left._value_dirty
+        assert not right._value_dirty
+        assert root.get_value() == 2100.0
+
+        pos_a.quantity = 5
+        assert root.get_value() == 1550.0
+
+    def test_position_count_and_structure_changes(self):
+        """Position counts are cached and refreshed on add/remove."""
+        root = PortfolioGroup("Root")
+        sub = PortfolioGroup("Sub")
+        sub.add(Position("A", 1, 10.0))
+        sub.add(Position("B", 1, 20.0))
+        root.add(sub)
+        assert root.get_position_count() == 2
+
+        extra = Position("C", 1, 30.0)
+        sub.add(extra)
+        assert root.get_position_count() == 3
+        assert root.get_value() == 60.0
+
+        sub.remove(extra)
+        assert extra.parent is None
+        assert root.get_position_count() == 2
+        assert root.get_value() == 30.0
+
+    def test_apply_prices(self):
+        """apply_prices updates every matching leaf in the subtree."""
+        portfolio = (PortfolioBuilder("Main")
+                     .add_position("AAPL", 10, 100.0)
+                     .add_subportfolio("Sub",
+                                       PortfolioBuilder("Sub")
+                                       .add_position("AAPL", 5, 100.0)
+                                       .add_position("MSFT", 2, 300.0))
+                     .build())
+        assert portfolio.get_value() == 2100.0
+
+        updated = portfolio.apply_prices({"AAPL": 120.0, "XXX": 1.0})
+
+        assert updated == 2
+        assert portfolio.get_value() == 15 * 120.0 + 2 * 300.0
+        assert portfolio.get_position_count() == 3
+
 
 # =============================================================================
 # Strategy Pattern Tests
@@ -473,6 +920,43 @@ class TestStrategyPattern:
         assert strategy.symbol is None
 
 
+class TestStrategyRegistry:
+    """Test registry-driven strategy creation."""
+
+    def test_builtin_strategies_available(self):
+        """Built-in strategies are listed and created by name."""
+        assert {"MeanReversionStrategy", "BreakoutStrategy"} <= set(StrategyRegistry.available())
+
+        strategy = create_strategy("BreakoutStrategy", {"lookback_window": 7})
+        assert isinstance(strategy, BreakoutStrategy)
+        assert strategy.lookback_window == 7
+        assert strategy.threshold == 0.03
+
+    def test_extra_params_ignored(self):
+        """Params the constructor does not take are dropped, as before the registry."""
+        strategy = create_strategy("MeanReversionStrategy",
+                                   {"lookback_window": 5, "threshold": 0.1, "notes": "desk A"})
+        assert strategy.lookback_window == 5
+        assert strategy.threshold == 0.1
+
+    def test_register_custom_strategy(self):
+        """Decorated strategies become creatable by name."""
+        @register_strategy("TestNoopStrategy")
+        class NoopStrategy(MeanReversionStrategy):
+            pass
+
+        try:
+            assert isinstance(create_strategy("TestNoopStrategy", {}), NoopStrategy)
+        finally:
+            StrategyRegistry._strategies.pop("TestNoopStrategy")
+
+    def test_unknown_strategy(self):
+        """Unknown names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown strategy type: Nope"):
+            create_strategy("Nope", {})
+        assert not StrategyRegistry.is_registered("Nope")
+
+
 # =============================================================================
 # Observer Pattern Tests
 # =============================================================================
@@ -640,6 +1124,86 @@ class TestCommandPattern:
         result = invoker.redo()
         assert result is None
 
+    def test_execute_batch_single_undo_redo(self):
+        """A batch is undone and redone as one history entry."""
+        invoker = CommandInvoker()
+        orders = [Order(f"ORD{i}", "AAPL", "BUY", 10, 100.0) for i in range(5)]
+
+        invoker.execute_batch(ExecuteOrderCommand(o) for o in orders)
+        assert len(invoker.get_history()) == 1
+        assert all(o.status == "EXECUTED" for o in orders)
+
+        invoker.undo()
+        assert all(o.status == "PENDING" for o in orders)
+
+        invoker.redo()
+        assert all(o.status == "EXECUTED" for o in orders)
+
+    def test_execute_batch_is_atomic(self):
+        """A failing command rolls back the rest of the batch."""
+        class FailingCommand(Command):
+            def execute(self):
+                raise RuntimeError("rejected")
+
+            def undo(self):
+                pass
+
+        invoker = CommandInvoker()
+        order = Order("ORD001", "AAPL", "BUY", 100, 172.35)
+
+        with pytest.raises(RuntimeError):
+            invoker.execute_batch([ExecuteOrderCommand(order), FailingCommand()])
+
+        assert order.status == "PENDING"
+        assert invoker.get_history() == []
+
+    def test_bounded_history(self):
+        """History keeps only the most recent max_history commands."""
+        invoker = CommandInvoker(max_history=3)
+        orders = [Order(f"ORD{i}", "AAPL", "BUY", 10, 100.0) for i in range(5)]
+        for order in orders:
+            invoker.execute(ExecuteOrderCommand(order))
+
+        assert len(invoker.get_history()) == 3
+        for _ in range(5):
+            invoker.undo()
+        assert [o.status for o in orders] == ["EXECUTED"] * 2 + ["PENDING"] * 3
+
+    def test_compact_undo_log(self):
+        """Compact mode records state deltas and restores them exactly."""
+        invoker = CommandInvoker(compact=True)
+        orders = [Order(f"ORD{i}", "AAPL", "BUY", 10, 100.0) for i in range(1000)]
+        orders[0].status = "EXECUTED"
+
+        invoker.execute_batch(CancelOrderCommand(o) for o in orders)
+        history = invoker.get_history()
+        assert len(history) == 1
+        assert isinstance(history[0], OrderStateLog)
+        assert all(o.status == "CANCELLED" for o in orders)
+
+        invoker.undo()
+        assert orders[0].status == "EXECUTED"
+        assert all(o.status == "PENDING" for o in orders[1:])
+
+        invoker.redo()
+        assert all(o.status == "CANCELLED" for o in orders)
+
+    def test_compact_log_keeps_only_changed_orders(self):
+        """Compact log stores each changed order once and skips no-ops."""
+        invoker = CommandInvoker(compact=True)
+        orders = [Order(f"ORD{i}", "AAPL", "BUY", 10, 100.0) for i in range(3)]
+        orders[2].status = "CANCELLED"
+
+        invoker.execute_batch([ExecuteOrderCommand(orders[0]), CancelOrderCommand(orders[0]),
+                               CancelOrderCommand(orders[1]), CancelOrderCommand(orders[2])])
+        log = invoker.get_history()[0]
+        assert log.orders == orders[:2]
+        assert [status for status, _ in log.before] == ["PENDING", "PENDING"]
+
+        invoker.undo()
+        assert [o.status for o in orders] == ["PENDING", "PENDING", "CANCELLED"]
+        assert orders[0].executed_at is None
+
 
 # =============================================================================
 # Analytics Helper Tests
@@ -659,8 +1223,55 @@ class TestAnalyticsHelpers:
 
     def test_calculate_returns_empty(self):
         """calculate_returns handles edge cases."""
-        assert calculate_returns([]) == []
-        assert calculate_returns([100.0]) == []
+        assert len(calculate_returns([])) == 0
+        assert len(calculate_returns([100.0])) == 0
+
+    def test_calculate_returns_matrix(self):
+        """calculate_returns works column-wise on a (time x instrument) matrix."""
+        prices = np.array([[100.0, 10.0], [105.0, 11.0], [102.0, 9.9]])
+        returns = calculate_returns(prices)
+
+        assert returns.shape == (2, 2)
+        assert returns[:, 0] == pytest.approx([0.05, -3 / 105])
+        assert returns[:, 1] == pytest.approx([0.1, -0.1])
+
+    def test_log_returns_mask_non_positive_prices(self):
+        """Non-positive prices yield NaN instead of shifting later returns."""
+        returns = calculate_log_returns([100.0, 0.0, 100.0, 110.0])
+
+        assert len(returns) == 3
+        assert np.isnan(returns[0]) and np.isnan(returns[1])
+        assert returns[2] == pytest.approx(np.log(1.1))
+
+    def test_batch_full_analytics(self):
+        """Batch analytics agree with the per-instrument decorators."""
+        instruments = [Stock("A", 100.0), Stock("B", 50.0)]
+        prices = np.array([[100.0, 50.0], [102.0, 49.0], [99.0, 51.0],
+                           [101.0, 52.0], [97.0, 50.5]])
+        market = [0.01, -0.02, 0.015, -0.03]
+
+        result = batch_full_analytics(instruments, prices, market)
+
+        assert result["symbol"] == ["A", "B"]
+        for i, inst in enumerate(instruments):
+            expected = FullAnalyticsDecorator(
+                inst, calculate_returns(prices[:, i]), market, prices[:, i]
+            ).get_metrics()
+            for key in ("volatility", "beta", "max_drawdown"):
+                assert result[key][i] == pytest.approx(expected[key])
+
+    def test_batch_full_analytics_non_positive_prices(self):
+        """Instruments with non-positive prices get NaN for every metric."""
+        instruments = [Stock("A", 100.0), Stock("B", 50.0)]
+        prices = np.array([[100.0, 50.0], [-5.0, 49.0], [100.0, 51.0]])
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = batch_full_analytics(instruments, prices, [0.01, -0.02])
+
+        for key in ("volatility", "beta", "max_drawdown"):
+            assert np.isnan(result[key][0])
+            assert not np.isnan(result[key][1])
 
 
 if __name__ == "__main__":
@@ -11,14 +11,29 @@ This module provides implementations for:
 
 __version__ = "0.1.0"
 
-from .data_loader import load_with_pandas, load_with_polars
+from .data_loader import (
+    load_with_pandas,
+    load_with_polars,
+    scan_market_data,
+    partition_by_symbol,
+    get_symbols,
+    filter_by_symbol,
+    generate_market_data
+)
 from .metrics import compute_rolling_metrics_pandas, compute_rolling_metrics_polars, compute_rolling_symbol
+from .incremental import IncrementalRollingMetrics
 
 
 __all__ = [
     "load_with_pandas",
     "load_with_polars",
+    "scan_market_data",
+    "partition_by_symbol",
+    "get_symbols",
+    "filter_by_symbol",
+    "generate_market_data",
     "compute_rolling_metrics_pandas",
     "compute_rolling_metrics_polars",
-    "compute_rolling_symbol"
+    "compute_rolling_symbol",
+    "IncrementalRollingMetrics"
 ]
\ No newline at end of file
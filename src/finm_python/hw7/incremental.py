@@ -0,0 +1,275 @@
+"""
+Incremental Rolling Metrics Module for HW7: Parallel Computing
+
+compute_rolling_metrics_polars recomputes every window of the full frame on
+each call, which is right for a batch job but wasteful when a few new bars
+arrive every second. This module keeps per-symbol rolling state so each
+new row costs O(1):
+
+- a ring buffer of the last `window` prices and of the last `window` returns
+  (needed to know which value leaves the window)
+- running sums of price and price^2 (and of return and return^2), each with
+  a Neumaier compensation term so rounding error does not build up over
+  millions of add/remove steps
+- prices enter the sums shifted by a per-symbol reference price, which
+  keeps sum-of-squares variance free of catastrophic cancellation
+
+Every `resync_every` updates a symbol's sums are rebuilt exactly from its
+ring buffers with math.fsum and the reference is moved to the latest price,
+so drift is bounded no matter how long the stream runs.
+
+Output columns and warm-up nulls match compute_rolling_metrics_polars, and
+replaying a frame through the engine agrees with the batch result to 1e-9.
+
+State can be checkpointed to a JSON file and restored, so a restarted
+process resumes exactly where it stopped.
+
+Usage:
+    engine = IncrementalRollingMetrics(window=20)
+    out = engine.update(new_bars)          # polars DataFrame of new rows only
+    engine.checkpoint("state.json")
+    engine = IncrementalRollingMetrics.restore("state.json")
+"""
+
+import json
+import math
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import polars as pl
+
+
+CHECKPOINT_VERSION = 1
+
+
+def _neumaier(total: float, compensation: float, value: float) -> Tuple[float, float]:
+    """Add `value` to a compensated sum; returns the new (total, compensation)."""
+    result = total + value
+    if abs(total) >= abs(value):
+        compensation += (total - result) + value
+    else:
+        compensation += (value - result) + total
+    return result, compensation
+
+
+@dataclass
+class SymbolState:
+    """
+    Rolling state for one symbol.
+
+    Attributes:
+        prices: Ring of the last `window` prices
+        returns: Ring of the last `window` returns
+        count: Prices seen so far (the ring slot is count % window)
+        last_price: Most recent price (None before the first)
+        shift: Reference price subtracted before summing
+        sums: [sum, comp, sum_sq, comp_sq] of shifted prices in the window
+        return_sums: [sum, comp, sum_sq, comp_sq] of returns in the window
+        since_resync: Updates since the sums were last rebuilt exactly
+    """
+    prices: List[float]
+    returns: List[float]
+    count: int = 0
+    last_price: Optional[float] = None
+    shift: float = 0.0
+    sums: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0, 0.0])
+    return_sums: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0, 0.0])
+    since_resync: int = 0
+
+    @classmethod
+    def empty(cls, window: int) -> "SymbolState":
+        return cls(prices=[0.0] * window, returns=[0.0] * window)
+
+
+class IncrementalRollingMetrics:
+    """
+    Streaming rolling_ma / rolling_std / return / rolling_sharpe per symbol.
+
+    Attributes:
+        window: Rolling window size
+        resync_every: Updates between exact rebuilds of a symbol's sums
+        states: symbol -> SymbolState
+    """
+
+    def __init__(self, window: int = 20, resync_every: int = 4096):
+        if window < 1:
+            raise ValueError("Window must be positive")
+        if resync_every < 1:
+            raise ValueError("resync_every must be positive")
+        self.window = window
+        self.resync_every = resync_every
+        self.states: Dict[str, SymbolState] = {}
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def _resync(self, state: SymbolState) -> None:
+        """Rebuild the sums exactly from the rings around the latest price."""
+        window = self.window
+        held = min(state.count, window)
+        slots = [(state.count - 1 - k) % window for k in range(held)]
+
+        state.shift = state.last_price
+        shifted = [state.prices[s] - state.shift for s in slots]
+        state.sums = [math.fsum(shifted), 0.0, math.fsum(x * x for x in shifted), 0.0]
+
+        # Returns exist from the second price on
+        held_returns = min(state.count - 1, window)
+        values = [state.returns[s] for s in slots[:held_returns]]
+        state.return_sums = [math.fsum(values), 0.0, math.fsum(r * r for r in values), 0.0]
+        state.since_resync = 0
+
+    def update_tick(
+        self,
+        symbol: str,
+        price: float
+    ) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
+        """
+        Add one price for a symbol.
+
+        Returns:
+            (rolling_ma, rolling_std, return, rolling_sharpe), with None where
+            the batch polars computation would produce null (warm-up)
+        """
+        window = self.window
+        state = self.states.get(symbol)
+        if state is None:
+            state = self.states[symbol] = SymbolState.empty(window)
+            state.shift = price
+
+        slot = state.count % window
+        sums = state.sums
+
+        # Price window: drop the value leaving, add the new one
+        if state.count >= window:
+            old = state.prices[slot] - state.shift
+            sums[0], sums[1] = _neumaier(sums[0], sums[1], -old)
+            sums[2], sums[3] = _neumaier(sums[2], sums[3], -old * old)
+        x = price - state.shift
+        sums[0], sums[1] = _neumaier(sums[0], sums[1], x)
+        sums[2], sums[3] = _neumaier(sums[2], sums[3], x * x)
+        state.prices[slot] = price
+
+        # Return window: return k sits in slot k % window alongside its price
+        ret = None
+        if state.last_price is not None:
+            ret = price / state.last_price - 1.0
+            rsums = state.return_sums
+            if state.count - 1 >= window:
+                old = state.returns[slot]
+                rsums[0], rsums[1] = _neumaier(rsums[0], rsums[1], -old)
+                rsums[2], rsums[3] = _neumaier(rsums[2], rsums[3], -old * old)
+            rsums[0], rsums[1] = _neumaier(rsums[0], rsums[1], ret)
+            rsums[2], rsums[3] = _neumaier(rsums[2], rsums[3], ret * ret)
+            state.returns[slot] = ret
+
+        state.count += 1
+        state.last_price = price
+        state.since_resync += 1
+        if state.since_resync >= self.resync_every:
+            self._resync(state)
+
+        return self._metrics(state, ret)
+
+    def _metrics(
+        self,
+        state: SymbolState,
+        ret: Optional[float]
+    ) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
+        window = self.window
+        if state.count < window:
+            return None, None, ret, None
+
+        total = state.sums[0] + state.sums[1]
+        mean = total / window
+        ma = state.shift + mean
+        std = None
+        if window > 1:
+            var = (state.sums[2] + state.sums[3] - total * mean) / (window - 1)
+            std = math.sqrt(var) if var > 0.0 else 0.0
+
+        sharpe = None
+        if state.count > window and window > 1:
+            r_total = state.return_sums[0] + state.return_sums[1]
+            r_mean = r_total / window
+            r_var = (state.return_sums[2] + state.return_sums[3] - r_total * r_mean) / (window - 1)
+            r_std = math.sqrt(r_var) if r_var > 0.0 else 0.0
+            if r_std > 0.0:
+                sharpe = r_mean / r_std
+            else:
+                sharpe = math.copysign(math.inf, r_mean) if r_mean != 0.0 else math.nan
+
+        return ma, std, ret, sharpe
+
+    def update(self, df: pl.DataFrame) -> pl.DataFrame:
+        """
+        Process new rows in arrival order.
+
+        Args:
+            df: polars DataFrame of new rows with 'symbol' and 'price' columns
+
+        Returns:
+            The new rows with rolling_ma, rolling_std, return and
+            rolling_sharpe columns, as compute_rolling_metrics_polars would
+            produce for them given all earlier rows
+
+        Time Complexity: O(new rows)
+        """
+        columns: List[List[Optional[float]]] = [[], [], [], []]
+        update_tick = self.update_tick
+        for symbol, price in zip(df["symbol"].to_list(), df["price"].to_list()):
+            for column, value in zip(columns, update_tick(symbol, price)):
+                column.append(value)
+
+        names = ("rolling_ma", "rolling_std", "return", "rolling_sharpe")
+        return df.with_columns(
+            pl.Series(name, values, dtype=pl.Float64) for name, values in zip(names, columns)
+        )
+
+    # ------------------------------------------------------------------
+    # Checkpointing
+    # ------------------------------------------------------------------
+
+    def checkpoint(self, path: str) -> Path:
+        """
+        Write the full state to a JSON file.
+
+        The file is written next to the target and renamed into place, so a
+        crash mid-write never leaves a truncated checkpoint. Floats are
+        stored with repr precision and restore bit-for-bit.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": CHECKPOINT_VERSION,
+            "window": self.window,
+            "resync_every": self.resync_every,
+            "states": {symbol: asdict(state) for symbol, state in self.states.items()},
+        }
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def restore(cls, path: str) -> "IncrementalRollingMetrics":
+        """
+        Rebuild an engine from a checkpoint file.
+
+        Raises:
+            ValueError: If the checkpoint version is not supported
+        """
+        with open(path) as f:
+            payload = json.load(f)
+        if payload.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {payload.get('version')}")
+
+        engine = cls(window=payload["window"], resync_every=payload["resync_every"])
+        engine.states = {
+            symbol: SymbolState(**state) for symbol, state in payload["states"].items()
+        }
+        return engine
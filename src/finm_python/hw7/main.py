@@ -11,22 +11,24 @@ Learning Objectives:
 - Generate comprehensive performance benchmarks
 - Produce actionable insights from experimental results
 
+Every benchmark stage runs under parallel.measure_resource_usage, which
+samples CPU, RSS, context switches and I/O of this process and its worker
+processes; the parallel stage also monitors each approach separately so
+the report can plot CPU utilization per approach.
+
 Usage:
     python -m finm_python.hw7.main
-
-TODO: Implement the main orchestration function and helper functions.
 """
 
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
-# TODO: Import other modules from hw7
-# from . import data_loader
-# from . import metrics
-# from . import parallel
-# from . import portfolio
-# from . import reporting
+from . import data_loader
+from . import metrics
+from . import parallel
+from . import portfolio
+from . import reporting
 
 
 def get_data_paths() -> Dict[str, Path]:
@@ -40,16 +42,35 @@ def get_data_paths() -> Dict[str, Path]:
             "portfolio_structure": Path to portfolio_structure.json,
             "output_dir": Path to output directory
         }
+    """
+    hw7_dir = Path(__file__).resolve().parent
+    repo_root = hw7_dir.parents[2]
+    output_dir = hw7_dir / "output"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return {
+        "market_data": repo_root / "data" / "raw" / "market_data.csv",
+        "portfolio_structure": hw7_dir.parent / "scripts" / "hw7" / "portfolio_structure.json",
+        "output_dir": output_dir,
+    }
+
+
+def _fmt(value: Optional[float], spec: str) -> str:
+    return "n/a" if value is None else f"{value:{spec}}"
+
 
-    Expected Implementation:
-        1. Determine base directory
-        2. Construct paths to data files
-        3. Create output directory if needed
-        4. Return paths dictionary
+def run_monitored(func: Callable, *args, **kwargs) -> Dict[str, Any]:
     """
-    # TODO: Implement path configuration
-    # Hint: Use Path(__file__).parent for relative paths
-    raise NotImplementedError("Implement path configuration")
+    Run one benchmark stage under measure_resource_usage and print its usage.
+
+    Returns:
+        The measure_resource_usage dictionary (func's return value under "result")
+    """
+    usage = parallel.measure_resource_usage(func, *args, **kwargs)
+    print(f"  resources: {usage['execution_time']:.3f}s wall, "
+          f"CPU {_fmt(usage['cpu_percent'], '.0f')}% avg / {_fmt(usage['peak_cpu_percent'], '.0f')}% peak, "
+          f"peak RSS {_fmt(usage['memory_mb'], '.1f')} MB, "
+          f"ctx switches {usage['voluntary_switches']} vol / {usage['involuntary_switches']} invol")
+    return usage
 
 
 def run_data_ingestion_benchmark(market_data_path: Path) -> Dict[str, Any]:
@@ -70,13 +91,25 @@ def run_data_ingestion_benchmark(market_data_path: Path) -> Dict[str, Any]:
         {
             "pandas_df": pandas DataFrame,
             "polars_df": polars DataFrame,
-            "benchmarks": ingestion timing results
+            "benchmarks": ingestion timing results,
+            "resources": measure_resource_usage result for the stage
         }
     """
-    # TODO: Implement data ingestion benchmark
     print("Task 1: Data Ingestion Benchmark")
     print("-" * 40)
-    raise NotImplementedError("Implement data ingestion benchmark")
+    usage = run_monitored(data_loader.benchmark_ingestion, market_data_path)
+    benchmarks = usage.pop("result")
+    for library in ("pandas", "polars"):
+        bench = benchmarks[library]
+        print(f"  {library}: {bench['load_time']:.4f}s, "
+              f"{bench['memory_bytes'] / reporting.MB:.2f} MB")
+
+    return {
+        "pandas_df": data_loader.load_with_pandas(market_data_path),
+        "polars_df": data_loader.load_with_polars(market_data_path),
+        "benchmarks": benchmarks,
+        "resources": usage,
+    }
 
 
 def run_rolling_metrics_benchmark(
@@ -90,19 +123,22 @@ def run_rolling_metrics_benchmark(
     1. Compute rolling metrics with pandas
     2. Compute rolling metrics with polars
     3. Benchmark both approaches
-    4. Generate visualization for one symbol
 
     Args:
         pandas_df: pandas DataFrame with market data
         polars_df: polars DataFrame with market data
 
     Returns:
-        Dictionary with benchmark results
+        Dictionary with:
+        {
+            "benchmarks": metrics.benchmark_rolling_metrics results,
+            "resources": measure_resource_usage result for the stage
+        }
     """
-    # TODO: Implement rolling metrics benchmark
     print("\nTask 2: Rolling Metrics Benchmark")
     print("-" * 40)
-    raise NotImplementedError("Implement rolling metrics benchmark")
+    usage = run_monitored(metrics.benchmark_rolling_metrics, pandas_df, polars_df)
+    return {"benchmarks": usage.pop("result"), "resources": usage}
 
 
 def run_parallel_processing_benchmark(
@@ -119,22 +155,45 @@ def run_parallel_processing_benchmark(
     4. Run multiprocessing-based processing
     5. Compare results and timings
 
+    Each approach is monitored on its own (compare_parallel_approaches
+    with monitor=True), on top of the stage-level monitor. The shared
+    worker pools are started first, so the comparison times steady-state
+    work rather than one-off process start-up.
+
     Args:
         pandas_df: pandas DataFrame with market data
         polars_df: polars DataFrame with market data
 
     Returns:
-        Dictionary with parallel processing benchmarks
+        Dictionary with:
+        {
+            "benchmarks": parallel.compare_parallel_approaches results,
+            "resources": measure_resource_usage result for the stage
+        }
     """
-    # TODO: Implement parallel processing benchmark
     print("\nTask 3: Parallel Processing Benchmark")
     print("-" * 40)
-    raise NotImplementedError("Implement parallel processing benchmark")
+    symbols = data_loader.get_symbols(pandas_df)
+    workers = parallel.get_optimal_worker_count()
+    for kind in ("thread", "process"):
+        parallel.get_worker_pool(kind, workers).warm_up()
+    usage = run_monitored(
+        parallel.compare_parallel_approaches,
+        pandas_df, symbols, metrics.compute_rolling_symbol,
+        max_workers=workers, monitor=True
+    )
+    comparison = usage.pop("result")
+    for name, bench in comparison.items():
+        cpu = bench.get("resources", {}).get("cpu_percent")
+        print(f"  {name}: {bench['time']:.4f}s, speedup {bench.get('speedup', 1.0):.2f}x, "
+              f"CPU {_fmt(cpu, '.0f')}% ({workers} workers)")
+    return {"benchmarks": comparison, "resources": usage}
 
 
 def run_portfolio_aggregation(
     portfolio_path: Path,
-    market_data: Any
+    market_data: Any,
+    output_dir: Optional[Path] = None
 ) -> Dict[str, Any]:
     """
     Execute Task 4: Portfolio Aggregation.
@@ -149,14 +208,34 @@ def run_portfolio_aggregation(
     Args:
         portfolio_path: Path to portfolio_structure.json
         market_data: DataFrame with market data
+        output_dir: Directory for aggregated_portfolio.json (not saved if None)
 
     Returns:
-        Dictionary with portfolio aggregation results and benchmarks
+        Dictionary with:
+        {
+            "benchmarks": portfolio.compare_sequential_vs_parallel results,
+            "aggregated": aggregated portfolio,
+            "resources": measure_resource_usage result for the stage
+        }
+        Benchmarks are empty (stage skipped) if the market data lacks
+        any symbol held in the portfolio.
     """
-    # TODO: Implement portfolio aggregation
     print("\nTask 4: Portfolio Aggregation")
     print("-" * 40)
-    raise NotImplementedError("Implement portfolio aggregation")
+    structure = portfolio.load_portfolio_structure(portfolio_path)
+    missing = sorted(set(portfolio.collect_symbols(structure)) - set(data_loader.get_symbols(market_data)))
+    if missing:
+        print(f"  skipped: no market data for {', '.join(missing)}")
+        return {"benchmarks": {}, "aggregated": None, "resources": None}
+
+    usage = run_monitored(portfolio.compare_sequential_vs_parallel, structure, market_data)
+    benchmarks = usage.pop("result")
+    aggregated = portfolio.aggregate_portfolio_metrics(structure, market_data)
+    if output_dir is not None:
+        portfolio.save_aggregated_portfolio(aggregated, output_dir / "aggregated_portfolio.json", indent=2)
+    print(f"  total value {aggregated['total_value']:.2f}, "
+          f"parallel speedup {benchmarks['speedup']:.2f}x")
+    return {"benchmarks": benchmarks, "aggregated": aggregated, "resources": usage}
 
 
 def run_performance_reporting(
@@ -164,7 +243,8 @@ def run_performance_reporting(
     rolling_results: Dict,
     parallel_results: Dict,
     portfolio_results: Dict,
-    output_dir: Path
+    output_dir: Path,
+    resource_usage: Optional[Dict[str, Dict]] = None
 ) -> None:
     """
     Execute Task 5: Performance Comparison and Reporting.
@@ -173,8 +253,6 @@ def run_performance_reporting(
     1. Create performance summary
     2. Generate comparison tables
     3. Create visualizations
-    4. Generate analysis narrative
-    5. Export report to markdown
 
     Args:
         ingestion_results: Data ingestion benchmarks
@@ -182,11 +260,18 @@ def run_performance_reporting(
         parallel_results: Parallel processing benchmarks
         portfolio_results: Portfolio aggregation benchmarks
         output_dir: Directory to save reports
+        resource_usage: Stage name -> measure_resource_usage result
     """
-    # TODO: Implement performance reporting
     print("\nTask 5: Performance Reporting")
     print("-" * 40)
-    raise NotImplementedError("Implement performance reporting")
+    summary = reporting.create_performance_summary(
+        ingestion_results, rolling_results, parallel_results, portfolio_results, resource_usage
+    )
+    table = reporting.generate_comparison_table(summary)
+    (output_dir / "performance_tables.md").write_text(table + "\n")
+    reporting.plot_performance_comparison(summary, str(output_dir / "performance_comparison.png"))
+    print(table)
+    print(f"\n  tables and plots written to {output_dir}")
 
 
 def main():
@@ -199,58 +284,54 @@ def main():
     3. Parallel processing comparison (threading vs multiprocessing)
     4. Portfolio aggregation
     5. Performance reporting and analysis
-
-    Expected Implementation:
-        1. Get data paths
-        2. Run each benchmark task
-        3. Generate comprehensive report
-        4. Print summary to console
     """
     print("=" * 50)
     print("HW7: Parallel Computing for Financial Data")
     print("=" * 50)
 
-    # TODO: Implement main orchestration logic
-    #
-    # Suggested structure:
-    #
-    # paths = get_data_paths()
-    #
-    # # Task 1: Data Ingestion
-    # ingestion_results = run_data_ingestion_benchmark(paths["market_data"])
-    #
-    # # Task 2: Rolling Metrics
-    # rolling_results = run_rolling_metrics_benchmark(
-    #     ingestion_results["pandas_df"],
-    #     ingestion_results["polars_df"]
-    # )
-    #
-    # # Task 3: Parallel Processing
-    # parallel_results = run_parallel_processing_benchmark(
-    #     ingestion_results["pandas_df"],
-    #     ingestion_results["polars_df"]
-    # )
-    #
-    # # Task 4: Portfolio Aggregation
-    # portfolio_results = run_portfolio_aggregation(
-    #     paths["portfolio_structure"],
-    #     ingestion_results["pandas_df"]
-    # )
-    #
-    # # Task 5: Performance Reporting
-    # run_performance_reporting(
-    #     ingestion_results["benchmarks"],
-    #     rolling_results,
-    #     parallel_results,
-    #     portfolio_results,
-    #     paths["output_dir"]
-    # )
-    #
-    # print("\n" + "=" * 50)
-    # print("Pipeline completed successfully!")
-    # print("=" * 50)
-
-    raise NotImplementedError("Implement main orchestration")
+    paths = get_data_paths()
+
+    # Task 1: Data Ingestion
+    ingestion_results = run_data_ingestion_benchmark(paths["market_data"])
+
+    # Task 2: Rolling Metrics
+    rolling_results = run_rolling_metrics_benchmark(
+        ingestion_results["pandas_df"],
+        ingestion_results["polars_df"]
+    )
+
+    # Task 3: Parallel Processing
+    parallel_results = run_parallel_processing_benchmark(
+        ingestion_results["pandas_df"],
+        ingestion_results["polars_df"]
+    )
+
+    # Task 4: Portfolio Aggregation
+    portfolio_results = run_portfolio_aggregation(
+        paths["portfolio_structure"],
+        ingestion_results["pandas_df"],
+        paths["output_dir"]
+    )
+
+    # Task 5: Performance Reporting
+    stages = {
+        "Data Ingestion": ingestion_results,
+        "Rolling Metrics": rolling_results,
+        "Parallel Processing": parallel_results,
+        "Portfolio Aggregation": portfolio_results,
+    }
+    run_performance_reporting(
+        ingestion_results["benchmarks"],
+        rolling_results["benchmarks"],
+        parallel_results["benchmarks"],
+        portfolio_results["benchmarks"],
+        paths["output_dir"],
+        {stage: results["resources"] for stage, results in stages.items() if results["resources"]}
+    )
+
+    print("\n" + "=" * 50)
+    print("Pipeline completed successfully!")
+    print("=" * 50)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,240 @@
+"""
+Memory Measurement Module for HW7: Parallel Computing
+
+This module measures how much memory a DataFrame really occupies and how
+much the process needs while building it, so pandas vs polars comparisons
+are based on real numbers rather than `sys.getsizeof` (which only reports
+the size of the Python wrapper object).
+
+Three views of memory are reported for every load:
+- Deep size: bytes held by the finished DataFrame, including object
+  columns (pandas `memory_usage(deep=True)`, polars `estimated_size()`)
+- Peak RSS: resident memory high-water mark above the pre-load baseline,
+  sampled from /proc/self/status by a background thread (and refined with
+  the kernel's VmHWM counter when it can be reset)
+- Allocation peak: peak bytes traced by `tracemalloc` during the parse.
+  This sees Python and NumPy allocations only; native buffers (the pandas
+  C parser, polars' Rust allocator) appear in peak RSS instead.
+
+Timing and memory tracing run in separate passes so tracemalloc overhead
+does not distort load times.
+
+Note: /proc is Linux-only. Elsewhere the RSS fields are reported as None.
+"""
+
+import gc
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+import polars as pl
+
+
+PROC_STATUS = Path("/proc/self/status")
+PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+
+def deep_size(df: Any) -> int:
+    """
+    Bytes held by a DataFrame's data, index and string payloads.
+
+    Args:
+        df: pandas or polars DataFrame (anything else falls back to getsizeof)
+
+    Returns:
+        Size in bytes
+    """
+    if isinstance(df, pd.DataFrame):
+        return int(df.memory_usage(index=True, deep=True).sum())
+    if isinstance(df, pl.DataFrame):
+        return int(df.estimated_size())
+    return sys.getsizeof(df)
+
+
+def read_proc_status(path: Path = PROC_STATUS) -> Dict[str, int]:
+    """
+    Parse the memory fields (kB values) of a /proc/<pid>/status file.
+
+    Returns:
+        Dictionary of field name -> bytes, e.g. {"VmRSS": ..., "VmHWM": ...};
+        empty if the file does not exist (non-Linux or exited process)
+    """
+    fields = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                parts = value.split()
+                if len(parts) == 2 and parts[1] == "kB":
+                    fields[name] = int(parts[0]) * 1024
+    except OSError:
+        return {}
+    return fields
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (None without /proc)."""
+    return read_proc_status().get("VmRSS")
+
+
+def reset_peak_rss() -> bool:
+    """
+    Reset the kernel's VmHWM high-water mark to the current RSS.
+
+    Returns:
+        True if the reset succeeded (Linux >= 4.0 and clear_refs writable)
+    """
+    try:
+        with open(PROC_CLEAR_REFS, "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+class RSSSampler:
+    """
+    Background thread recording the peak RSS of this process.
+
+    Usage:
+        with RSSSampler(interval=0.001) as sampler:
+            df = load(path)
+        sampler.peak_delta  # bytes above the RSS when sampling started
+
+    Attributes:
+        interval: Seconds between /proc reads
+        baseline: RSS when sampling started (bytes)
+        peak: Highest RSS observed (bytes)
+        samples: Number of reads taken
+    """
+
+    def __init__(self, interval: float = 0.001):
+        if interval <= 0:
+            raise ValueError("Interval must be positive")
+        self.interval = interval
+        self.baseline: Optional[int] = None
+        self.peak: Optional[int] = None
+        self.samples = 0
+        self._hwm_reset = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        rss = current_rss()
+        if rss is not None:
+            self.peak = rss if self.peak is None else max(self.peak, rss)
+            self.samples += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> None:
+        self._hwm_reset = reset_peak_rss()
+        self.baseline = current_rss()
+        self.peak = self.baseline
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._sample()
+        # A short spike between samples is still caught by the kernel counter
+        if self._hwm_reset:
+            hwm = read_proc_status().get("VmHWM")
+            if hwm is not None and self.peak is not None:
+                self.peak = max(self.peak, hwm)
+
+    def __enter__(self) -> "RSSSampler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    @property
+    def peak_delta(self) -> Optional[int]:
+        """Peak RSS above the starting baseline in bytes (None without /proc)."""
+        if self.baseline is None or self.peak is None:
+            return None
+        return max(0, self.peak - self.baseline)
+
+
+def measure_load(
+    loader: Callable[[str], Any],
+    file_path: str,
+    trials: int = 5,
+    sample_interval: float = 0.001
+) -> Dict[str, Any]:
+    """
+    Time a loader and measure the memory it uses over repeated trials.
+
+    Each trial runs the loader twice: once under the RSS sampler for time
+    and peak RSS, once under tracemalloc for Python-level allocations.
+    The frame from each run is dropped and garbage collected before the
+    next one so trials start from the same state.
+
+    Args:
+        loader: Function taking a path and returning a DataFrame
+        file_path: Path to the file to load
+        trials: Number of repeated trials
+        sample_interval: Seconds between RSS samples
+
+    Returns:
+        Dictionary with:
+        {
+            "load_time": float,             # median seconds
+            "load_time_min": float,
+            "load_times": List[float],
+            "memory_bytes": int,            # deep size of the loaded frame
+            "peak_rss_bytes": int or None,  # max over trials
+            "alloc_peak_bytes": int,        # max tracemalloc peak over trials
+            "trials": int
+        }
+    """
+    if trials < 1:
+        raise ValueError("trials must be at least 1")
+
+    times: List[float] = []
+    rss_peaks: List[int] = []
+    alloc_peaks: List[int] = []
+    memory_bytes = 0
+
+    for _ in range(trials):
+        gc.collect()
+        with RSSSampler(sample_interval) as sampler:
+            start = time.perf_counter()
+            df = loader(file_path)
+            times.append(time.perf_counter() - start)
+        memory_bytes = deep_size(df)
+        if sampler.peak_delta is not None:
+            rss_peaks.append(sampler.peak_delta)
+        del df
+        gc.collect()
+
+        tracemalloc.start()
+        try:
+            df = loader(file_path)
+            alloc_peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+        del df
+
+    return {
+        "load_time": statistics.median(times),
+        "load_time_min": min(times),
+        "load_times": times,
+        "memory_bytes": memory_bytes,
+        "peak_rss_bytes": max(rss_peaks) if rss_peaks else None,
+        "alloc_peak_bytes": max(alloc_peaks),
+        "trials": trials,
+    }
@@ -10,26 +10,146 @@ Learning Objectives:
 - Compare pandas vs polars syntax and performance for rolling operations
 """
 import timeit
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+import numpy as np
 import pandas as pd
 import polars as pl
 
-from src.finm_python.hw7 import load_with_pandas, load_with_polars
+from src.finm_python.hw7 import load_with_pandas, load_with_polars, filter_by_symbol, generate_market_data
+
+
+METRIC_COLUMNS = ("rolling_ma", "rolling_std", "return", "rolling_sharpe")
 
 
 def compute_rolling_metrics_pandas(df: Any, window: int = 20) -> Any:
     """
     Compute rolling metrics using pandas.
 
+    All four metrics come out of one pass over a group-contiguous layout:
+    rows are stably sorted by symbol, so each symbol's rows sit next to
+    each other and a single native rolling sum over the whole column sees
+    every window. Windows that would straddle two symbols are masked using
+    each row's position inside its group. No per-group Python calls.
+
+    The rolling sums of price and price^2 give both the moving average and
+    the standard deviation, and the same sums of the returns give the
+    Sharpe numerator and denominator, so nothing is rolled twice. Prices
+    are centred on their group's first price before squaring to keep the
+    sum-of-squares variance free of cancellation.
+
     Args:
-        df: pandas DataFrame with 'price' column (single symbol data)
+        df: pandas DataFrame with 'symbol' and 'price' columns (one or
+            many symbols, in any row order)
         window: Rolling window size (default: 20)
 
     Returns:
-        pandas.DataFrame: Original DataFrame with additional columns:
+        pandas.DataFrame: Original DataFrame (same row order) with additional columns:
             - rolling_ma
             - rolling_std
+            - return
             - rolling_sharpe
+
+    Time Complexity: O(N log N) for the sort, O(N) for the rolling sums
+    """
+    df = df.copy()
+
+    codes, _ = pd.factorize(df["symbol"])
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    price = df["price"].to_numpy(dtype=np.float64)[order]
+
+    group_start = np.ones(len(df), dtype=bool)
+    group_start[1:] = sorted_codes[1:] != sorted_codes[:-1]
+
+    values = rolling_metrics_sorted(price, window, group_start)
+    unsorted = np.empty_like(values)
+    unsorted[order] = values
+    for i, column in enumerate(METRIC_COLUMNS):
+        df[column] = unsorted[:, i]
+
+    return df
+
+
+def rolling_metrics_sorted(
+    price: np.ndarray,
+    window: int,
+    group_start: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Rolling metrics over prices laid out one symbol after another.
+
+    The array kernel behind compute_rolling_metrics_pandas, usable on raw
+    buffers (e.g. a shared-memory slice) without building a DataFrame.
+
+    Args:
+        price: Float64 prices, each symbol's rows contiguous and in time order
+        window: Rolling window size
+        group_start: Boolean mask marking the first row of each symbol
+                     (default: the whole array is one symbol)
+        out: Optional (n, 4) float64 array to write into
+
+    Returns:
+        (n, 4) array with columns in METRIC_COLUMNS order
+    """
+    n = len(price)
+    if group_start is None:
+        group_start = np.zeros(n, dtype=bool)
+        group_start[:1] = True
+    if out is None:
+        out = np.empty((n, len(METRIC_COLUMNS)))
+
+    # Position of each row inside its symbol's block
+    rows = np.arange(n)
+    first = np.maximum.accumulate(np.where(group_start, rows, 0))
+    position = rows - first
+
+    centred = price - price[first]
+    returns = np.full(n, np.nan)
+    returns[1:] = price[1:] / price[:-1] - 1.0
+    returns[group_start] = np.nan
+
+    sums = pd.DataFrame({
+        "p": centred,
+        "p2": centred * centred,
+        "r": returns,
+        "r2": returns * returns,
+    }).rolling(window).sum().to_numpy()
+
+    # A window of prices is complete from position window-1; returns start
+    # one row later because the first return of each symbol is undefined
+    price_ok = position >= window - 1
+    return_ok = position >= window
+    ddof = window - 1 if window > 1 else np.nan
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_c = sums[:, 0] / window
+        price_var = np.maximum(sums[:, 1] - sums[:, 0] * mean_c, 0.0) / ddof
+        mean_r = sums[:, 2] / window
+        return_var = np.maximum(sums[:, 3] - sums[:, 2] * mean_r, 0.0) / ddof
+        sharpe = mean_r / np.sqrt(return_var)
+
+    out[:, 0] = np.where(price_ok, mean_c + price[first], np.nan)
+    out[:, 1] = np.where(price_ok, np.sqrt(price_var), np.nan)
+    out[:, 2] = returns
+    out[:, 3] = np.where(return_ok, sharpe, np.nan)
+    return out
+
+
+def compute_rolling_metrics_pandas_transform(df: Any, window: int = 20) -> Any:
+    """
+    Compute rolling metrics with one groupby-transform lambda per metric.
+
+    The original formulation, kept as the baseline for
+    benchmark_pandas_rolling_variants: four grouped passes that call a
+    Python lambda per symbol, rolling the returns twice for the Sharpe.
+
+    Args:
+        df: pandas DataFrame with 'symbol' and 'price' columns
+        window: Rolling window size (default: 20)
+
+    Returns:
+        pandas.DataFrame with rolling_ma, rolling_std, return, rolling_sharpe
     """
     df = df.copy()
 
@@ -81,11 +201,22 @@ def compute_rolling_metrics_polars(df: Any, window: int = 20) -> Any:
 
 
 def compute_rolling_symbol(df: Any, symbol: str, window: int = 20) -> Any:
-    if isinstance(df, pd.DataFrame):
-        symbol_df = df[df["symbol"] == symbol]
+    """
+    Compute rolling metrics for one symbol.
+
+    Args:
+        df: pandas/polars DataFrame with all symbols, or the symbol -> frame
+            mapping from partition_by_symbol (no per-symbol filter pass)
+        symbol: Stock symbol to compute
+        window: Rolling window size
+
+    Returns:
+        DataFrame of the symbol's rows with rolling metric columns
+    """
+    symbol_df = filter_by_symbol(df, symbol)
+    if isinstance(symbol_df, pd.DataFrame):
         metrics = compute_rolling_metrics_pandas(symbol_df, window=window)
-    elif isinstance(df, pl.DataFrame):
-        symbol_df = df.filter(pl.col("symbol").eq(symbol))
+    elif isinstance(symbol_df, pl.DataFrame):
         metrics = compute_rolling_metrics_polars(symbol_df, window=window)
     else:
         raise TypeError(f"Expected Pandas or Polars dataframe, got {type(df)}")
@@ -118,7 +249,7 @@ def benchmark_rolling_metrics(
         start = timeit.default_timer()
         func(df, window)
         end = timeit.default_timer()
-        return start - end
+        return end - start
 
     pd_time = timer(pandas_df, compute_rolling_metrics_pandas)
     pl_time = timer(polars_df, compute_rolling_metrics_polars)
@@ -132,6 +263,60 @@ def benchmark_rolling_metrics(
     }
 
 
+def benchmark_pandas_rolling_variants(
+    n_symbols: int = 1000,
+    n_rows: int = 100_000,
+    window: int = 20,
+    repeats: int = 3,
+    seed: int = 42
+) -> Dict[str, float]:
+    """
+    Time the single-pass pandas metrics against the groupby-transform version.
+
+    Runs both on generate_market_data(n_symbols, n_rows) and checks that
+    they agree before reporting.
+
+    Args:
+        n_symbols: Number of symbols
+        n_rows: Total number of rows (ticks interleaved across symbols)
+        window: Rolling window size
+        repeats: Timed runs per variant (best is reported)
+        seed: Random seed for the generated data
+
+    Returns:
+        Dictionary with timing results:
+        {
+            "transform_time": float,
+            "single_pass_time": float,
+            "speedup_factor": float,
+            "max_abs_diff": float  # largest disagreement across metric columns
+        }
+    """
+    df = generate_market_data(n_symbols, n_rows, seed=seed)
+
+    def best_time(func):
+        times = []
+        for _ in range(repeats):
+            start = timeit.default_timer()
+            result = func(df, window)
+            times.append(timeit.default_timer() - start)
+        return min(times), result
+
+    transform_time, expected = best_time(compute_rolling_metrics_pandas_transform)
+    single_pass_time, actual = best_time(compute_rolling_metrics_pandas)
+
+    columns = ["rolling_ma", "rolling_std", "return", "rolling_sharpe"]
+    diff = (actual[columns] - expected[columns]).abs().to_numpy()
+    max_abs_diff = float(np.nanmax(diff)) if np.isfinite(diff).any() else 0.0
+
+    return {
+        "transform_time": transform_time,
+        "single_pass_time": single_pass_time,
+        "speedup_factor": transform_time / single_pass_time,
+        "max_abs_diff": max_abs_diff
+    }
+
+
 
 if __name__ == '__main__':
     path = "data/market_data-1.csv"
@@ -14,11 +14,25 @@ Learning Objectives:
 Key Concepts:
 - Threading: Concurrent execution, shared memory, limited by GIL for CPU-bound tasks
 - Multiprocessing: True parallelism, separate memory spaces, overhead for data transfer
+
+Worker pools are long-lived (see WorkerPool / get_worker_pool): starting
+processes costs far more than a typical per-symbol task, so the executor is
+created once and reused by every call. Symbols are grouped into a few
+row-balanced chunks per worker and submitted largest first, and results
+always come back in symbol_list order.
 """
 
+import atexit
+import math
+import multiprocessing
+import os
 import time
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
-from typing import Any, Callable, Dict, List, Tuple
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 import polars as pl
 
@@ -27,8 +41,338 @@ load_with_pandas,
 load_with_polars,
 compute_rolling_metrics_pandas,
 compute_rolling_metrics_polars,
-compute_rolling_symbol
+compute_rolling_symbol,
+partition_by_symbol,
+filter_by_symbol
 )
+from src.finm_python.hw7.memory import read_proc_status
+from src.finm_python.hw7.metrics import METRIC_COLUMNS, rolling_metrics_sorted
+from src.finm_python.hw7.resources import ResourceMonitor
+
+
+# Chunks per worker: enough slack for idle workers to pick up the tail,
+# few enough that per-task overhead stays small
+CHUNKS_PER_WORKER = 4
+
+# Memory budget assumed per worker by get_optimal_worker_count
+WORKER_MEMORY_BYTES = 256 * 1024 * 1024
+
+# Forked children inherit the parent's polars thread pool in whatever state
+# it was in and can deadlock; forkserver/spawn start clean interpreters.
+# The one-off start-up cost is paid once per pool, not per call.
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+PROC_MEMINFO = Path("/proc/meminfo")
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+
+def _read_first_line(path: Path) -> Optional[str]:
+    try:
+        with open(path) as f:
+            return f.readline().strip()
+    except OSError:
+        return None
+
+
+def _cgroup_cpu_limit(root: Path = CGROUP_ROOT) -> Optional[int]:
+    """
+    CPUs allowed by the cgroup CPU quota, rounded up; None when unlimited.
+
+    Reads cpu.max (cgroup v2, "<quota> <period>" or "max <period>") or
+    cpu.cfs_quota_us / cpu.cfs_period_us (cgroup v1, quota -1 = unlimited).
+    """
+    line = _read_first_line(root / "cpu.max")
+    if line:
+        quota, _, period = line.partition(" ")
+        if quota != "max" and period:
+            return max(1, math.ceil(int(quota) / int(period)))
+        return None
+
+    quota = _read_first_line(root / "cpu" / "cpu.cfs_quota_us")
+    period = _read_first_line(root / "cpu" / "cpu.cfs_period_us")
+    if quota and period and int(quota) > 0:
+        return max(1, math.ceil(int(quota) / int(period)))
+    return None
+
+
+def _available_memory(root: Path = CGROUP_ROOT) -> Optional[int]:
+    """
+    Bytes the process can still allocate: MemAvailable, capped by the
+    headroom under the cgroup memory limit when one is set.
+    """
+    available = read_proc_status(PROC_MEMINFO).get("MemAvailable")
+
+    for limit_file, usage_file in (("memory.max", "memory.current"),
+                                   ("memory/memory.limit_in_bytes", "memory/memory.usage_in_bytes")):
+        limit = _read_first_line(root / limit_file)
+        usage = _read_first_line(root / usage_file)
+        if not limit or not usage or not limit.isdigit():
+            continue  # missing, or "max" (no limit)
+        # cgroup v1 reports "no limit" as a huge page-aligned number
+        if int(limit) >= 1 << 60:
+            break
+        headroom = max(int(limit) - int(usage), 0)
+        available = headroom if available is None else min(available, headroom)
+        break
+    return available
+
+
+def get_optimal_worker_count(memory_per_worker: int = WORKER_MEMORY_BYTES) -> int:
+    """
+    Determine optimal number of workers for parallel processing.
+
+    The smallest of:
+    - CPUs this process may run on (scheduler affinity, else os.cpu_count)
+    - the cgroup CPU quota, rounded up (containers often see every host
+      CPU in os.cpu_count but are throttled to a fraction of them)
+    - available memory / memory_per_worker, counting the cgroup memory limit
+
+    Args:
+        memory_per_worker: Bytes budgeted per worker (0 disables the memory cap)
+
+    Returns:
+        Recommended number of workers based on system resources (at least 1)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        workers = len(os.sched_getaffinity(0))
+    else:
+        workers = os.cpu_count() or 1
+
+    cpu_limit = _cgroup_cpu_limit()
+    if cpu_limit is not None:
+        workers = min(workers, cpu_limit)
+
+    if memory_per_worker:
+        available = _available_memory()
+        if available is not None:
+            workers = min(workers, available // memory_per_worker)
+
+    return max(1, int(workers))
+
+
+def symbol_row_counts(df: Any, symbol_list: Sequence[str]) -> List[int]:
+    """
+    Number of rows per symbol, in symbol_list order.
+
+    Args:
+        df: pandas/polars DataFrame or a partition_by_symbol mapping
+
+    Returns:
+        Row counts, 0 for absent symbols (all 1 when the input type is
+        unknown, i.e. equal weights)
+    """
+    if isinstance(df, Mapping):
+        return [len(df[symbol]) if symbol in df else 0 for symbol in symbol_list]
+    if isinstance(df, pd.DataFrame):
+        counts = df["symbol"].value_counts()
+        return [int(counts.get(symbol, 0)) for symbol in symbol_list]
+    if isinstance(df, pl.DataFrame):
+        counts = df.group_by("symbol").len()
+        counts = dict(zip(counts["symbol"].cast(pl.String).to_list(), counts["len"].to_list()))
+        return [counts.get(symbol, 0) for symbol in symbol_list]
+    return [1] * len(symbol_list)
+
+
+def chunk_symbols(
+    sizes: Sequence[int],
+    n_workers: int,
+    chunks_per_worker: int = CHUNKS_PER_WORKER
+) -> List[List[int]]:
+    """
+    Group symbol positions into row-balanced chunks, largest first.
+
+    Symbols are visited from largest to smallest. One at or above the
+    target chunk size (total rows / (workers x chunks_per_worker)) gets a
+    chunk of its own; smaller ones are packed together until the target is
+    reached. Chunks therefore come out in roughly decreasing size: submitted
+    in this order, the big ones start first and the many small ones fill in
+    on whichever worker frees up, so one huge symbol can't end up last and
+    leave every other worker idle (longest-processing-time-first).
+
+    Args:
+        sizes: Row count per symbol
+        n_workers: Number of workers
+        chunks_per_worker: Target number of chunks per worker
+
+    Returns:
+        List of chunks, each a list of positions into sizes
+    """
+    if not sizes:
+        return []
+    target = max(1, math.ceil(sum(sizes) / (max(n_workers, 1) * chunks_per_worker)))
+
+    chunks, current, current_rows = [], [], 0
+    for i in sorted(range(len(sizes)), key=lambda i: sizes[i], reverse=True):
+        if sizes[i] >= target:
+            chunks.append([i])
+            continue
+        current.append(i)
+        current_rows += sizes[i]
+        if current_rows >= target:
+            chunks.append(current)
+            current, current_rows = [], 0
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _process_symbol_chunk(items: List[Tuple[Any, str]], processing_func: Callable, kwargs: Dict) -> List[Any]:
+    """
+    Worker task: process several symbols and return their results in order.
+
+    Args:
+        items: (data, symbol) pairs; data is the symbol's partition in
+               worker processes, the shared frame in threads
+
+    Returns:
+        One result per item
+    """
+    return [processing_func(data, symbol, **kwargs) for data, symbol in items]
+
+
+def _worker_pid(_: Any) -> int:
+    return os.getpid()
+
+
+class WorkerPool:
+    """
+    Long-lived thread or process pool with chunked, ordered symbol mapping.
+
+    The executor is created on first use and kept until shutdown(), so
+    repeated calls skip process start-up and module imports. Usable as a
+    context manager.
+
+    Attributes:
+        kind: "thread" or "process"
+        max_workers: Number of workers
+        start_method: multiprocessing start method for process pools
+        chunks_per_worker: Target chunks per worker (see chunk_symbols)
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        kind: str = "process",
+        start_method: str = START_METHOD,
+        chunks_per_worker: int = CHUNKS_PER_WORKER
+    ):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"kind must be 'thread' or 'process', got {kind!r}")
+        self.kind = kind
+        self.max_workers = max_workers or get_optimal_worker_count()
+        self.start_method = start_method
+        self.chunks_per_worker = chunks_per_worker
+        self._executor: Optional[Executor] = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "thread":
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.start_method)
+                )
+        return self._executor
+
+    def warm_up(self) -> "WorkerPool":
+        """
+        Start the workers now, so their start-up and imports are not timed.
+
+        One trivial task per worker; a process pool may still reuse an idle
+        worker for several of them rather than start all max_workers.
+        """
+        self.run_ordered(_worker_pid, range(self.max_workers))
+        return self
+
+    def run_ordered(self, fn: Callable, tasks: Sequence[Any], *args) -> List[Any]:
+        """
+        Run fn(task, *args) for every task; results in task order.
+
+        Tasks are submitted in the order given and collected in the same
+        order; the first task exception is re-raised. A process pool broken
+        by a crashed worker is discarded so the next call starts a new one.
+        """
+        try:
+            futures = [self.executor.submit(fn, task, *args) for task in tasks]
+            return [future.result() for future in futures]
+        except BrokenProcessPool:
+            self.shutdown(wait=False)
+            raise
+
+    def map_symbols(
+        self,
+        df: Any,
+        symbol_list: Sequence[str],
+        processing_func: Callable,
+        **kwargs
+    ) -> List[Any]:
+        """
+        Apply processing_func(data, symbol, **kwargs) to every symbol.
+
+        Thread pools pass the frame itself (shared, nothing copied). Process
+        pools partition it once and ship each symbol only its own rows. A
+        partition_by_symbol mapping is used as is by both. Symbols with no
+        rows get an empty frame, as filter_by_symbol gives.
+
+        Returns:
+            One result per symbol, in symbol_list order
+        """
+        if self.kind == "process" and isinstance(df, (pd.DataFrame, pl.DataFrame)):
+            df = partition_by_symbol(df)
+
+        if self.kind == "process" and isinstance(df, Mapping):
+            data = [filter_by_symbol(df, symbol) for symbol in symbol_list]
+        else:
+            data = [df] * len(symbol_list)
+
+        chunks = chunk_symbols(symbol_row_counts(df, symbol_list), self.max_workers, self.chunks_per_worker)
+        tasks = [[(data[i], symbol_list[i]) for i in chunk] for chunk in chunks]
+        chunk_results = self.run_ordered(_process_symbol_chunk, tasks, processing_func, kwargs)
+
+        results: List[Any] = [None] * len(symbol_list)
+        for chunk, values in zip(chunks, chunk_results):
+            for i, value in zip(chunk, values):
+                results[i] = value
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers; the pool restarts on next use."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+
+# Shared pools, keyed by (kind, max_workers)
+_worker_pools: Dict[Tuple[str, int], WorkerPool] = {}
+
+
+def get_worker_pool(kind: str = "process", max_workers: Optional[int] = None) -> WorkerPool:
+    """
+    Return the module's shared pool of this kind and size, creating it once.
+
+    Pools live until shutdown_worker_pools() (called automatically at exit).
+    """
+    max_workers = max_workers or get_optimal_worker_count()
+    key = (kind, max_workers)
+    if key not in _worker_pools:
+        _worker_pools[key] = WorkerPool(max_workers=max_workers, kind=kind)
+    return _worker_pools[key]
+
+
+@atexit.register
+def shutdown_worker_pools() -> None:
+    """Shut down every pool created by get_worker_pool."""
+    while _worker_pools:
+        _, pool = _worker_pools.popitem()
+        pool.shutdown()
 
 
 def process_symbols_sequential(
@@ -54,7 +398,7 @@ def process_symbols_sequential(
     res_list = []
     start = time.perf_counter()
     for symbol in symbol_list:
-        res = processing_func(df, symbol)
+        res = processing_func(df, symbol, **kwargs)
         res_list.append(res)
     end = time.perf_counter()
 
@@ -66,87 +410,238 @@ def process_symbols_threading(
     symbol_list: List[str],
     processing_func: Callable,
     max_workers: int = 1,
+    pool: Optional[WorkerPool] = None,
     **kwargs
-) -> Tuple[List[Dict], float]:
-
-    start = time.perf_counter()
-    res_list = []
+) -> Tuple[List[Any], float]:
+    """
+    Process symbols on a thread pool.
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            executor.submit(processing_func, df, symbol, **kwargs)
-            for symbol in symbol_list
-        ]
+    Args:
+        df: Dataframe loaded from data source (shared by all threads)
+        symbol_list: List of strings, one per symbol
+        processing_func: Function to apply to each symbol's data
+        max_workers: Number of threads (ignored when pool is given)
+        pool: Thread WorkerPool to run on; defaults to the shared pool
+              from get_worker_pool("thread", max_workers)
+        **kwargs: Additional arguments for processing_func
 
-        for f in as_completed(futures):
-            res_list.append(f.result())
+    Returns:
+        Tuple of:
+            - List of results, in symbol_list order
+            - Total execution time (seconds)
+    """
+    pool = pool or get_worker_pool("thread", max_workers)
+    start = time.perf_counter()
+    res_list = pool.map_symbols(df, symbol_list, processing_func, **kwargs)
     end = time.perf_counter()
 
     return res_list, end - start
 
-def _process_single_symbol_data(args_tuple):
+
+def process_symbols_multiprocessing(
+    df: Any,
+    symbol_list: List[str],
+    processing_func: Callable,
+    max_workers: int = 1,
+    pool: Optional[WorkerPool] = None,
+    **kwargs
+) -> Tuple[List[Any], float]:
     """
-    Helper function for multiprocessing: unpack arguments and process symbol data.
+    Process symbols on a process pool.
 
-    This function takes pre-filtered data to minimize serialization overhead.
+    The frame is partitioned once (one pass over the rows) and each task
+    receives only its symbols' rows, so the whole frame is never pickled.
+    A symbol with no rows gets the same empty result as in
+    process_symbols_sequential.
 
     Args:
-        args_tuple: Tuple of (symbol_data, symbol, processing_func, kwargs_dict)
+        df: pandas/polars DataFrame or partition_by_symbol mapping
+        symbol_list: List of strings, one per symbol
+        processing_func: Picklable (module-level) function to apply to
+                         each symbol's data
+        max_workers: Number of processes (ignored when pool is given)
+        pool: Process WorkerPool to run on; defaults to the shared pool
+              from get_worker_pool("process", max_workers)
+        **kwargs: Additional arguments for processing_func
+
+    Returns:
+        Tuple of:
+            - List of results, in symbol_list order
+            - Total execution time (seconds), including partitioning
+    """
+    pool = pool or get_worker_pool("process", max_workers)
+    start = time.perf_counter()
+    res_list = pool.map_symbols(df, symbol_list, processing_func, **kwargs)
+    end = time.perf_counter()
+
+    return res_list, end - start
+
+
+def _symbol_layout(df: Any, symbol_list: List[str]) -> Tuple[Any, np.ndarray, List[Tuple[int, int, str]]]:
+    """
+    Reorder rows so each symbol is one contiguous block, in symbol_list order.
 
     Returns:
-        Result from processing_func
+        Tuple of:
+            - The reordered DataFrame (rows of other symbols dropped)
+            - Its prices as a float64 array
+            - (offset, length, symbol) descriptor per symbol
     """
-    symbol_data, symbol, processing_func, kwargs = args_tuple
-    return processing_func(symbol_data, symbol, **kwargs)
+    symbols = df["symbol"].to_numpy() if isinstance(df, pd.DataFrame) else df["symbol"].cast(pl.String).to_numpy()
+    codes = pd.Index(symbol_list).get_indexer(symbols)
+    order = np.argsort(codes, kind="stable")
+    order = order[codes[order] >= 0]
 
+    lengths = np.bincount(codes[order], minlength=len(symbol_list))
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    descriptors = [(int(o), int(n), s) for o, n, s in zip(offsets, lengths, symbol_list)]
 
-def process_symbols_multiprocessing(
+    if isinstance(df, pd.DataFrame):
+        ordered = df.iloc[order]
+    else:
+        ordered = df[order]
+    prices = ordered["price"].to_numpy().astype(np.float64, copy=False)
+    return ordered, prices, descriptors
+
+
+def _run_shared_kernel(
+    descriptors: List[Tuple[int, int, str]],
+    blocks: Tuple[str, str, int, int],
+    kernel: Callable,
+    kwargs: Dict
+) -> None:
+    """
+    Worker task: run `kernel` on a chunk of symbols' slices of the shared buffers.
+
+    Only the block names and (offset, length, symbol) descriptors cross the
+    process boundary; the kernel writes its results in place. Blocks are
+    mapped per task (cheap next to the kernel) because pooled workers
+    outlive any one call's blocks; the parent owns and unlinks them.
+    """
+    input_name, output_name, n_rows, n_cols = blocks
+    input_shm = shared_memory.SharedMemory(name=input_name)
+    output_shm = shared_memory.SharedMemory(name=output_name)
+    try:
+        prices = np.ndarray((n_rows,), dtype=np.float64, buffer=input_shm.buf)
+        output = np.ndarray((n_rows, n_cols), dtype=np.float64, buffer=output_shm.buf)
+        for offset, length, _ in descriptors:
+            stop = offset + length
+            kernel(prices[offset:stop], out=output[offset:stop], **kwargs)
+        # Views must go before the mappings can close
+        del prices, output
+    finally:
+        input_shm.close()
+        output_shm.close()
+
+
+def process_symbols_shared_memory(
     df: Any,
     symbol_list: List[str],
-    processing_func: Callable,
+    kernel: Callable = rolling_metrics_sorted,
     max_workers: int = 1,
+    columns: Tuple[str, ...] = METRIC_COLUMNS,
+    pool: Optional[WorkerPool] = None,
     **kwargs
-) -> Tuple[List[Dict], float]:
+) -> Tuple[List[Any], float]:
+    """
+    Multiprocessing without pickling frames in either direction.
 
-    start = time.perf_counter()
-    res_list = []
+    The parent lays prices out symbol by symbol in one shared-memory block
+    and preallocates a shared output block with one column per metric.
+    Workers receive only block names and row-balanced chunks of
+    (offset, length, symbol) descriptors, map the blocks, and `kernel`
+    writes its results straight into the output block. The parent then
+    attaches the output columns to each symbol's rows.
 
-    # Pre-filter data by symbol to minimize serialization overhead
-    # Only send each worker the data it needs, not the entire dataframe
-    symbol_data_map = {}
-    if isinstance(df, pd.DataFrame):
-        for symbol in symbol_list:
-            symbol_data_map[symbol] = df[df["symbol"] == symbol].copy()
-    elif isinstance(df, pl.DataFrame):
-        for symbol in symbol_list:
-            symbol_data_map[symbol] = df.filter(pl.col("symbol") == symbol)
-    else:
-        # Fallback: use original behavior if unknown dataframe type
-        symbol_data_map = {symbol: df for symbol in symbol_list}
+    Args:
+        df: pandas or polars DataFrame with 'symbol' and 'price' columns
+        symbol_list: Symbols to process
+        kernel: Array function kernel(prices, out=..., **kwargs) filling an
+                (length, len(columns)) float64 array for one symbol
+        max_workers: Number of worker processes (ignored when pool is given)
+        columns: Names of the kernel's output columns
+        pool: Process WorkerPool to run on; defaults to the shared pool
+              from get_worker_pool("process", max_workers)
+        **kwargs: Extra arguments for kernel (e.g. window=20)
+
+    Returns:
+        Tuple of:
+            - One DataFrame per symbol (symbol_list order): the symbol's rows
+              with the output columns added
+            - Total execution time (seconds), including layout and assembly
+    """
+    pool = pool or get_worker_pool("process", max_workers)
+    start = time.perf_counter()
 
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            executor.submit(_process_single_symbol_data, (symbol_data_map[symbol], symbol, processing_func, kwargs))
-            for symbol in symbol_list
-        ]
+    ordered, prices, descriptors = _symbol_layout(df, symbol_list)
+    n_rows, n_cols = len(prices), len(columns)
+    # SharedMemory rejects size 0
+    input_shm = shared_memory.SharedMemory(create=True, size=max(prices.nbytes, 1))
+    output_shm = shared_memory.SharedMemory(create=True, size=max(n_rows * n_cols * 8, 1))
+    try:
+        shared_prices = np.ndarray((n_rows,), dtype=np.float64, buffer=input_shm.buf)
+        shared_prices[:] = prices
+        output = np.ndarray((n_rows, n_cols), dtype=np.float64, buffer=output_shm.buf)
+
+        chunks = chunk_symbols([d[1] for d in descriptors], pool.max_workers, pool.chunks_per_worker)
+        tasks = [[descriptors[i] for i in chunk if descriptors[i][1] > 0] for chunk in chunks]
+        blocks = (input_shm.name, output_shm.name, n_rows, n_cols)
+        pool.run_ordered(_run_shared_kernel, [t for t in tasks if t], blocks, kernel, kwargs)
+
+        # Copy out before the blocks are released
+        values = output.copy()
+        del shared_prices, output
+    finally:
+        input_shm.close()
+        input_shm.unlink()
+        output_shm.close()
+        output_shm.unlink()
 
-        for f in as_completed(futures):
-            res_list.append(f.result())
+    res_list = []
+    for offset, length, _ in descriptors:
+        block = values[offset:offset + length]
+        if isinstance(ordered, pd.DataFrame):
+            frame = ordered.iloc[offset:offset + length].copy()
+            for i, name in enumerate(columns):
+                frame[name] = block[:, i]
+        else:
+            frame = ordered.slice(offset, length).with_columns(
+                pl.Series(name, block[:, i]).fill_nan(None) for i, name in enumerate(columns)
+            )
+        res_list.append(frame)
     end = time.perf_counter()
 
     return res_list, end - start
 
 
+# Array kernels equivalent to per-symbol processing functions, used by
+# compare_parallel_approaches to add the shared-memory approach. Keyed by
+# name: the package is importable under two module paths, so the same
+# function can exist as two distinct objects.
+SHARED_MEMORY_KERNELS: Dict[str, Callable] = {
+    "compute_rolling_symbol": rolling_metrics_sorted,
+}
+
+
 def compare_parallel_approaches(
     df: Any,
     symbol_list: List[str],
     processing_func: Callable,
     max_workers: int = 1,
+    monitor: bool = False,
     **kwargs
 ) -> Dict[str, Dict[str, Any]]:
     """
     Compare sequential, threading, and multiprocessing performance.
 
+    With monitor=True every approach runs under measure_resource_usage and
+    its entry gains a "resources" dictionary (CPU%, peak RSS, context
+    switches, I/O and the sampled time series, result removed).
+
+    Extra keyword arguments (e.g. window=50) are passed to every approach;
+    the shared-memory kernel falls back to compute_rolling_symbol's
+    default window of 20.
+
     Returns:
         Dictionary with performance comparison:
         {
@@ -163,6 +658,12 @@ def compare_parallel_approaches(
                 "time": float,
                 "results": List[Dict],
                 "speedup": float  # relative to sequential
+            },
+            "shared_memory": {  # only when processing_func has an array kernel
+                "time": float,
+                "results": List[DataFrame],
+                "speedup": float,
+                "speedup_vs_multiprocessing": float
             }
         }
 
@@ -174,10 +675,26 @@ def compare_parallel_approaches(
         5. Verify results consistency across approaches
         6. Return comparison dictionary
     """
-    seq_res, seq_time = process_symbols_sequential(df, symbol_list, processing_func)
-    thr_res, thr_time = process_symbols_threading(df, symbol_list, processing_func, max_workers)
-    mpr_res, mpr_time = process_symbols_multiprocessing(df, symbol_list, processing_func, max_workers)
-    return {
+    resources: Dict[str, Dict[str, Any]] = {}
+
+    # Start the pools before timing so no approach pays worker start-up
+    for kind in ("thread", "process"):
+        get_worker_pool(kind, max_workers).warm_up()
+
+    def run(name: str, approach: Callable, *args, **approach_kwargs) -> Tuple[List[Any], float]:
+        if not monitor:
+            return approach(*args, **approach_kwargs)
+        usage = measure_resource_usage(approach, *args, **approach_kwargs)
+        resources[name] = usage
+        return usage.pop("result")
+
+    seq_res, seq_time = run("sequential", process_symbols_sequential,
+                            df, symbol_list, processing_func, **kwargs)
+    thr_res, thr_time = run("threading", process_symbols_threading,
+                            df, symbol_list, processing_func, max_workers, **kwargs)
+    mpr_res, mpr_time = run("multiprocessing", process_symbols_multiprocessing,
+                            df, symbol_list, processing_func, max_workers, **kwargs)
+    comparison = {
         "sequential": {
             "time": seq_time,
             "results": seq_res
@@ -194,58 +711,74 @@ def compare_parallel_approaches(
         }
     }
 
+    kernel = SHARED_MEMORY_KERNELS.get(getattr(processing_func, "__name__", None))
+    if kernel is not None and isinstance(df, (pd.DataFrame, pl.DataFrame)):
+        shm_res, shm_time = run("shared_memory", process_symbols_shared_memory,
+                                df, symbol_list, kernel, max_workers, **{"window": 20, **kwargs})
+        comparison["shared_memory"] = {
+            "time": shm_time,
+            "results": shm_res,
+            "speedup": seq_time / shm_time,  # relative to sequential
+            "speedup_vs_multiprocessing": mpr_time / shm_time
+        }
 
-def measure_resource_usage(func: Callable, *args, **kwargs) -> Dict[str, float]:
+    for name, usage in resources.items():
+        comparison[name]["resources"] = usage
+    return comparison
+
+
+def measure_resource_usage(
+    func: Callable,
+    *args,
+    sample_interval: float = 0.05,
+    **kwargs
+) -> Dict[str, Any]:
     """
     Measure CPU and memory usage during function execution.
 
+    A ResourceMonitor samples this process and every worker process it
+    starts from /proc while func runs, so a thread pool stuck behind the
+    GIL (cpu_percent near 100) is distinguishable from real parallelism
+    (cpu_percent near 100 x workers).
+
     Args:
         func: Function to execute and monitor
         *args: Positional arguments for func
+        sample_interval: Seconds between /proc samples
         **kwargs: Keyword arguments for func
 
     Returns:
         Dictionary with resource metrics:
         {
             "execution_time": float,
-            "cpu_percent": float,
-            "memory_mb": float,
-            "result": Any  # function return value
+            "cpu_percent": float,   # average over the run, 100 = one core
+            "memory_mb": float,     # peak RSS of the process tree
+            "result": Any,          # function return value
+            "peak_cpu_percent": float,
+            "cpu_time": float,
+            "max_processes": int,
+            "voluntary_switches": int,
+            "involuntary_switches": int,
+            "read_bytes": int,
+            "write_bytes": int,
+            "n_samples": int,
+            "timeseries": Dict[str, List[float]]  # see resources.SERIES_FIELDS
         }
-
-    Expected Implementation:
-        1. Get initial memory and CPU state
-        2. Execute function
-        3. Measure final memory and CPU usage
-        4. Return metrics dictionary
-
-    Hints:
-        - Use psutil.Process() for process monitoring
-        - Use psutil.cpu_percent() for CPU usage
-        - Memory: process.memory_info().rss / (1024 * 1024) for MB
-    """
-    # TODO: Implement resource usage monitoring
-    # Hint: Use psutil library for CPU and memory monitoring
-    raise NotImplementedError("Implement resource usage measurement")
-
-
-def get_optimal_worker_count() -> int:
+        Fields other than execution_time and result are None without /proc.
     """
-    Determine optimal number of workers for parallel processing.
+    monitor = ResourceMonitor(interval=sample_interval)
+    with monitor:
+        result = func(*args, **kwargs)
 
-    Returns:
-        Recommended number of workers based on system resources
-
-    Expected Implementation:
-        1. Get available CPU count
-        2. Consider memory constraints
-        3. Return optimal worker count (typically CPU count - 1 or CPU count)
-
-    Hint:
-        - Use os.cpu_count() or multiprocessing.cpu_count()
-    """
-    # TODO: Implement optimal worker count determination
-    raise NotImplementedError("Implement optimal worker count determination")
+    usage = monitor.summary()
+    return {
+        "execution_time": usage.pop("wall_time"),
+        "cpu_percent": usage.pop("cpu_percent"),
+        "memory_mb": usage.pop("peak_rss_mb"),
+        "result": result,
+        **usage,
+        "timeseries": monitor.series,
+    }
 
 
 if __name__ == '__main__':
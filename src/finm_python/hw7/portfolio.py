@@ -16,12 +16,51 @@ Portfolio Structure:
     - Direct positions (symbol, quantity)
     - Sub-portfolios (nested portfolios with their own positions)
 
-TODO: Implement the functions below to complete the portfolio aggregation.
+Symbol metrics are computed once per symbol, not once per position: the
+same symbol held in many sub-portfolios has one price history, so one
+volatility and one drawdown. Aggregation first walks the tree to collect
+the unique symbols, computes all of their metrics in one vectorized polars
+group-by (or in symbol chunks on a worker pool), and then combines the
+cached values bottom-up. The per-node work is only arithmetic.
+
+Nothing walks the tree recursively, so hierarchies thousands of levels deep
+do not hit Python's recursion limit. flatten_portfolio turns the nested
+dictionaries into parent-index arrays with an explicit stack, subtree
+totals are computed level by level with numpy segment reductions, and the
+nested output is rebuilt by linking each node to its parent.
+
+Files go through portfolio_io: load_portfolio_structure falls back to its
+streaming parser for JSON too deep for json.load, save_aggregated_portfolio
+writes node by node, and aggregate_portfolio_file streams a file (JSON or
+the binary format) to an output file without building nested dictionaries.
 """
 
 import json
+import math
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from src.finm_python.hw7.parallel import chunk_symbols, get_worker_pool
+from src.finm_python.hw7.portfolio_io import (
+    FlatPortfolio,
+    flatten_portfolio,
+    gc_paused,
+    is_portfolio_binary,
+    load_flat_portfolio,
+    load_portfolio_binary,
+    read_flat_portfolio_json,
+    unflatten_portfolio,
+    write_aggregated_flat,
+    write_portfolio_json,
+)
+
+
+SYMBOL_METRIC_FIELDS = ("latest_price", "volatility", "drawdown")
 
 
 def load_portfolio_structure(file_path: str) -> Dict:
@@ -34,11 +73,6 @@ def load_portfolio_structure(file_path: str) -> Dict:
     Returns:
         Dictionary representing the portfolio hierarchy
 
-    Expected Implementation:
-        1. Read JSON file
-        2. Parse into Python dictionary
-        3. Return the structure
-
     Example portfolio structure:
         {
             "name": "Main Portfolio",
@@ -56,9 +90,165 @@ def load_portfolio_structure(file_path: str) -> Dict:
                 }
             ]
         }
+
+    Binary files (portfolio_io.save_portfolio_binary) are recognised by
+    their header. JSON too deep for json.load (RecursionError) is read
+    with the streaming parser instead.
     """
-    # TODO: Implement JSON loading
-    raise NotImplementedError("Implement portfolio structure loading")
+    if is_portfolio_binary(file_path):
+        return unflatten_portfolio(load_portfolio_binary(file_path))
+    try:
+        with open(file_path) as f:
+            return json.load(f)
+    except RecursionError:
+        return unflatten_portfolio(read_flat_portfolio_json(file_path))
+
+
+def iter_portfolios(portfolio: Dict) -> Iterator[Dict]:
+    """
+    Yield every portfolio node of the hierarchy, root first (pre-order).
+
+    Uses an explicit stack, so depth is not limited by the recursion limit.
+    """
+    stack = [portfolio]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(node.get("sub_portfolios", [])))
+
+
+def collect_symbols(portfolio: Dict) -> List[str]:
+    """
+    Unique symbols held anywhere in the hierarchy, in first-seen order.
+    """
+    seen: Dict[str, None] = {}
+    for node in iter_portfolios(portfolio):
+        for position in node.get("positions", []):
+            seen.setdefault(position["symbol"], None)
+    return list(seen)
+
+
+def _to_polars(market_data: Any) -> pl.DataFrame:
+    """symbol (String) and price columns of pandas or polars market data."""
+    if isinstance(market_data, pd.DataFrame):
+        market_data = pl.from_pandas(market_data[["symbol", "price"]])
+    elif isinstance(market_data, pl.LazyFrame):
+        market_data = market_data.select("symbol", "price").collect()
+    elif not isinstance(market_data, pl.DataFrame):
+        raise TypeError(f"Expected Pandas or Polars dataframe, got {type(market_data)}")
+    return market_data.select(pl.col("symbol").cast(pl.String), pl.col("price").cast(pl.Float64))
+
+
+def _symbol_metrics_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    One row of metrics per symbol (prices in row order within each symbol).
+
+    Module-level so worker processes can run it on their chunk.
+    """
+    price = pl.col("price")
+    return df.group_by("symbol", maintain_order=True).agg(
+        latest_price=price.last(),
+        volatility=price.pct_change().std(),
+        drawdown=(price / price.cum_max() - 1.0).min(),
+    )
+
+
+def _metrics_dict(frame: pl.DataFrame) -> Dict[str, Dict[str, float]]:
+    columns = [frame[name].to_list() for name in SYMBOL_METRIC_FIELDS]
+    result = {}
+    for symbol, *values in zip(frame["symbol"].to_list(), *columns):
+        # A single observation has no return spread
+        result[symbol] = {
+            name: (0.0 if value is None or (isinstance(value, float) and math.isnan(value)) else value)
+            for name, value in zip(SYMBOL_METRIC_FIELDS, values)
+        }
+    return result
+
+
+def _check_missing(metrics: Dict[str, Dict], symbols: Sequence[str]) -> None:
+    missing = [symbol for symbol in symbols if symbol not in metrics]
+    if missing:
+        raise ValueError(f"No market data for symbols: {missing[:10]}")
+
+
+def compute_symbol_metrics(
+    market_data: Any,
+    symbols: Optional[Sequence[str]] = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Latest price, volatility and max drawdown for every symbol at once.
+
+    One vectorized polars group-by over the rows of the requested symbols:
+    - latest_price: last price (rows are in time order)
+    - volatility: standard deviation of simple returns over the history
+    - drawdown: most negative (price / running peak - 1)
+
+    Args:
+        market_data: pandas or polars DataFrame with 'symbol' and 'price'
+        symbols: Symbols to compute (default: all)
+
+    Returns:
+        Dictionary of symbol -> {"latest_price", "volatility", "drawdown"}
+
+    Raises:
+        ValueError: If a requested symbol has no rows
+    """
+    df = _to_polars(market_data)
+    if symbols is not None:
+        df = df.filter(pl.col("symbol").is_in(list(symbols)))
+    metrics = _metrics_dict(_symbol_metrics_frame(df))
+    if symbols is not None:
+        _check_missing(metrics, symbols)
+    return metrics
+
+
+def compute_symbol_metrics_parallel(
+    market_data: Any,
+    symbols: Sequence[str],
+    use_multiprocessing: bool = True,
+    max_workers: Optional[int] = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    compute_symbol_metrics in symbol chunks on a shared worker pool.
+
+    The rows are split by symbol into a few row-balanced chunks per worker
+    (parallel.chunk_symbols) and each chunk runs the same group-by. Worth
+    it for large universes on machines with spare cores; polars already
+    parallelises a single group-by internally, so small universes are
+    faster with compute_symbol_metrics.
+
+    Args:
+        market_data: pandas or polars DataFrame with 'symbol' and 'price'
+        symbols: Symbols to compute
+        use_multiprocessing: Process pool if True, else thread pool
+        max_workers: Pool size (default: parallel.get_optimal_worker_count)
+
+    Returns:
+        Dictionary of symbol -> {"latest_price", "volatility", "drawdown"}
+    """
+    pool = get_worker_pool("process" if use_multiprocessing else "thread", max_workers)
+    df = _to_polars(market_data).filter(pl.col("symbol").is_in(list(symbols)))
+    partitions = df.partition_by("symbol", as_dict=True, maintain_order=True)
+    frames = {key[0]: frame for key, frame in partitions.items()}
+    _check_missing(frames, symbols)
+
+    names = list(frames)
+    chunks = chunk_symbols([len(frames[name]) for name in names], pool.max_workers, pool.chunks_per_worker)
+    tasks = [pl.concat([frames[names[i]] for i in chunk]) for chunk in chunks]
+    metrics: Dict[str, Dict[str, float]] = {}
+    for frame in pool.run_ordered(_symbol_metrics_frame, tasks):
+        metrics.update(_metrics_dict(frame))
+    return metrics
+
+
+def _position_metrics(position: Dict[str, Any], symbol_metrics: Dict[str, float]) -> Dict[str, Any]:
+    return {
+        "symbol": position["symbol"],
+        "quantity": position["quantity"],
+        "value": position["quantity"] * symbol_metrics["latest_price"],
+        "volatility": symbol_metrics["volatility"],
+        "drawdown": symbol_metrics["drawdown"],
+    }
 
 
 def compute_position_metrics(
@@ -70,9 +260,12 @@ def compute_position_metrics(
 
     Metrics to calculate:
     - value: quantity * latest_price
-    - volatility: rolling standard deviation of returns
+    - volatility: standard deviation of simple returns
     - drawdown: maximum peak-to-trough loss
 
+    For many positions use compute_position_metrics_sequential/_parallel,
+    which compute each distinct symbol once.
+
     Args:
         position: Dictionary with 'symbol' and 'quantity'
         market_data: DataFrame with price data for all symbols
@@ -87,16 +280,8 @@ def compute_position_metrics(
             "drawdown": float
         }
 
-    Expected Implementation:
-        1. Filter market_data for the position's symbol
-        2. Get latest price for value calculation
-        3. Calculate returns from price series
-        4. Compute rolling volatility (std of returns)
-        5. Calculate maximum drawdown
-        6. Return metrics dictionary
-
     Drawdown Formula:
-        drawdown = (peak - current) / peak
+        drawdown = (current - peak) / peak
         max_drawdown = minimum (most negative) drawdown observed
 
     Example:
@@ -111,35 +296,34 @@ def compute_position_metrics(
             "drawdown": -0.10
         }
     """
-    # TODO: Implement position metrics computation
-    # This will be the unit of work for parallel processing
-    raise NotImplementedError("Implement position metrics computation")
+    symbol = position["symbol"]
+    return _position_metrics(position, compute_symbol_metrics(market_data, [symbol])[symbol])
 
 
 def compute_position_metrics_parallel(
     positions: List[Dict],
     market_data: Any,
-    use_multiprocessing: bool = True
+    use_multiprocessing: bool = True,
+    max_workers: Optional[int] = None
 ) -> List[Dict]:
     """
     Compute metrics for multiple positions in parallel.
 
+    The distinct symbols are computed once on the worker pool
+    (compute_symbol_metrics_parallel); positions then only look them up.
+
     Args:
         positions: List of position dictionaries
         market_data: DataFrame with price data for all symbols
-        use_multiprocessing: If True, use ProcessPoolExecutor; else ThreadPoolExecutor
+        use_multiprocessing: If True, use the process pool; else the thread pool
+        max_workers: Pool size (default: parallel.get_optimal_worker_count)
 
     Returns:
-        List of position metrics dictionaries
-
-    Expected Implementation:
-        1. Choose appropriate executor based on use_multiprocessing
-        2. Submit compute_position_metrics for each position
-        3. Collect results
-        4. Return list of metrics
+        List of position metrics dictionaries (same order as positions)
     """
-    # TODO: Implement parallel position metrics computation
-    raise NotImplementedError("Implement parallel position metrics")
+    symbols = list(dict.fromkeys(position["symbol"] for position in positions))
+    metrics = compute_symbol_metrics_parallel(market_data, symbols, use_multiprocessing, max_workers)
+    return [_position_metrics(position, metrics[position["symbol"]]) for position in positions]
 
 
 def compute_position_metrics_sequential(
@@ -149,34 +333,162 @@ def compute_position_metrics_sequential(
     """
     Compute metrics for multiple positions sequentially (for comparison).
 
+    The distinct symbols are computed once in a single group-by.
+
     Args:
         positions: List of position dictionaries
         market_data: DataFrame with price data for all symbols
 
     Returns:
-        List of position metrics dictionaries
+        List of position metrics dictionaries (same order as positions)
+    """
+    symbols = list(dict.fromkeys(position["symbol"] for position in positions))
+    metrics = compute_symbol_metrics(market_data, symbols)
+    return [_position_metrics(position, metrics[position["symbol"]]) for position in positions]
+
+
+def _subtree_reductions(
+    flat: FlatPortfolio,
+    value: np.ndarray,
+    volatility: np.ndarray,
+    drawdown: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Per-node subtree totals from per-position arrays, with segment reductions.
+
+    Positions are first reduced onto their own node (bincount, minimum.at).
+    Levels are then folded into their parents from the deepest up. All
+    nodes of one level are disjoint subtrees that are already complete, so
+    each level is one unbuffered scatter (add.at / minimum.at) instead of
+    one Python call per node.
+    """
+    n = flat.n_nodes
+    # bincount returns integers when there are no positions at all
+    total = np.bincount(flat.position_node, weights=value, minlength=n).astype(np.float64)
+    weighted = np.bincount(flat.position_node, weights=value * volatility, minlength=n).astype(np.float64)
+    worst = np.full(n, np.inf)
+    np.minimum.at(worst, flat.position_node, drawdown)
+
+    order = np.argsort(flat.depth, kind="stable")
+    bounds = np.searchsorted(flat.depth[order], np.arange(int(flat.depth.max()) + 2))
+    for level_depth in range(len(bounds) - 2, 0, -1):
+        level = order[bounds[level_depth]:bounds[level_depth + 1]]
+        parents = flat.parent[level]
+        np.add.at(total, parents, total[level])
+        np.add.at(weighted, parents, weighted[level])
+        np.minimum.at(worst, parents, worst[level])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        volatility_out = np.where(total != 0, weighted / total, 0.0)
+    return {
+        "total_value": total,
+        "aggregate_volatility": volatility_out,
+        # Subtrees without positions have no drawdown
+        "max_drawdown": np.where(np.isinf(worst), 0.0, worst),
+    }
+
+
+def flat_metrics(
+    flat: FlatPortfolio,
+    symbol_metrics: Dict[str, Dict[str, float]]
+) -> Dict[str, np.ndarray]:
+    """
+    Position and subtree metrics of a flattened portfolio, as arrays.
+
+    Args:
+        flat: Result of flatten_portfolio / load_flat_portfolio
+        symbol_metrics: symbol -> {"latest_price", "volatility", "drawdown"}
+
+    Returns:
+        Dictionary of arrays:
+            - per position: value, volatility, drawdown
+            - per node: total_value, aggregate_volatility, max_drawdown
+    """
+    _check_missing(symbol_metrics, flat.symbols)
+    per_symbol = {
+        name: np.array([symbol_metrics[symbol][name] for symbol in flat.symbols], dtype=np.float64)
+        for name in SYMBOL_METRIC_FIELDS
+    }
+    codes = flat.position_symbol
+    volatility = per_symbol["volatility"][codes]
+    drawdown = per_symbol["drawdown"][codes]
+    value = flat.quantity * per_symbol["latest_price"][codes]
+
+    metrics = {"value": value, "volatility": volatility, "drawdown": drawdown}
+    metrics.update(_subtree_reductions(flat, value, volatility, drawdown))
+    return metrics
+
+
+def aggregate_flat(
+    flat: FlatPortfolio,
+    symbol_metrics: Dict[str, Dict[str, float]]
+) -> Dict:
+    """
+    Aggregate a flattened portfolio and rebuild the nested output.
+
+    Args:
+        flat: Result of flatten_portfolio / load_flat_portfolio
+        symbol_metrics: symbol -> {"latest_price", "volatility", "drawdown"}
 
-    Expected Implementation:
-        1. Loop through each position
-        2. Call compute_position_metrics for each
-        3. Collect and return results
+    Returns:
+        Nested portfolio dictionary in the aggregate_portfolio_metrics format
     """
-    # TODO: Implement sequential position metrics computation
-    raise NotImplementedError("Implement sequential position metrics")
+    metrics = flat_metrics(flat, symbol_metrics)
+    symbols = flat.symbols
+
+    # Write back: one output dict per node, then link children in pre-order
+    with gc_paused():
+        totals = metrics["total_value"].tolist()
+        volatilities = metrics["aggregate_volatility"].tolist()
+        drawdowns = metrics["max_drawdown"].tolist()
+        out = [
+            {
+                "name": name,
+                "total_value": totals[i],
+                "aggregate_volatility": volatilities[i],
+                "max_drawdown": drawdowns[i],
+                "positions": [],
+                "sub_portfolios": [],
+            }
+            for i, name in enumerate(flat.names)
+        ]
+        for node, code, quantity, value, vol, dd in zip(
+            flat.position_node.tolist(), flat.position_symbol.tolist(), flat.quantity.tolist(),
+            metrics["value"].tolist(), metrics["volatility"].tolist(), metrics["drawdown"].tolist()
+        ):
+            out[node]["positions"].append({
+                "symbol": symbols[code],
+                "quantity": quantity,
+                "value": value,
+                "volatility": vol,
+                "drawdown": dd,
+            })
+        for child, parent in enumerate(flat.parent.tolist()[1:], start=1):
+            out[parent]["sub_portfolios"].append(out[child])
+    return out[0]
+
+
+def _tree_symbol_metrics(flat: FlatPortfolio, market_data: Any, use_parallel: bool) -> Dict[str, Dict[str, float]]:
+    if use_parallel:
+        return compute_symbol_metrics_parallel(market_data, flat.symbols)
+    return compute_symbol_metrics(market_data, flat.symbols)
 
 
 def aggregate_portfolio_metrics(
     portfolio: Dict,
     market_data: Any,
-    use_parallel: bool = True
+    use_parallel: bool = True,
+    symbol_metrics: Optional[Dict[str, Dict[str, float]]] = None
 ) -> Dict:
     """
-    Recursively aggregate metrics for a portfolio and its sub-portfolios.
+    Aggregate metrics for a portfolio and all of its sub-portfolios.
 
     This function performs:
-    1. Compute metrics for all direct positions (in parallel if enabled)
-    2. Recursively compute metrics for all sub-portfolios
-    3. Aggregate to portfolio level:
+    1. Flatten the tree into parent-index arrays (flatten_portfolio) and
+       collect the unique symbols
+    2. Compute each symbol's metrics once (worker pool if use_parallel,
+       else one vectorized group-by)
+    3. Aggregate bottom-up with per-level segment reductions:
        - total_value = sum of all position values
        - aggregate_volatility = weighted average volatility
        - max_drawdown = worst (most negative) drawdown
@@ -184,7 +496,8 @@ def aggregate_portfolio_metrics(
     Args:
         portfolio: Portfolio structure dictionary
         market_data: DataFrame with price data
-        use_parallel: Whether to use parallel processing for positions
+        use_parallel: Whether to compute symbol metrics on the process pool
+        symbol_metrics: Precomputed symbol -> metrics (skips step 2)
 
     Returns:
         Portfolio dictionary with computed metrics:
@@ -194,22 +507,16 @@ def aggregate_portfolio_metrics(
             "aggregate_volatility": float,
             "max_drawdown": float,
             "positions": List[Dict],  # with computed metrics
-            "sub_portfolios": List[Dict]  # recursively computed
+            "sub_portfolios": List[Dict]  # same format, original order
         }
-
-    Expected Implementation:
-        1. Extract positions from portfolio
-        2. Compute metrics for positions (parallel or sequential)
-        3. If sub_portfolios exist, recursively call this function
-        4. Aggregate metrics:
-           - total_value = sum(position values) + sum(sub_portfolio values)
-           - aggregate_volatility = weighted average by value
-           - max_drawdown = min(all drawdowns) [most negative]
-        5. Return augmented portfolio structure
+        Empty portfolios have total_value 0 and volatility/drawdown 0.
+        No recursion anywhere, so depth is only limited by memory.
 
     Weighted Average Volatility:
         weights = values / total_value
         aggregate_volatility = sum(weights * volatilities)
+        (a sub-portfolio counts with its total_value and aggregate_volatility,
+        which equals weighting all of its positions directly)
 
     Example:
         >>> portfolio = load_portfolio_structure("portfolio.json")
@@ -217,37 +524,138 @@ def aggregate_portfolio_metrics(
         >>> result["total_value"]
         42245.00
     """
-    # TODO: Implement recursive portfolio aggregation
-    # Key: This is a recursive function that traverses the portfolio tree
-    raise NotImplementedError("Implement recursive portfolio aggregation")
+    flat = flatten_portfolio(portfolio)
+    if symbol_metrics is None:
+        symbol_metrics = _tree_symbol_metrics(flat, market_data, use_parallel)
+    return aggregate_flat(flat, symbol_metrics)
 
 
-def save_aggregated_portfolio(portfolio: Dict, output_path: str) -> None:
+def save_aggregated_portfolio(portfolio: Dict, output_path: str, indent: Optional[int] = None) -> None:
     """
     Save the aggregated portfolio with metrics to JSON file.
 
+    Written one node at a time (portfolio_io.write_portfolio_json): the
+    text is what json.dump would write, without its recursion limit.
+
     Args:
         portfolio: Portfolio dictionary with computed metrics
         output_path: Path to save the JSON output
+        indent: As for json.dump. Compact by default: indented text grows
+                with the square of the tree depth
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w") as f:
+        write_portfolio_json(portfolio, f, indent=indent)
+
+
+def aggregate_portfolio_file(
+    input_path: str,
+    market_data: Any,
+    output_path: str,
+    use_parallel: bool = True,
+    indent: Optional[int] = None,
+    symbol_metrics: Optional[Dict[str, Dict[str, float]]] = None
+) -> Path:
+    """
+    Aggregate a portfolio file into an output file, streaming both ends.
+
+    The input (JSON, streamed, or binary) is loaded straight into a
+    FlatPortfolio and the results are written from the metric arrays, so
+    neither the nested input nor the nested output dictionary is built.
+    The output matches save_aggregated_portfolio(aggregate_portfolio_metrics(...)).
+
+    Args:
+        input_path: Portfolio structure file (JSON or binary)
+        market_data: Market data DataFrame
+        output_path: Path of the aggregated JSON output
+        use_parallel: Compute symbol metrics on the worker pool
+        indent: As for json.dump (compact by default, see
+                save_aggregated_portfolio)
+        symbol_metrics: Precomputed symbol -> metrics
+
+    Returns:
+        The output path
+    """
+    flat = load_flat_portfolio(input_path)
+    if symbol_metrics is None:
+        symbol_metrics = _tree_symbol_metrics(flat, market_data, use_parallel)
+    metrics = flat_metrics(flat, symbol_metrics)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w") as f:
+        write_aggregated_flat(flat, metrics, f, indent=indent)
+    return output_path
+
+
+def generate_portfolio_tree(
+    n_nodes: int,
+    symbols: Sequence[str],
+    positions_per_node: int = 3,
+    seed: int = 42
+) -> Dict:
+    """
+    Synthetic portfolio hierarchy for benchmarks.
+
+    Node i > 0 hangs under a uniformly random earlier node (a random
+    recursive tree: wide, depth around log n). Every node holds
+    positions_per_node positions in random symbols, so popular symbols
+    recur across many sub-portfolios as in real books.
 
-    Expected Implementation:
-        1. Convert portfolio dictionary to JSON string (formatted)
-        2. Write to file
+    Args:
+        n_nodes: Number of portfolio nodes, root included
+        symbols: Symbol universe to draw positions from
+        positions_per_node: Positions per node
+        seed: Random seed
+
+    Returns:
+        Portfolio dictionary in the load_portfolio_structure format
     """
-    # TODO: Implement JSON output
-    raise NotImplementedError("Implement portfolio JSON output")
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(symbols), (n_nodes, positions_per_node))
+    quantities = rng.integers(1, 500, (n_nodes, positions_per_node))
+    parents = [int(rng.integers(0, i)) for i in range(1, n_nodes)]
+
+    nodes = [
+        {
+            "name": f"Portfolio {i}",
+            "positions": [{"symbol": symbols[s], "quantity": int(q)} for s, q in zip(picks[i], quantities[i])],
+            "sub_portfolios": [],
+        }
+        for i in range(n_nodes)
+    ]
+    for child, parent in enumerate(parents, start=1):
+        nodes[parent]["sub_portfolios"].append(nodes[child])
+    return nodes[0]
+
+
+def _portfolios_match(a: Dict, b: Dict, rtol: float = 1e-9) -> bool:
+    for x, y in zip(iter_portfolios(a), iter_portfolios(b)):
+        for key in ("total_value", "aggregate_volatility", "max_drawdown"):
+            if not math.isclose(x[key], y[key], rel_tol=rtol, abs_tol=1e-12):
+                return False
+    return True
 
 
 def compare_sequential_vs_parallel(
     portfolio: Dict,
-    market_data: Any
+    market_data: Any,
+    include_baseline: bool = False
 ) -> Dict[str, Any]:
     """
     Compare performance of sequential vs parallel portfolio aggregation.
 
+    Both paths deduplicate symbols; "sequential" computes them in one
+    group-by, "parallel" in chunks on the shared process pool (started
+    before timing, so only steady-state work is measured).
+
     Args:
         portfolio: Portfolio structure
         market_data: Market data DataFrame
+        include_baseline: Also time the per-position approach (every
+                          position computes its own symbol metrics, as
+                          many times as the symbol is held)
 
     Returns:
         Dictionary with comparison results:
@@ -255,15 +663,43 @@ def compare_sequential_vs_parallel(
             "sequential_time": float,
             "parallel_time": float,
             "speedup": float,
-            "results_match": bool
+            "results_match": bool,
+            "n_portfolios": int,
+            "n_positions": int,
+            "n_symbols": int,
+            "baseline_time": float,           # only with include_baseline
+            "dedup_speedup": float            # baseline / sequential
         }
-
-    Expected Implementation:
-        1. Time sequential aggregation
-        2. Time parallel aggregation
-        3. Verify results match
-        4. Calculate speedup
-        5. Return comparison metrics
     """
-    # TODO: Implement performance comparison
-    raise NotImplementedError("Implement sequential vs parallel comparison")
+    get_worker_pool("process").warm_up()
+
+    start = time.perf_counter()
+    sequential = aggregate_portfolio_metrics(portfolio, market_data, use_parallel=False)
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = aggregate_portfolio_metrics(portfolio, market_data, use_parallel=True)
+    parallel_time = time.perf_counter() - start
+
+    nodes = list(iter_portfolios(portfolio))
+    comparison = {
+        "sequential_time": sequential_time,
+        "parallel_time": parallel_time,
+        "speedup": sequential_time / parallel_time,
+        "results_match": _portfolios_match(sequential, parallel),
+        "n_portfolios": len(nodes),
+        "n_positions": sum(len(node.get("positions", [])) for node in nodes),
+        "n_symbols": len(collect_symbols(portfolio)),
+    }
+
+    if include_baseline:
+        positions = [p for node in nodes for p in node.get("positions", [])]
+        df = _to_polars(market_data)
+        start = time.perf_counter()
+        for position in positions:
+            compute_position_metrics(position, df)
+        baseline_time = time.perf_counter() - start
+        comparison["baseline_time"] = baseline_time
+        comparison["dedup_speedup"] = baseline_time / sequential_time
+
+    return comparison
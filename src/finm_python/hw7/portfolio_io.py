@@ -0,0 +1,941 @@
+"""
+Portfolio Structure I/O Module for HW7: Parallel Computing
+
+json.load builds the whole nested dictionary before anything can be
+computed, and both json.load and json.dump recurse once per nesting level,
+so a hierarchy thousands of portfolios deep cannot be read or written at
+all. This module reads and writes portfolio files without either problem:
+
+- A flat representation (FlatPortfolio): nodes in pre-order with
+  parent-index arrays, and positions as columns (node, symbol code,
+  quantity). This is what aggregation works on, and it holds no nested
+  dictionaries.
+- A streaming JSON reader: iter_portfolio_events walks the file chunk by
+  chunk with an explicit stack and yields one event per portfolio and per
+  position. The structure is parsed here; each position (and any other
+  value) is decoded by the C json scanner. read_flat_portfolio_json builds
+  a FlatPortfolio straight from the events.
+- A streaming JSON writer: PortfolioJSONWriter emits one portfolio and one
+  position at a time. Its output is byte-for-byte what json.dump writes
+  for the same nested dictionary, at any depth.
+- A binary format (stdlib struct header + little-endian numpy columns +
+  one UTF-8 string blob) that loads with a handful of np.frombuffer calls.
+
+Only the fields aggregation uses are kept in the flat form: each node's
+name, each position's symbol and quantity. Positions are stored grouped
+by node in pre-order, whatever order the file lists them in.
+
+Usage:
+    flat = read_flat_portfolio_json("portfolio.json")   # streaming
+    save_portfolio_binary(flat, "portfolio.pfb")
+    flat = load_portfolio_binary("portfolio.pfb")
+    nested = unflatten_portfolio(flat)
+"""
+
+import gc
+import json
+import re
+import struct
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from json.decoder import scanstring
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+import numpy as np
+
+
+BINARY_MAGIC = b"PFB1"
+# magic, quantity dtype (0 = int64, 1 = float64), n_nodes, n_positions, n_symbols
+_BINARY_HEADER = struct.Struct("<4sB3xQQQ")
+_QUANTITY_DTYPES = ("<i8", "<f8")
+CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Fast paths for the common tokens: [,] "key": and [,] {  (keys without escapes)
+_MEMBER_KEY = re.compile(r'[ \t\n\r]*(,?)[ \t\n\r]*"([^"\\\x00-\x1f]*)"[ \t\n\r]*:')
+_ARRAY_OBJECT = re.compile(r"[ \t\n\r]*(,?)[ \t\n\r]*\{")
+_DECODER = json.JSONDecoder()
+_STRUCTURE_KEYS = ("positions", "sub_portfolios")
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """
+    Suspend the cyclic garbage collector while building large trees.
+
+    Allocating millions of dicts triggers repeated full collections that
+    rescan everything built so far; the trees built here hold no cycles,
+    so nothing is lost by collecting once afterwards instead.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+# ----------------------------------------------------------------------
+# Flat representation
+# ----------------------------------------------------------------------
+
+@dataclass
+class FlatPortfolio:
+    """
+    A portfolio hierarchy flattened into arrays, nodes in pre-order.
+
+    Pre-order puts every parent before its children (parent[i] < i) and
+    keeps siblings in their original order.
+
+    Attributes:
+        names: Name of each node; names[0] is the root
+        parent: Index of each node's parent (-1 for the root)
+        depth: Depth of each node (0 for the root)
+        position_node: Index of the node holding each position
+                       (non-decreasing: positions are grouped by node)
+        position_symbol: Index into symbols of each position's symbol
+        quantity: Quantity of each position (int64, or float64 if any
+                  quantity is fractional)
+        symbols: Distinct symbols, in order of first appearance
+    """
+    names: List[str]
+    parent: np.ndarray
+    depth: np.ndarray
+    position_node: np.ndarray
+    position_symbol: np.ndarray
+    quantity: np.ndarray
+    symbols: List[str]
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.names)
+
+    @property
+    def n_positions(self) -> int:
+        return len(self.position_node)
+
+
+class _FlatBuilder:
+    """Accumulates nodes and positions in pre-order, then packs the arrays."""
+
+    def __init__(self):
+        self.names: List[Any] = []
+        self.parent: List[int] = []
+        self.depth: List[int] = []
+        self.position_node: List[int] = []
+        self.position_symbol: List[int] = []
+        self.quantity: List[Any] = []
+        self.symbol_codes: Dict[str, int] = {}
+
+    def add_node(self, name: Any, parent: int, depth: int) -> int:
+        self.names.append(name)
+        self.parent.append(parent)
+        self.depth.append(depth)
+        return len(self.names) - 1
+
+    def add_positions(self, node: int, positions: List[Dict]) -> None:
+        codes = self.symbol_codes
+        for position in positions:
+            symbol = position["symbol"]
+            code = codes.get(symbol)
+            if code is None:
+                code = codes[symbol] = len(codes)
+            self.position_symbol.append(code)
+            self.quantity.append(position["quantity"])
+        self.position_node.extend([node] * len(positions))
+
+    def build(self) -> FlatPortfolio:
+        position_node = np.array(self.position_node, dtype=np.int64)
+        position_symbol = np.array(self.position_symbol, dtype=np.int64)
+        quantity = np.array(self.quantity) if self.quantity else np.zeros(0, dtype=np.int64)
+        if quantity.dtype.kind not in "iuf":
+            raise ValueError("Position quantities must be numbers")
+        if quantity.dtype.kind != "f":
+            quantity = quantity.astype(np.int64, copy=False)
+
+        # Files may list a node's positions after its sub-portfolios
+        if len(position_node) and (np.diff(position_node) < 0).any():
+            order = np.argsort(position_node, kind="stable")
+            position_node, position_symbol, quantity = position_node[order], position_symbol[order], quantity[order]
+
+        return FlatPortfolio(
+            names=self.names,
+            parent=np.array(self.parent, dtype=np.int64),
+            depth=np.array(self.depth, dtype=np.int64),
+            position_node=position_node,
+            position_symbol=position_symbol,
+            quantity=quantity,
+            symbols=list(self.symbol_codes),
+        )
+
+
+def flatten_portfolio(portfolio: Dict) -> FlatPortfolio:
+    """
+    Flatten a nested portfolio with an explicit stack (no recursion).
+
+    Any depth works: the stack lives on the heap, so a chain of 10k
+    sub-portfolios costs the same per node as a wide, shallow tree.
+
+    Args:
+        portfolio: Portfolio structure dictionary
+
+    Returns:
+        FlatPortfolio with nodes in pre-order
+
+    Time Complexity: O(nodes + positions)
+    """
+    builder = _FlatBuilder()
+    stack = [(portfolio, -1, 0)]
+    with gc_paused():
+        while stack:
+            node, parent_index, node_depth = stack.pop()
+            index = builder.add_node(node.get("name", ""), parent_index, node_depth)
+            builder.add_positions(index, node.get("positions", []))
+            # Reversed so the first child is popped (and numbered) first
+            stack.extend((child, index, node_depth + 1) for child in reversed(node.get("sub_portfolios", [])))
+    return builder.build()
+
+
+def unflatten_portfolio(flat: FlatPortfolio) -> Dict:
+    """
+    Rebuild the nested load_portfolio_structure dictionary (no recursion).
+
+    Returns:
+        {"name", "positions": [{"symbol", "quantity"}], "sub_portfolios"}
+        for every node
+    """
+    symbols = flat.symbols
+    with gc_paused():
+        out = [{"name": name, "positions": [], "sub_portfolios": []} for name in flat.names]
+        for node, code, quantity in zip(
+            flat.position_node.tolist(), flat.position_symbol.tolist(), flat.quantity.tolist()
+        ):
+            out[node]["positions"].append({"symbol": symbols[code], "quantity": quantity})
+        for child, parent in enumerate(flat.parent.tolist()[1:], start=1):
+            out[parent]["sub_portfolios"].append(out[child])
+    return out[0]
+
+
+# ----------------------------------------------------------------------
+# Streaming JSON reader
+# ----------------------------------------------------------------------
+
+class _JSONStream:
+    """
+    A text buffer over a file that refills itself as tokens are consumed.
+
+    Values are decoded with the json module's C scanner. A value that
+    fails to decode or ends exactly at the end of the buffer (a number
+    may continue in the next chunk) is retried after reading more.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.consumed = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.consumed += self.pos
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"{message} at character {self.consumed + self.pos}")
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of file)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expecting {char!r}")
+        self.pos += 1
+
+    def try_value(self) -> Tuple[bool, Any]:
+        """Decode the next value if it is complete in the current buffer."""
+        try:
+            value, end = _DECODER.raw_decode(self.buf, self.pos)
+        except ValueError:
+            return False, None
+        if end == len(self.buf) and not self.eof:
+            return False, None
+        self.pos = end
+        return True, value
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            complete, value = self.try_value()
+            if complete:
+                return value
+            if not self.fill():
+                # Decode once more for the real error (or a value ending at EOF)
+                try:
+                    value, self.pos = _DECODER.raw_decode(self.buf, self.pos)
+                except ValueError as exc:
+                    raise self.error(f"Invalid value ({exc.args[0]})") from None
+                return value
+
+    def key(self) -> str:
+        if self.peek() != '"':
+            raise self.error("Expecting property name enclosed in double quotes")
+        while True:
+            try:
+                key, self.pos = scanstring(self.buf, self.pos + 1)
+                return key
+            except ValueError as exc:
+                if not self.fill():
+                    raise self.error(f"Invalid property name ({exc.args[0]})") from None
+
+
+def iter_portfolio_events(
+    file_path: str,
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[Tuple]:
+    """
+    Stream a portfolio JSON file as events, without loading the document.
+
+    Only the current chunk of text and the open portfolios (one stack
+    entry each) are held in memory, and no recursion is involved, so file
+    size and depth are bounded by neither memory for the whole document
+    nor the recursion limit.
+
+    Events, in document order:
+        ("start_portfolio", depth)
+        ("field", key, value)        # keys other than positions/sub_portfolios
+        ("position", position_dict)
+        ("end_portfolio", depth)
+
+    Args:
+        file_path: Path to a portfolio JSON file
+        chunk_size: Characters read per refill
+
+    Raises:
+        ValueError: If the file is not a well-formed portfolio document
+    """
+    with open(file_path) as f:
+        stream = _JSONStream(f, chunk_size)
+        if stream.peek() != "{":
+            raise stream.error("Expecting portfolio object")
+        stream.pos += 1
+        yield ("start_portfolio", 0)
+
+        # Frames: [in_sub_portfolios_array, first_item, depth]
+        stack = [[False, True, 0]]
+        while stack:
+            frame = stack[-1]
+            in_array, first, depth = frame
+
+            if in_array:
+                match = _ARRAY_OBJECT.match(stream.buf, stream.pos)
+                if match is not None and (match.group(1) == "") == first:
+                    stream.pos = match.end()
+                else:
+                    char = stream.peek()
+                    if char == "]":
+                        stream.pos += 1
+                        stack.pop()
+                        continue
+                    if not first:
+                        stream.expect(",")
+                    stream.expect("{")
+                frame[1] = False
+                stack.append([False, True, depth + 1])
+                yield ("start_portfolio", depth + 1)
+                continue
+
+            match = _MEMBER_KEY.match(stream.buf, stream.pos)
+            if match is not None and (match.group(1) == "") == first:
+                stream.pos = match.end()
+                key = match.group(2)
+            else:
+                char = stream.peek()
+                if char == "}":
+                    stream.pos += 1
+                    stack.pop()
+                    yield ("end_portfolio", depth)
+                    continue
+                if not first:
+                    stream.expect(",")
+                key = stream.key()
+                stream.expect(":")
+            frame[1] = False
+
+            if key == "sub_portfolios":
+                stream.expect("[")
+                stack.append([True, True, depth])
+            elif key == "positions":
+                if stream.peek() != "[":
+                    raise stream.error("Expecting positions array")
+                # Usually the whole array is already buffered: one C decode
+                complete, positions = stream.try_value()
+                if not complete:
+                    positions = None
+                    stream.pos += 1
+                    if stream.peek() == "]":
+                        stream.pos += 1
+                    else:
+                        while True:
+                            yield ("position", stream.value())
+                            separator = stream.peek()
+                            if separator not in (",", "]"):
+                                raise stream.error("Expecting ',' or ']'")
+                            stream.pos += 1
+                            if separator == "]":
+                                break
+                for position in positions or ():
+                    yield ("position", position)
+            else:
+                yield ("field", key, stream.value())
+
+        if stream.peek():
+            raise stream.error("Extra data")
+
+
+def read_flat_portfolio_json(file_path: str, chunk_size: int = CHUNK_SIZE) -> FlatPortfolio:
+    """
+    Stream a portfolio JSON file straight into a FlatPortfolio.
+
+    The nested dictionary is never built; memory holds the flat columns
+    plus one chunk of text.
+
+    Args:
+        file_path: Path to a portfolio JSON file
+        chunk_size: Characters read per refill
+
+    Returns:
+        FlatPortfolio, equal to flatten_portfolio(json.load(file))
+    """
+    builder = _FlatBuilder()
+    open_nodes: List[int] = []
+    with gc_paused():
+        for event in iter_portfolio_events(file_path, chunk_size):
+            kind = event[0]
+            if kind == "position":
+                builder.add_positions(open_nodes[-1], (event[1],))
+            elif kind == "start_portfolio":
+                parent = open_nodes[-1] if open_nodes else -1
+                open_nodes.append(builder.add_node("", parent, event[1]))
+            elif kind == "end_portfolio":
+                open_nodes.pop()
+            elif event[1] == "name":
+                builder.names[open_nodes[-1]] = event[2]
+    return builder.build()
+
+
+# ----------------------------------------------------------------------
+# Streaming JSON writer
+# ----------------------------------------------------------------------
+
+_FLOAT_SPECIAL = {"nan": "NaN", "inf": "Infinity", "-inf": "-Infinity"}
+
+
+def _encode_float(value: float) -> str:
+    text = float.__repr__(value)
+    return _FLOAT_SPECIAL.get(text, text)
+
+
+# Exact-type dispatch for the common case; subclasses go through _encode_scalar
+_SCALAR_ENCODERS = {
+    str: json.encoder.encode_basestring_ascii,
+    float: _encode_float,
+    int: int.__repr__,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null",
+}
+
+
+def _encode_scalar(value: Any) -> Optional[str]:
+    """JSON text of a scalar exactly as json.dumps writes it (None if not scalar)."""
+    encode = _SCALAR_ENCODERS.get(type(value))
+    if encode is not None:
+        return encode(value)
+    if isinstance(value, str):
+        return json.encoder.encode_basestring_ascii(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return _encode_float(value)
+    return None
+
+
+class PortfolioJSONWriter:
+    """
+    Incremental JSON writer for (aggregated) portfolio hierarchies.
+
+    Call start_portfolio, then write_position for its positions, then
+    start_portfolio/end_portfolio for each sub-portfolio, then
+    end_portfolio. Every node gets "positions" and "sub_portfolios" keys
+    after its fields, and the text matches json.dump(portfolio, f,
+    indent=indent) byte for byte.
+
+    Usage:
+        with open(path, "w") as f, PortfolioJSONWriter(f, indent=2) as writer:
+            writer.start_portfolio({"name": "Main", "total_value": 10.0})
+            writer.write_position({"symbol": "AAPL", "quantity": 1})
+            writer.end_portfolio()
+    """
+
+    # Node states: fields written, positions array open, sub-portfolios array open
+    _FIELDS, _POSITIONS, _SUBS = range(3)
+
+    # Indentation and key text are cached for levels shallower than this;
+    # deeper levels are sliced from one shared prefix, so memory stays
+    # linear in depth (indented text itself grows with depth squared)
+    CACHED_LEVELS = 64
+
+    def __init__(self, file: TextIO, indent: Optional[int] = None,
+                 buffer_parts: int = 4096, buffer_chars: int = 1 << 20):
+        self.file = file
+        self.indent = indent
+        self.buffer_parts = buffer_parts
+        self.buffer_chars = buffer_chars
+        self._item_separator = ", " if indent is None else ","
+        self._parts: List[str] = []
+        # Characters of uncached indentation buffered since the last flush
+        self._pending = 0
+        self._pad = "\n"
+        self._newlines: Dict[int, str] = {}
+        self._keys: Dict[Tuple[int, str], str] = {}
+        self._key_names: Dict[str, str] = {}
+        self._started = False
+        # Per open node: [state, items in the open array, keys written]
+        self._stack: List[List[int]] = []
+
+    def _newline(self, level: int) -> str:
+        if self.indent is None:
+            return ""
+        text = self._newlines.get(level)
+        if text is None:
+            width = 1 + self.indent * level
+            if len(self._pad) < width:
+                self._pad = "\n" + " " * max(width - 1, 2 * (len(self._pad) - 1))
+            text = self._pad[:width]
+            if level < self.CACHED_LEVELS:
+                self._newlines[level] = text
+            else:
+                self._pending += width
+        return text
+
+    def _key_text(self, level: int, key: str) -> str:
+        """Newline, indentation and encoded key, cached per shallow (level, key)."""
+        text = self._keys.get((level, key))
+        if text is None:
+            name = self._key_names.get(key)
+            if name is None:
+                name = self._key_names[key] = f"{_encode_scalar(key)}: "
+            text = self._newline(level) + name
+            if level < self.CACHED_LEVELS:
+                self._keys[(level, key)] = text
+        return text
+
+    def _encode(self, value: Any, level: int) -> str:
+        encode = _SCALAR_ENCODERS.get(type(value))
+        if encode is not None:
+            return encode(value)
+        text = _encode_scalar(value)
+        if text is not None:
+            return text
+        if isinstance(value, dict) and value and all(type(k) is str for k in value):
+            key_text = self._key_text
+            items = []
+            for key, item in value.items():
+                encode = _SCALAR_ENCODERS.get(type(item))
+                items.append(key_text(level + 1, key) + (encode(item) if encode else self._encode(item, level + 1)))
+            return "{" + self._item_separator.join(items) + self._newline(level) + "}"
+        # Anything else (lists, nested values) via json, re-indented
+        return json.dumps(value, indent=self.indent).replace("\n", self._newline(level))
+
+    def _key(self, node: List[int], level: int, key: str) -> None:
+        if node[2]:
+            self._parts.append(self._item_separator)
+        node[2] += 1
+        self._parts.append(self._key_text(level, key))
+
+    def _close_array(self, node: List[int], level: int) -> None:
+        self._parts.append(self._newline(level) + "]" if node[1] else "]")
+
+    def _open_sub_portfolios(self, node: List[int], level: int) -> None:
+        if node[0] == self._FIELDS:
+            self._key(node, level, "positions")
+            self._parts.append("[]")
+        elif node[0] == self._POSITIONS:
+            self._close_array(node, level)
+        self._key(node, level, "sub_portfolios")
+        self._parts.append("[")
+        node[0], node[1] = self._SUBS, 0
+
+    def _add_item(self, node: List[int], level: int) -> None:
+        if node[1]:
+            self._parts.append(self._item_separator)
+        node[1] += 1
+        self._parts.append(self._newline(level))
+
+    def start_portfolio(self, fields: Dict[str, Any]) -> None:
+        """Open a portfolio; its positions/sub_portfolios keys are ignored."""
+        depth = len(self._stack)
+        if self._stack:
+            parent = self._stack[-1]
+            if parent[0] != self._SUBS:
+                self._open_sub_portfolios(parent, 2 * depth - 1)
+            self._add_item(parent, 2 * depth)
+        elif self._started:
+            raise ValueError("Only one root portfolio can be written")
+        self._started = True
+
+        node = [self._FIELDS, 0, 0]
+        self._parts.append("{")
+        for key, value in fields.items():
+            if key not in _STRUCTURE_KEYS:
+                self._key(node, 2 * depth + 1, key)
+                self._parts.append(self._encode(value, 2 * depth + 1))
+        self._stack.append(node)
+        self._maybe_flush()
+
+    def write_position(self, position: Dict[str, Any]) -> None:
+        """Add a position to the innermost open portfolio."""
+        if not self._stack:
+            raise ValueError("No open portfolio")
+        depth = len(self._stack) - 1
+        node = self._stack[-1]
+        if node[0] == self._SUBS:
+            raise ValueError("Positions must be written before sub-portfolios")
+        if node[0] == self._FIELDS:
+            self._key(node, 2 * depth + 1, "positions")
+            self._parts.append("[")
+            node[0], node[1] = self._POSITIONS, 0
+        self._add_item(node, 2 * depth + 2)
+        self._parts.append(self._encode(position, 2 * depth + 2))
+        self._maybe_flush()
+
+    def end_portfolio(self) -> None:
+        """Close the innermost open portfolio."""
+        if not self._stack:
+            raise ValueError("No open portfolio")
+        depth = len(self._stack) - 1
+        node = self._stack.pop()
+        level = 2 * depth + 1
+        if node[0] != self._SUBS:
+            self._open_sub_portfolios(node, level)
+        self._close_array(node, level)
+        self._parts.append(self._newline(2 * depth) + "}")
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if len(self._parts) >= self.buffer_parts or self._pending >= self.buffer_chars:
+            self.flush()
+
+    def flush(self) -> None:
+        self.file.write("".join(self._parts))
+        self._parts = []
+        self._pending = 0
+
+    def close(self) -> None:
+        """Write out buffered text; raises if portfolios are still open."""
+        if self._stack:
+            raise ValueError(f"{len(self._stack)} portfolio(s) not closed")
+        self.flush()
+
+    def __enter__(self) -> "PortfolioJSONWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+
+
+def write_portfolio_json(portfolio: Dict, file: TextIO, indent: Optional[int] = None) -> None:
+    """
+    Write a nested portfolio dictionary through PortfolioJSONWriter.
+
+    Same text as json.dump(portfolio, file, indent=indent) (for nodes whose
+    positions/sub_portfolios keys come last), at any depth.
+    """
+    writer = PortfolioJSONWriter(file, indent=indent)
+    writer.start_portfolio(portfolio)
+    for position in portfolio.get("positions", []):
+        writer.write_position(position)
+    stack = [iter(portfolio.get("sub_portfolios", []))]
+    while stack:
+        node = next(stack[-1], None)
+        if node is None:
+            stack.pop()
+            writer.end_portfolio()
+            continue
+        writer.start_portfolio(node)
+        for position in node.get("positions", []):
+            writer.write_position(position)
+        stack.append(iter(node.get("sub_portfolios", [])))
+    writer.close()
+
+
+def write_aggregated_flat(
+    flat: FlatPortfolio,
+    metrics: Dict[str, np.ndarray],
+    file: TextIO,
+    indent: Optional[int] = None
+) -> None:
+    """
+    Write aggregated results straight from arrays, node by node.
+
+    Produces the aggregate_portfolio_metrics JSON layout without building
+    the nested output dictionary.
+
+    Args:
+        flat: The aggregated FlatPortfolio
+        metrics: Arrays as returned by portfolio.flat_metrics: per node
+                 total_value, aggregate_volatility, max_drawdown; per
+                 position value, volatility, drawdown
+        file: Text file to write to
+        indent: As for json.dump
+    """
+    writer = PortfolioJSONWriter(file, indent=indent)
+    totals = metrics["total_value"].tolist()
+    volatilities = metrics["aggregate_volatility"].tolist()
+    drawdowns = metrics["max_drawdown"].tolist()
+    symbols = flat.symbols
+    position_columns = zip(
+        flat.position_symbol.tolist(), flat.quantity.tolist(),
+        metrics["value"].tolist(), metrics["volatility"].tolist(), metrics["drawdown"].tolist()
+    )
+    counts = np.bincount(flat.position_node, minlength=flat.n_nodes).tolist()
+
+    open_depth = -1
+    for i, node_depth in enumerate(flat.depth.tolist()):
+        while open_depth >= node_depth:
+            writer.end_portfolio()
+            open_depth -= 1
+        writer.start_portfolio({
+            "name": flat.names[i],
+            "total_value": totals[i],
+            "aggregate_volatility": volatilities[i],
+            "max_drawdown": drawdowns[i],
+        })
+        for _ in range(counts[i]):
+            code, quantity, value, volatility, drawdown = next(position_columns)
+            writer.write_position({
+                "symbol": symbols[code],
+                "quantity": quantity,
+                "value": value,
+                "volatility": volatility,
+                "drawdown": drawdown,
+            })
+        open_depth = node_depth
+    while open_depth >= 0:
+        writer.end_portfolio()
+        open_depth -= 1
+    writer.close()
+
+
+# ----------------------------------------------------------------------
+# Binary format
+# ----------------------------------------------------------------------
+
+def _string_table(strings: List[str]) -> Tuple[np.ndarray, bytes]:
+    encoded = [s.encode() for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return offsets, b"".join(encoded)
+
+
+def _decode_strings(blob: bytes, offsets: np.ndarray) -> List[str]:
+    bounds = offsets.tolist()
+    if blob.isascii():
+        # One decode; slicing str is cheaper than decoding each slice
+        text = blob.decode("ascii")
+        return [text[a:b] for a, b in zip(bounds, bounds[1:])]
+    return [blob[a:b].decode() for a, b in zip(bounds, bounds[1:])]
+
+
+def save_portfolio_binary(portfolio: Union[Dict, FlatPortfolio], output_path: str) -> Path:
+    """
+    Save a portfolio structure in the binary format.
+
+    Layout: a 32-byte struct header (magic, quantity dtype, counts), then
+    little-endian int64 columns parent, depth, position_node,
+    position_symbol, the quantity column (int64 or float64), the name and
+    symbol offset tables, and finally the UTF-8 names and symbols.
+
+    Args:
+        portfolio: Nested portfolio dictionary or FlatPortfolio
+        output_path: Path of the file to write
+
+    Returns:
+        The output path
+    """
+    flat = portfolio if isinstance(portfolio, FlatPortfolio) else flatten_portfolio(portfolio)
+    names = [str(name) for name in flat.names]
+    name_offsets, name_blob = _string_table(names)
+    symbol_offsets, symbol_blob = _string_table(flat.symbols)
+    quantity_kind = 1 if flat.quantity.dtype.kind == "f" else 0
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "wb") as f:
+        f.write(_BINARY_HEADER.pack(BINARY_MAGIC, quantity_kind, flat.n_nodes, flat.n_positions, len(flat.symbols)))
+        for column in (flat.parent, flat.depth, flat.position_node, flat.position_symbol):
+            f.write(np.ascontiguousarray(column, dtype="<i8").tobytes())
+        f.write(np.ascontiguousarray(flat.quantity, dtype=_QUANTITY_DTYPES[quantity_kind]).tobytes())
+        f.write(name_offsets.astype("<i8").tobytes())
+        f.write(symbol_offsets.astype("<i8").tobytes())
+        f.write(name_blob)
+        f.write(symbol_blob)
+    return output_path
+
+
+def load_portfolio_binary(file_path: str) -> FlatPortfolio:
+    """
+    Load a file written by save_portfolio_binary.
+
+    The numeric columns are read-only views of the file's bytes (no
+    per-element work); only the names and symbols are decoded.
+
+    Raises:
+        ValueError: If the file is not a portfolio binary file or is truncated
+    """
+    data = Path(file_path).read_bytes()
+    if len(data) < _BINARY_HEADER.size or not data.startswith(BINARY_MAGIC):
+        raise ValueError(f"Not a portfolio binary file: {file_path}")
+    _, quantity_kind, n_nodes, n_positions, n_symbols = _BINARY_HEADER.unpack_from(data)
+
+    offset = _BINARY_HEADER.size
+    columns = []
+    for dtype, count in (("<i8", n_nodes), ("<i8", n_nodes), ("<i8", n_positions), ("<i8", n_positions),
+                         (_QUANTITY_DTYPES[quantity_kind], n_positions),
+                         ("<i8", n_nodes + 1), ("<i8", n_symbols + 1)):
+        if offset + 8 * count > len(data):
+            raise ValueError(f"Truncated portfolio binary file: {file_path}")
+        columns.append(np.frombuffer(data, dtype=dtype, count=count, offset=offset))
+        offset += 8 * count
+    parent, depth, position_node, position_symbol, quantity, name_offsets, symbol_offsets = columns
+
+    names_end = offset + int(name_offsets[-1])
+    if names_end + int(symbol_offsets[-1]) != len(data):
+        raise ValueError(f"Truncated portfolio binary file: {file_path}")
+    return FlatPortfolio(
+        names=_decode_strings(data[offset:names_end], name_offsets),
+        parent=parent,
+        depth=depth,
+        position_node=position_node,
+        position_symbol=position_symbol,
+        quantity=quantity,
+        symbols=_decode_strings(data[names_end:], symbol_offsets),
+    )
+
+
+def is_portfolio_binary(file_path: str) -> bool:
+    with open(file_path, "rb") as f:
+        return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+def load_flat_portfolio(file_path: str, chunk_size: int = CHUNK_SIZE) -> FlatPortfolio:
+    """Load a binary or JSON portfolio file (JSON is streamed)."""
+    if is_portfolio_binary(file_path):
+        return load_portfolio_binary(file_path)
+    return read_flat_portfolio_json(file_path, chunk_size)
+
+
+# ----------------------------------------------------------------------
+# Benchmark
+# ----------------------------------------------------------------------
+
+def compare_portfolio_formats(portfolio: Dict, directory: str) -> Dict[str, Any]:
+    """
+    Time stdlib json against the streaming reader/writer and the binary format.
+
+    Files are written to `directory`. json.load returns the nested
+    dictionary while the other loaders return a FlatPortfolio, so
+    "json_load_flat" (json.load + flatten_portfolio) is the like-for-like
+    baseline for loading something aggregation can use.
+
+    Args:
+        portfolio: Nested portfolio structure dictionary
+        directory: Directory for the benchmark files
+
+    Returns:
+        Dictionary with:
+        {
+            "json_dump": float,          # json.dump (compact), seconds
+            "stream_write": float,       # write_portfolio_json (compact)
+            "binary_save": float,        # flatten + save_portfolio_binary
+            "json_load": float,          # json.load
+            "json_load_flat": float,     # json.load + flatten_portfolio
+            "stream_load": float,        # read_flat_portfolio_json
+            "binary_load": float,        # load_portfolio_binary
+            "binary_speedup": float,     # json_load_flat / binary_load
+            "json_bytes": int,
+            "binary_bytes": int
+        }
+        The json.dump/json.load fields are None when the hierarchy is too
+        deep for stdlib json (RecursionError).
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    json_path = directory / "portfolio.json"
+    stream_path = directory / "portfolio_stream.json"
+    binary_path = directory / "portfolio.pfb"
+
+    def timed(func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        return result, time.perf_counter() - start
+
+    def json_dump():
+        with open(json_path, "w") as f:
+            json.dump(portfolio, f)
+
+    def stream_write():
+        with open(stream_path, "w") as f:
+            write_portfolio_json(portfolio, f, indent=None)
+
+    def json_load():
+        with open(stream_path) as f:
+            return json.load(f)
+
+    results: Dict[str, Any] = {}
+    try:
+        _, results["json_dump"] = timed(json_dump)
+    except RecursionError:
+        results["json_dump"] = None
+    _, results["stream_write"] = timed(stream_write)
+    _, results["binary_save"] = timed(save_portfolio_binary, portfolio, binary_path)
+
+    try:
+        loaded, results["json_load"] = timed(json_load)
+        _, flatten_time = timed(flatten_portfolio, loaded)
+        del loaded
+        results["json_load_flat"] = results["json_load"] + flatten_time
+    except RecursionError:
+        results["json_load"] = results["json_load_flat"] = None
+    _, results["stream_load"] = timed(read_flat_portfolio_json, stream_path)
+    _, results["binary_load"] = timed(load_portfolio_binary, binary_path)
+
+    baseline = results["json_load_flat"] or results["stream_load"]
+    results["binary_speedup"] = baseline / results["binary_load"]
+    results["json_bytes"] = stream_path.stat().st_size
+    results["binary_bytes"] = binary_path.stat().st_size
+    return results
@@ -16,30 +16,58 @@ TODO: Implement the functions below to complete the reporting functionality.
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import matplotlib.pyplot as plt
+import numpy as np
+
+
+MB = 1024 * 1024
+
+
+def _to_mb(value: Optional[float]) -> Optional[float]:
+    return None if value is None else value / MB
+
+
+def _ratio(numerator: Optional[float], denominator: Optional[float]) -> Optional[float]:
+    if not numerator or not denominator:
+        return None
+    return numerator / denominator
+
+
+def _fmt(value: Optional[float], spec: str = ".3f", suffix: str = "") -> str:
+    return "n/a" if value is None else f"{value:{spec}}{suffix}"
+
 
 def create_performance_summary(
     ingestion_benchmarks: Dict,
     rolling_benchmarks: Dict,
     parallel_benchmarks: Dict,
-    portfolio_benchmarks: Dict
+    portfolio_benchmarks: Dict,
+    resource_usage: Optional[Dict[str, Dict]] = None
 ) -> Dict[str, Any]:
     """
     Create a comprehensive performance summary.
 
+    Sections whose benchmark dictionary is empty are left out, so a partial
+    pipeline run can still be reported.
+
     Args:
-        ingestion_benchmarks: Results from data loading comparison
-        rolling_benchmarks: Results from rolling metrics comparison
-        parallel_benchmarks: Results from threading vs multiprocessing
-        portfolio_benchmarks: Results from portfolio aggregation
+        ingestion_benchmarks: Results from data_loader.benchmark_ingestion
+        rolling_benchmarks: Results from metrics.benchmark_rolling_metrics
+        parallel_benchmarks: Results from parallel.compare_parallel_approaches
+        portfolio_benchmarks: Results from portfolio.compare_sequential_vs_parallel
+        resource_usage: Optional task name -> parallel.measure_resource_usage
+                        result, one per benchmark stage
 
     Returns:
         Dictionary with organized performance summary:
         {
             "data_ingestion": {
-                "pandas": {"time": float, "memory_mb": float},
-                "polars": {"time": float, "memory_mb": float},
+                "pandas": {"time": float, "memory_mb": float,
+                           "peak_rss_mb": float, "alloc_peak_mb": float},
+                "polars": {...},
                 "winner": str,
-                "speedup": float
+                "speedup": float,
+                "memory_ratio": float  # pandas deep size / polars deep size
             },
             "rolling_metrics": {
                 "pandas": {"time": float},
@@ -52,21 +80,122 @@ def create_performance_summary(
                 "threading": {"time": float, "speedup": float},
                 "multiprocessing": {"time": float, "speedup": float},
                 "winner": str
+                # approaches run with monitor=True also carry
+                # "cpu_percent", "peak_rss_mb" and
+                # "cpu_series": {"time": [...], "cpu_percent": [...]}
             },
             "portfolio_aggregation": {
                 "sequential": {"time": float},
                 "parallel": {"time": float},
                 "speedup": float
+            },
+            "resource_usage": {  # only when resource_usage is given
+                task: {"wall_time": float, "cpu_percent": float,
+                       "peak_cpu_percent": float, "peak_rss_mb": float,
+                       "voluntary_switches": int, "involuntary_switches": int,
+                       "read_mb": float, "write_mb": float}
             }
         }
+    """
+    summary: Dict[str, Any] = {}
+
+    if ingestion_benchmarks:
+        libraries = {}
+        for name in ("pandas", "polars"):
+            bench = ingestion_benchmarks[name]
+            libraries[name] = {
+                "time": bench["load_time"],
+                "memory_mb": _to_mb(bench.get("memory_bytes")),
+                "peak_rss_mb": _to_mb(bench.get("peak_rss_bytes")),
+                "alloc_peak_mb": _to_mb(bench.get("alloc_peak_bytes")),
+            }
+        pd_time, pl_time = libraries["pandas"]["time"], libraries["polars"]["time"]
+        summary["data_ingestion"] = {
+            **libraries,
+            "winner": "polars" if pl_time < pd_time else "pandas",
+            "speedup": _ratio(pd_time, pl_time),
+            "memory_ratio": _ratio(ingestion_benchmarks["pandas"].get("memory_bytes"),
+                                   ingestion_benchmarks["polars"].get("memory_bytes")),
+        }
 
-    Expected Implementation:
-        1. Organize benchmark results
-        2. Calculate winners and speedups
-        3. Return structured summary
+    if rolling_benchmarks:
+        pd_time = rolling_benchmarks["pandas_time"]
+        pl_time = rolling_benchmarks["polars_time"]
+        summary["rolling_metrics"] = {
+            "pandas": {"time": pd_time},
+            "polars": {"time": pl_time},
+            "winner": "polars" if pl_time < pd_time else "pandas",
+            "speedup": _ratio(pd_time, pl_time),
+        }
+
+    if parallel_benchmarks:
+        section: Dict[str, Any] = {}
+        for name, bench in parallel_benchmarks.items():
+            section[name] = {"time": bench["time"]}
+            if "speedup" in bench:
+                section[name]["speedup"] = bench["speedup"]
+            usage = bench.get("resources")
+            if usage:
+                section[name]["cpu_percent"] = usage["cpu_percent"]
+                section[name]["peak_rss_mb"] = usage["memory_mb"]
+                section[name]["cpu_series"] = {
+                    "time": usage["timeseries"]["time"],
+                    "cpu_percent": usage["timeseries"]["cpu_percent"],
+                }
+        section["winner"] = min(parallel_benchmarks, key=lambda k: parallel_benchmarks[k]["time"])
+        summary["parallel_processing"] = section
+
+    if portfolio_benchmarks:
+        summary["portfolio_aggregation"] = {
+            "sequential": {"time": portfolio_benchmarks["sequential_time"]},
+            "parallel": {"time": portfolio_benchmarks["parallel_time"]},
+            "speedup": portfolio_benchmarks["speedup"],
+        }
+
+    if resource_usage:
+        summary["resource_usage"] = {
+            task: {
+                "wall_time": usage["execution_time"],
+                "cpu_percent": usage["cpu_percent"],
+                "peak_cpu_percent": usage["peak_cpu_percent"],
+                "peak_rss_mb": usage["memory_mb"],
+                "voluntary_switches": usage["voluntary_switches"],
+                "involuntary_switches": usage["involuntary_switches"],
+                "read_mb": _to_mb(usage["read_bytes"]),
+                "write_mb": _to_mb(usage["write_bytes"]),
+            }
+            for task, usage in resource_usage.items()
+        }
+
+    return summary
+
+
+def generate_memory_table(ingestion: Dict[str, Any]) -> str:
     """
-    # TODO: Implement performance summary creation
-    raise NotImplementedError("Implement performance summary creation")
+    Markdown table of the ingestion memory measurements.
+
+    Args:
+        ingestion: The "data_ingestion" section of the performance summary
+
+    Returns:
+        Markdown table of deep size, peak RSS and Python allocations in MB.
+        The ratio column is pandas / polars (above 1 means polars uses less).
+    """
+    rows = [
+        ("Deep Size (MB)", "memory_mb"),
+        ("Peak RSS During Load (MB)", "peak_rss_mb"),
+        ("Python Allocations (MB)", "alloc_peak_mb"),
+    ]
+    lines = [
+        "| Memory | Pandas | Polars | Pandas / Polars |",
+        "|--------|--------|--------|-----------------|",
+    ]
+    for label, key in rows:
+        pd_value = ingestion["pandas"].get(key)
+        pl_value = ingestion["polars"].get(key)
+        lines.append(f"| {label} | {_fmt(pd_value, '.2f')} | {_fmt(pl_value, '.2f')} "
+                     f"| {_fmt(_ratio(pd_value, pl_value), '.2f', 'x')} |")
+    return "\n".join(lines)
 
 
 def generate_comparison_table(summary: Dict[str, Any]) -> str:
@@ -86,14 +215,96 @@ def generate_comparison_table(summary: Dict[str, Any]) -> str:
         | Memory Usage (MB) | 125.3 | 45.2 | 2.77x |
         | Rolling Metrics (s) | 1.23 | 0.31 | 3.97x |
 
+        | Memory | Pandas | Polars | Pandas / Polars |
+        |--------|--------|--------|-----------------|
+        | Deep Size (MB) | 125.30 | 45.20 | 2.77x |
+        | Peak RSS During Load (MB) | 310.12 | 98.40 | 3.15x |
+        | Python Allocations (MB) | 140.02 | 0.35 | 400.06x |
+
         | Approach | Time (s) | Speedup |
         |----------|----------|---------|
         | Sequential | 5.67 | 1.00x |
         | Threading | 3.21 | 1.77x |
         | Multiprocessing | 1.89 | 3.00x |
+
+        Monitored parallel runs add Avg CPU (%) and Peak RSS (MB) columns,
+        and a summary with "resource_usage" adds one row per benchmark stage
+        (wall time, CPU, peak RSS, context switches, I/O).
     """
-    # TODO: Implement markdown table generation
-    raise NotImplementedError("Implement comparison table generation")
+    tables = []
+
+    library_rows = []
+    ingestion = summary.get("data_ingestion")
+    if ingestion:
+        library_rows.append(
+            f"| Ingestion Time (s) | {ingestion['pandas']['time']:.4f} "
+            f"| {ingestion['polars']['time']:.4f} | {_fmt(ingestion['speedup'], '.2f', 'x')} |"
+        )
+        library_rows.append(
+            f"| Memory Usage (MB) | {_fmt(ingestion['pandas']['memory_mb'], '.2f')} "
+            f"| {_fmt(ingestion['polars']['memory_mb'], '.2f')} "
+            f"| {_fmt(ingestion['memory_ratio'], '.2f', 'x')} |"
+        )
+    rolling = summary.get("rolling_metrics")
+    if rolling:
+        library_rows.append(
+            f"| Rolling Metrics (s) | {rolling['pandas']['time']:.4f} "
+            f"| {rolling['polars']['time']:.4f} | {_fmt(rolling['speedup'], '.2f', 'x')} |"
+        )
+    if library_rows:
+        tables.append("\n".join([
+            "| Metric | Pandas | Polars | Speedup |",
+            "|--------|--------|--------|---------|",
+            *library_rows,
+        ]))
+    if ingestion:
+        tables.append(generate_memory_table(ingestion))
+
+    parallel = summary.get("parallel_processing")
+    if parallel:
+        approaches = {name: bench for name, bench in parallel.items() if name != "winner"}
+        monitored = any("cpu_percent" in bench for bench in approaches.values())
+        if monitored:
+            lines = ["| Approach | Time (s) | Speedup | Avg CPU (%) | Peak RSS (MB) |",
+                     "|----------|----------|---------|-------------|---------------|"]
+        else:
+            lines = ["| Approach | Time (s) | Speedup |", "|----------|----------|---------|"]
+        for name, bench in approaches.items():
+            label = name.replace("_", " ").capitalize()
+            line = f"| {label} | {bench['time']:.4f} | {bench.get('speedup', 1.0):.2f}x |"
+            if monitored:
+                line += (f" {_fmt(bench.get('cpu_percent'), '.0f')} "
+                         f"| {_fmt(bench.get('peak_rss_mb'), '.1f')} |")
+            lines.append(line)
+        tables.append("\n".join(lines))
+
+    portfolio = summary.get("portfolio_aggregation")
+    if portfolio:
+        tables.append("\n".join([
+            "| Portfolio Aggregation | Time (s) | Speedup |",
+            "|-----------------------|----------|---------|",
+            f"| Sequential | {portfolio['sequential']['time']:.4f} | 1.00x |",
+            f"| Parallel | {portfolio['parallel']['time']:.4f} | {portfolio['speedup']:.2f}x |",
+        ]))
+
+    usage = summary.get("resource_usage")
+    if usage:
+        lines = [
+            "| Task | Wall (s) | Avg CPU (%) | Peak CPU (%) | Peak RSS (MB) "
+            "| Ctx Switches (vol / invol) | Read (MB) | Write (MB) |",
+            "|------|----------|-------------|--------------|---------------"
+            "|----------------------------|-----------|------------|",
+        ]
+        for task, row in usage.items():
+            lines.append(
+                f"| {task} | {row['wall_time']:.3f} | {_fmt(row['cpu_percent'], '.0f')} "
+                f"| {_fmt(row['peak_cpu_percent'], '.0f')} | {_fmt(row['peak_rss_mb'], '.1f')} "
+                f"| {_fmt(row['voluntary_switches'], 'd')} / {_fmt(row['involuntary_switches'], 'd')} "
+                f"| {_fmt(row['read_mb'], '.2f')} | {_fmt(row['write_mb'], '.2f')} |"
+            )
+        tables.append("\n".join(lines))
+
+    return "\n\n".join(tables)
 
 
 def plot_performance_comparison(
@@ -103,30 +314,88 @@ def plot_performance_comparison(
     """
     Create bar charts comparing performance metrics.
 
-    Creates visualizations:
+    Creates visualizations (panels for missing summary sections are left out):
     1. Pandas vs Polars comparison (time and memory)
     2. Sequential vs Threading vs Multiprocessing
     3. Overall speedup factors
+    4. CPU utilization over time per parallel approach (monitored runs):
+       a GIL-bound thread pool stays near 100% (one core) while worker
+       processes can reach 100% x workers
 
     Args:
         summary: Performance summary dictionary
         output_path: Path to save the plot
-
-    Expected Implementation:
-        1. Create figure with subplots
-        2. Plot pandas vs polars times and memory
-        3. Plot parallel approach comparison
-        4. Add labels, titles, and legend
-        5. Save to file
-
-    Hints:
-        - Use matplotlib.pyplot for plotting
-        - Consider using seaborn for better aesthetics
-        - Include clear axis labels and titles
-    """
-    # TODO: Implement performance visualization
-    # Hint: Use matplotlib or plotly for charts
-    raise NotImplementedError("Implement performance visualization")
+    """
+    ingestion = summary.get("data_ingestion")
+    rolling = summary.get("rolling_metrics")
+    parallel = summary.get("parallel_processing") or {}
+    approaches = {name: bench for name, bench in parallel.items() if name != "winner"}
+    cpu_series = {name: bench["cpu_series"] for name, bench in approaches.items()
+                  if bench.get("cpu_series")}
+
+    panels = []
+    if ingestion or rolling:
+        panels.append("libraries")
+    if ingestion and ingestion["pandas"].get("memory_mb") is not None:
+        panels.append("memory")
+    if approaches:
+        panels.append("parallel")
+    if cpu_series:
+        panels.append("cpu")
+    if not panels:
+        return
+
+    colors = {"pandas": "#3498db", "polars": "#e67e22"}
+    fig, axes = plt.subplots(1, len(panels), figsize=(6 * len(panels), 5), squeeze=False)
+    for ax, panel in zip(axes[0], panels):
+        if panel == "libraries":
+            stages = [(label, section) for label, section in
+                      (("Ingestion", ingestion), ("Rolling Metrics", rolling)) if section]
+            x = np.arange(len(stages))
+            for offset, library in ((-0.2, "pandas"), (0.2, "polars")):
+                ax.bar(x + offset, [section[library]["time"] for _, section in stages], 0.4,
+                       label=library, color=colors[library])
+            ax.set_xticks(x)
+            ax.set_xticklabels([label for label, _ in stages])
+            ax.set_ylabel("Time (s)")
+            ax.set_title("Pandas vs Polars")
+            ax.legend()
+        elif panel == "memory":
+            rows = [("Deep Size", "memory_mb"), ("Peak RSS", "peak_rss_mb")]
+            x = np.arange(len(rows))
+            for offset, library in ((-0.2, "pandas"), (0.2, "polars")):
+                ax.bar(x + offset, [ingestion[library].get(key) or 0.0 for _, key in rows], 0.4,
+                       label=library, color=colors[library])
+            ax.set_xticks(x)
+            ax.set_xticklabels([label for label, _ in rows])
+            ax.set_ylabel("Memory (MB)")
+            ax.set_title("Ingestion Memory")
+            ax.legend()
+        elif panel == "parallel":
+            names = list(approaches)
+            bars = ax.bar(names, [approaches[name]["time"] for name in names], color="#2ecc71")
+            for bar, name in zip(bars, names):
+                ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height(),
+                        f"{approaches[name].get('speedup', 1.0):.2f}x", ha="center", va="bottom")
+            ax.set_ylabel("Time (s)")
+            ax.set_title("Parallel Approaches (label: speedup vs sequential)")
+            ax.tick_params(axis="x", rotation=20)
+        else:
+            for name, series in cpu_series.items():
+                # Markers keep runs shorter than one sample interval visible
+                ax.plot(series["time"], series["cpu_percent"], "o-", label=name,
+                        linewidth=1.5, markersize=4)
+            ax.axhline(100, color="grey", linestyle="--", linewidth=1, label="one core")
+            ax.set_xlabel("Time since start (s)")
+            ax.set_ylabel("CPU (%)")
+            ax.set_title("CPU Utilization per Approach")
+            ax.legend()
+        ax.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(output_path, dpi=120)
+    plt.close(fig)
 
 
 def plot_rolling_metrics(
@@ -0,0 +1,307 @@
+"""
+Resource Monitoring Module for HW7: Parallel Computing
+
+Wall-clock time alone can't tell a GIL-bound thread pool from real
+parallelism. Both may finish in similar time on a busy machine, but
+only one keeps several cores busy. This module samples the whole process
+tree (this process plus every worker it starts, including grandchildren such
+as forkserver workers) from /proc in a background thread and records:
+
+- CPU%: CPU seconds used by the tree per wall second x 100, so 100 means
+  one core fully busy and 400 means four
+- RSS: resident memory summed over the tree (shared pages, e.g. the
+  shared-memory blocks, are counted once per process that maps them)
+- Context switches: voluntary (blocked: I/O, locks, the GIL) and
+  involuntary (preempted by the scheduler)
+- I/O bytes: bytes actually read from / written to storage
+
+Counters are cumulative per process, so each process is measured against
+its value when first seen (0 for processes started during the run).
+CPU time of a worker that exits between two samples is lost for that
+last interval; pooled workers (parallel.WorkerPool) outlive the run and
+are counted fully.
+
+Note: /proc is Linux-only. Elsewhere only wall time is reported.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+PROC = Path("/proc")
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+# (cpu_seconds, rss_bytes, voluntary_switches, involuntary_switches, read_bytes, write_bytes)
+Counters = Tuple[float, int, int, int, int, int]
+
+SERIES_FIELDS = ("time", "cpu_percent", "rss_mb", "n_processes",
+                 "voluntary_switches", "involuntary_switches", "read_bytes", "write_bytes")
+
+
+def _child_pids(pid: int, proc: Path = PROC) -> List[int]:
+    """Direct children of a process, from /proc/<pid>/task/<tid>/children."""
+    children = []
+    try:
+        for task in (proc / str(pid) / "task").iterdir():
+            try:
+                children.extend(int(c) for c in (task / "children").read_text().split())
+            except OSError:
+                continue
+    except OSError:
+        pass
+    return children
+
+
+def _child_pids_by_scan(proc: Path = PROC) -> Dict[int, List[int]]:
+    """Parent pid -> child pids from every /proc/<pid>/stat (no children files)."""
+    tree: Dict[int, List[int]] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        ppid = int(stat[stat.rindex(")") + 2:].split()[1])
+        tree.setdefault(ppid, []).append(int(entry.name))
+    return tree
+
+
+def process_tree(pid: Optional[int] = None, proc: Path = PROC) -> List[int]:
+    """
+    A process and all of its descendants.
+
+    Uses the kernel's per-thread children lists when available, otherwise
+    one scan of /proc.
+
+    Returns:
+        List of pids, root first
+    """
+    pid = os.getpid() if pid is None else pid
+    if (proc / str(pid) / "task" / str(pid) / "children").exists():
+        children_of = lambda p: _child_pids(p, proc)
+    else:
+        tree = _child_pids_by_scan(proc)
+        children_of = lambda p: tree.get(p, [])
+
+    pids, stack = [], [pid]
+    while stack:
+        current = stack.pop()
+        pids.append(current)
+        stack.extend(children_of(current))
+    return pids
+
+
+def read_process_counters(pid: int, proc: Path = PROC) -> Optional[Counters]:
+    """
+    Cumulative resource counters of one process.
+
+    Returns:
+        (cpu_seconds, rss_bytes, voluntary_switches, involuntary_switches,
+        read_bytes, write_bytes), or None if the process is gone. I/O
+        counters are 0 when /proc/<pid>/io is not readable.
+    """
+    base = proc / str(pid)
+    try:
+        stat = (base / "stat").read_text()
+        status = (base / "status").read_text()
+    except OSError:
+        return None
+
+    # Fields after the parenthesised command name; utime/stime are fields 14/15
+    fields = stat[stat.rindex(")") + 2:].split()
+    cpu_seconds = (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+    values = {}
+    for line in status.splitlines():
+        name, _, value = line.partition(":")
+        if name in ("VmRSS", "voluntary_ctxt_switches", "nonvoluntary_ctxt_switches"):
+            values[name] = int(value.split()[0])
+
+    read_bytes = write_bytes = 0
+    try:
+        for line in (base / "io").read_text().splitlines():
+            name, _, value = line.partition(":")
+            if name == "read_bytes":
+                read_bytes = int(value)
+            elif name == "write_bytes":
+                write_bytes = int(value)
+    except OSError:
+        pass
+
+    return (
+        cpu_seconds,
+        values.get("VmRSS", 0) * 1024,
+        values.get("voluntary_ctxt_switches", 0),
+        values.get("nonvoluntary_ctxt_switches", 0),
+        read_bytes,
+        write_bytes,
+    )
+
+
+class ResourceMonitor:
+    """
+    Background sampler of CPU, RSS, context switches and I/O for a process tree.
+
+    Usage:
+        with ResourceMonitor(interval=0.05) as monitor:
+            run_benchmark()
+        monitor.summary()   # totals and averages
+        monitor.series      # per-sample lists, see SERIES_FIELDS
+
+    Attributes:
+        interval: Seconds between samples
+        pid: Root of the monitored tree (default: this process)
+        series: Dictionary of field -> list of per-sample values. time is
+                seconds since start, cpu_percent covers the interval since
+                the previous sample, rss_mb and n_processes are levels, and
+                the switch and byte fields are cumulative since start
+    """
+
+    def __init__(self, interval: float = 0.05, pid: Optional[int] = None, proc: Path = PROC):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.pid = os.getpid() if pid is None else pid
+        self.proc = proc
+        self.available = (proc / str(self.pid) / "stat").exists()
+        self.series: Dict[str, List[float]] = {name: [] for name in SERIES_FIELDS}
+        self._baseline: Dict[int, Counters] = {}
+        self._latest: Dict[int, Counters] = {}
+        self._start_time = 0.0
+        self._end_time = 0.0
+        self._peak_rss = 0
+        self._cpu_total = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _totals(self) -> Counters:
+        """Sum of each counter's growth since its process was first seen."""
+        totals = [0.0] * 6
+        for pid, counters in self._latest.items():
+            base = self._baseline.get(pid)
+            for i, value in enumerate(counters):
+                # RSS is a level, not a counter
+                totals[i] += value if i == 1 or base is None else value - base[i]
+        return tuple(totals)
+
+    def _read_tree(self) -> List[int]:
+        """Refresh the counters of every live process; returns the live pids."""
+        alive = []
+        own_pid = os.getpid()
+        for pid in process_tree(self.pid, self.proc):
+            counters = read_process_counters(pid, self.proc)
+            if counters is None:
+                continue
+            if pid == own_pid:
+                # /proc CPU times are whole clock ticks (usually 10 ms);
+                # process_time is exact, which matters for short runs
+                counters = (time.process_time(),) + counters[1:]
+            self._latest[pid] = counters
+            alive.append(pid)
+        return alive
+
+    def _sample(self) -> None:
+        now = time.perf_counter()
+        # Processes that exited keep their last counters; only RSS drops out
+        alive = self._read_tree()
+        rss = sum(self._latest[pid][1] for pid in alive)
+
+        cpu, _, voluntary, involuntary, read_bytes, write_bytes = self._totals()
+        series = self.series
+        previous_time = series["time"][-1] if series["time"] else 0.0
+        previous_cpu = self._cpu_total
+        elapsed = now - self._start_time
+        dt = elapsed - previous_time
+        series["time"].append(elapsed)
+        series["cpu_percent"].append(100.0 * (cpu - previous_cpu) / dt if dt > 0 else 0.0)
+        series["rss_mb"].append(rss / (1024 * 1024))
+        series["n_processes"].append(len(alive))
+        series["voluntary_switches"].append(voluntary)
+        series["involuntary_switches"].append(involuntary)
+        series["read_bytes"].append(read_bytes)
+        series["write_bytes"].append(write_bytes)
+        self._cpu_total = cpu
+        self._peak_rss = max(self._peak_rss, rss)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> "ResourceMonitor":
+        self.series = {name: [] for name in SERIES_FIELDS}
+        self._latest = {}
+        self._peak_rss = 0
+        self._cpu_total = 0.0
+        self._start_time = time.perf_counter()
+        if self.available:
+            self._read_tree()
+            self._baseline = dict(self._latest)
+            self._peak_rss = sum(c[1] for c in self._latest.values())
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> "ResourceMonitor":
+        self._end_time = time.perf_counter()
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            # Final sample so short runs still get their totals
+            self._sample()
+        return self
+
+    def __enter__(self) -> "ResourceMonitor":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Totals over the monitored run.
+
+        Returns:
+            Dictionary with:
+            {
+                "wall_time": float,         # seconds
+                "cpu_time": float,          # CPU seconds, whole tree
+                "cpu_percent": float,       # average, 100 = one core
+                "peak_cpu_percent": float,  # highest sampled interval
+                "peak_rss_mb": float,       # highest sampled tree RSS
+                "max_processes": int,
+                "voluntary_switches": int,
+                "involuntary_switches": int,
+                "read_bytes": int,
+                "write_bytes": int,
+                "n_samples": int
+            }
+            CPU, RSS, switch and I/O fields are None without /proc.
+        """
+        wall = self._end_time - self._start_time
+        if not self.available:
+            return {"wall_time": wall, "cpu_time": None, "cpu_percent": None,
+                    "peak_cpu_percent": None, "peak_rss_mb": None, "max_processes": None,
+                    "voluntary_switches": None, "involuntary_switches": None,
+                    "read_bytes": None, "write_bytes": None, "n_samples": 0}
+
+        cpu, _, voluntary, involuntary, read_bytes, write_bytes = self._totals()
+        series = self.series
+        return {
+            "wall_time": wall,
+            "cpu_time": cpu,
+            "cpu_percent": 100.0 * cpu / wall if wall > 0 else 0.0,
+            "peak_cpu_percent": max(series["cpu_percent"], default=0.0),
+            "peak_rss_mb": self._peak_rss / (1024 * 1024),
+            "max_processes": int(max(series["n_processes"], default=1)),
+            "voluntary_switches": int(voluntary),
+            "involuntary_switches": int(involuntary),
+            "read_bytes": int(read_bytes),
+            "write_bytes": int(write_bytes),
+            "n_samples": len(series["time"]),
+        }
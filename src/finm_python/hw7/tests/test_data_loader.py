@@ -12,10 +12,22 @@ TODO: Implement test cases to verify your data_loader implementation.
 """
 
 import pytest
+import polars as pl
 from pathlib import Path
 
-# TODO: Import your data_loader module
-# from finm_python.hw7 import data_loader
+from finm_python.hw7 import data_loader, memory
+
+
+@pytest.fixture
+def market_csv(tmp_path):
+    """Small market data file with the same layout as data/raw/market_data.csv."""
+    path = tmp_path / "market_data.csv"
+    lines = ["timestamp,symbol,price"]
+    for i in range(300):
+        symbol = ("AAPL", "MSFT", "SPY")[i % 3]
+        lines.append(f"2025-11-03T18:26:{i // 10:02d}.{i:06d},{symbol},{100 + i * 0.25:.2f}")
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
 
 
 class TestPandasLoader:
@@ -70,51 +82,124 @@ class TestPolarsLoader:
 class TestSymbolOperations:
     """Tests for symbol extraction and filtering."""
 
-    def test_get_symbols_returns_list(self):
+    def test_get_symbols_returns_list(self, market_csv):
         """Test that get_symbols returns a list."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        df = data_loader.load_with_polars(market_csv)
+        assert isinstance(data_loader.get_symbols(df), list)
 
-    def test_get_symbols_unique_values(self):
+    def test_get_symbols_unique_values(self, market_csv):
         """Test that get_symbols returns unique values."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        for df in (data_loader.load_with_pandas(market_csv),
+                   data_loader.load_with_polars(market_csv),
+                   data_loader.scan_market_data(market_csv)):
+            assert sorted(data_loader.get_symbols(df)) == ["AAPL", "MSFT", "SPY"]
 
-    def test_filter_by_symbol_pandas(self):
+    def test_filter_by_symbol_pandas(self, market_csv):
         """Test filtering pandas DataFrame by symbol."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        df = data_loader.load_with_pandas(market_csv)
+        assert len(data_loader.filter_by_symbol(df, "MSFT")) == 100
 
-    def test_filter_by_symbol_polars(self):
+    def test_filter_by_symbol_polars(self, market_csv):
         """Test filtering polars DataFrame by symbol."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        df = data_loader.load_with_polars(market_csv)
+        assert data_loader.filter_by_symbol(df, "MSFT").height == 100
 
-    def test_filter_returns_only_specified_symbol(self):
+    def test_filter_returns_only_specified_symbol(self, market_csv):
         """Test that filtered data contains only the specified symbol."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        df = data_loader.load_with_polars(market_csv)
+        filtered = data_loader.filter_by_symbol(df, "SPY")
+        assert filtered["symbol"].unique().to_list() == ["SPY"]
+
+
+class TestScanAndPartition:
+    """Tests for lazy scanning and one-pass symbol partitioning."""
+
+    def test_scan_returns_lazyframe_with_types(self, market_csv):
+        """Test that scan_market_data is lazy and applies dtype overrides."""
+        lf = data_loader.scan_market_data(market_csv, float32=True)
+        assert isinstance(lf, pl.LazyFrame)
+        schema = lf.collect_schema()
+        assert schema["timestamp"] == pl.Datetime("us")
+        assert schema["symbol"] == pl.Categorical
+        assert schema["price"] == pl.Float32
+
+    def test_enum_symbols_read_from_schema(self, market_csv):
+        """Test that an Enum symbol dictionary is returned as declared."""
+        lf = data_loader.scan_market_data(market_csv, symbols=["SPY", "AAPL", "MSFT"])
+        assert data_loader.get_symbols(lf) == ["SPY", "AAPL", "MSFT"]
+
+    def test_partition_matches_filter(self, market_csv):
+        """Test that each partition equals filtering the full frame."""
+        for df in (data_loader.load_with_pandas(market_csv),
+                   data_loader.scan_market_data(market_csv).collect()):
+            partitions = data_loader.partition_by_symbol(df)
+            assert sorted(partitions) == ["AAPL", "MSFT", "SPY"]
+            for symbol, frame in partitions.items():
+                expected = data_loader.filter_by_symbol(df, symbol)
+                assert len(frame) == len(expected)
+                assert list(frame["price"]) == list(expected["price"])
+                assert data_loader.filter_by_symbol(partitions, symbol) is frame
+
+    def test_partition_missing_symbol_is_empty(self, market_csv):
+        """Test that an absent symbol gives an empty frame, as filtering does."""
+        for df in (data_loader.load_with_pandas(market_csv),
+                   data_loader.scan_market_data(market_csv).collect()):
+            partitions = data_loader.partition_by_symbol(df)
+            missing = data_loader.filter_by_symbol(partitions, "TSLA")
+            assert len(missing) == len(data_loader.filter_by_symbol(df, "TSLA")) == 0
+            assert list(missing.columns) == list(df.columns)
+
+    def test_partition_writes_hive_parquet(self, market_csv, tmp_path):
+        """Test that partitions can be written as hive-style parquet."""
+        lf = data_loader.scan_market_data(market_csv)
+        paths = data_loader.partition_by_symbol(lf, tmp_path / "parts")
+        assert paths["AAPL"] == tmp_path / "parts" / "symbol=AAPL"
+        back = pl.scan_parquet(tmp_path / "parts", hive_partitioning=True).collect()
+        assert back.height == 300
 
 
 class TestBenchmarking:
     """Tests for benchmarking functionality."""
 
-    def test_benchmark_returns_dict(self):
+    def test_benchmark_returns_dict(self, market_csv):
         """Test that benchmark_ingestion returns a dictionary."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        result = data_loader.benchmark_ingestion(market_csv, trials=2)
+        assert isinstance(result, dict)
 
-    def test_benchmark_contains_pandas_metrics(self):
+    def test_benchmark_contains_pandas_metrics(self, market_csv):
         """Test that benchmark includes pandas metrics."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        result = data_loader.benchmark_ingestion(market_csv, trials=2)
+        for key in ("load_time", "memory_bytes", "peak_rss_bytes", "alloc_peak_bytes"):
+            assert key in result["pandas"]
 
-    def test_benchmark_contains_polars_metrics(self):
+    def test_benchmark_contains_polars_metrics(self, market_csv):
         """Test that benchmark includes polars metrics."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        result = data_loader.benchmark_ingestion(market_csv, trials=2)
+        for key in ("load_time", "memory_bytes", "peak_rss_bytes", "alloc_peak_bytes"):
+            assert key in result["polars"]
 
-    def test_benchmark_times_are_positive(self):
+    def test_benchmark_times_are_positive(self, market_csv):
         """Test that benchmark times are positive numbers."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        result = data_loader.benchmark_ingestion(market_csv, trials=3)
+        for bench in result.values():
+            assert bench["load_time"] > 0
+            assert len(bench["load_times"]) == 3
+
+    def test_memory_is_deep_size(self, market_csv):
+        """Test that memory counts the data, not just the Python wrapper."""
+        df = data_loader.load_with_pandas(market_csv)
+        result = data_loader.benchmark_ingestion(market_csv, trials=1)
+        assert result["pandas"]["memory_bytes"] == memory.deep_size(df)
+        # 300 symbol strings alone are well beyond a bare object header
+        assert result["pandas"]["memory_bytes"] > 300 * 50
+        assert result["polars"]["memory_bytes"] > 300 * 8
+
+    def test_rss_sampler_sees_allocation(self):
+        """Test that the RSS sampler records growth during a large allocation."""
+        if memory.current_rss() is None:
+            pytest.skip("/proc is not available")
+        with memory.RSSSampler(interval=0.0005) as sampler:
+            block = bytearray(64 * 1024 * 1024)
+            block[::4096] = b"x" * len(block[::4096])
+        del block
+        assert sampler.peak_delta >= 32 * 1024 * 1024
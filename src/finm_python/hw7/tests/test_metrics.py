@@ -12,41 +12,77 @@ TODO: Implement test cases to verify your metrics implementation.
 
 import pytest
 import numpy as np
+import pandas as pd
+import polars as pl
+from numpy.lib.stride_tricks import sliding_window_view
 
-# TODO: Import your metrics module
-# from finm_python.hw7 import metrics
+from finm_python.hw7 import metrics
+from finm_python.hw7.data_loader import generate_market_data
+from finm_python.hw7.incremental import IncrementalRollingMetrics
+
+
+WINDOW = 5
+
+
+@pytest.fixture
+def market_df():
+    """Three interleaved symbols, 60 ticks each."""
+    return generate_market_data(3, 180, seed=7)
+
+
+def _symbol_prices(df, symbol):
+    return df.loc[df["symbol"] == symbol, "price"].to_numpy()
 
 
 class TestRollingMetricsPandas:
     """Tests for pandas rolling metric calculations."""
 
-    def test_rolling_ma_calculation(self):
+    def test_rolling_ma_calculation(self, market_df):
         """Test that rolling moving average is calculated correctly."""
-        # TODO: Implement test
-        # Hint: Create small test dataset, compute manually, compare
-        pytest.skip("Implement this test")
+        result = metrics.compute_rolling_metrics_pandas(market_df, window=WINDOW)
+        prices = _symbol_prices(market_df, "S0001")
+        expected = sliding_window_view(prices, WINDOW).mean(axis=1)
+        actual = result.loc[result["symbol"] == "S0001", "rolling_ma"].to_numpy()
+        np.testing.assert_allclose(actual[WINDOW - 1:], expected, rtol=1e-12)
 
-    def test_rolling_std_calculation(self):
+    def test_rolling_std_calculation(self, market_df):
         """Test that rolling standard deviation is calculated correctly."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        result = metrics.compute_rolling_metrics_pandas(market_df, window=WINDOW)
+        prices = _symbol_prices(market_df, "S0002")
+        expected = sliding_window_view(prices, WINDOW).std(axis=1, ddof=1)
+        actual = result.loc[result["symbol"] == "S0002", "rolling_std"].to_numpy()
+        np.testing.assert_allclose(actual[WINDOW - 1:], expected, rtol=1e-9)
 
-    def test_rolling_sharpe_calculation(self):
+    def test_rolling_sharpe_calculation(self, market_df):
         """Test that rolling Sharpe ratio is calculated correctly."""
-        # TODO: Implement test
-        # Hint: Sharpe = mean(returns) / std(returns)
-        pytest.skip("Implement this test")
-
-    def test_output_has_all_columns(self):
+        result = metrics.compute_rolling_metrics_pandas(market_df, window=WINDOW)
+        prices = _symbol_prices(market_df, "S0000")
+        returns = sliding_window_view(prices[1:] / prices[:-1] - 1, WINDOW)
+        expected = returns.mean(axis=1) / returns.std(axis=1, ddof=1)
+        actual = result.loc[result["symbol"] == "S0000", "rolling_sharpe"].to_numpy()
+        np.testing.assert_allclose(actual[WINDOW:], expected, rtol=1e-9)
+
+    def test_output_has_all_columns(self, market_df):
         """Test that output DataFrame has all expected columns."""
-        # TODO: Implement test
-        # Expected: rolling_ma, rolling_std, rolling_sharpe
-        pytest.skip("Implement this test")
+        result = metrics.compute_rolling_metrics_pandas(market_df, window=WINDOW)
+        for column in ("rolling_ma", "rolling_std", "return", "rolling_sharpe"):
+            assert column in result.columns
+        assert result.index.equals(market_df.index)
 
-    def test_first_n_rows_are_nan(self):
+    def test_first_n_rows_are_nan(self, market_df):
         """Test that first (window-1) rows have NaN for rolling metrics."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        result = metrics.compute_rolling_metrics_pandas(market_df, window=WINDOW)
+        for _, group in result.groupby("symbol"):
+            assert group["rolling_ma"].iloc[:WINDOW - 1].isna().all()
+            assert group["rolling_ma"].iloc[WINDOW - 1:].notna().all()
+            assert group["rolling_sharpe"].iloc[:WINDOW].isna().all()
+
+    def test_matches_groupby_transform(self, market_df):
+        """Test that the single-pass version matches the per-group transform."""
+        actual = metrics.compute_rolling_metrics_pandas(market_df, window=WINDOW)
+        expected = metrics.compute_rolling_metrics_pandas_transform(market_df, window=WINDOW)
+        for column in ("rolling_ma", "rolling_std", "return", "rolling_sharpe"):
+            np.testing.assert_allclose(actual[column], expected[column], rtol=1e-8, atol=1e-12)
 
 
 class TestRollingMetricsPolars:
@@ -98,15 +134,60 @@ class TestEdgeCases:
 
     def test_window_larger_than_data(self):
         """Test behavior when window is larger than dataset."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        df = generate_market_data(2, 10, seed=1)
+        result = metrics.compute_rolling_metrics_pandas(df, window=20)
+        assert result["rolling_ma"].isna().all()
+        assert result["rolling_sharpe"].isna().all()
 
     def test_empty_dataframe(self):
         """Test behavior with empty DataFrame."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        df = generate_market_data(2, 10).iloc[:0]
+        result = metrics.compute_rolling_metrics_pandas(df, window=WINDOW)
+        assert len(result) == 0
+        assert "rolling_sharpe" in result.columns
 
     def test_single_value_dataframe(self):
         """Test behavior with single value."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        df = generate_market_data(1, 1)
+        result = metrics.compute_rolling_metrics_pandas(df, window=1)
+        assert result["rolling_ma"].iloc[0] == df["price"].iloc[0]
+        assert np.isnan(result["rolling_std"].iloc[0])
+        assert np.isnan(result["return"].iloc[0])
+
+
+class TestIncrementalMetrics:
+    """Tests for the streaming rolling-metrics engine."""
+
+    @pytest.fixture
+    def polars_df(self):
+        return pl.from_pandas(generate_market_data(4, 2000, seed=11).reset_index())
+
+    def test_replay_matches_batch(self, polars_df):
+        """Test that feeding rows in chunks reproduces the batch polars output."""
+        batch = metrics.compute_rolling_metrics_polars(polars_df, window=WINDOW)
+        engine = IncrementalRollingMetrics(window=WINDOW, resync_every=64)
+        replay = pl.concat([engine.update(polars_df.slice(i, 137))
+                            for i in range(0, polars_df.height, 137)])
+        for column in ("rolling_ma", "rolling_std", "return", "rolling_sharpe"):
+            assert replay[column].null_count() == batch[column].null_count()
+            np.testing.assert_allclose(replay[column].to_numpy(), batch[column].to_numpy(),
+                                       rtol=0, atol=1e-9)
+
+    def test_warmup_rows_are_null(self, polars_df):
+        """Test that metrics stay null until a symbol has a full window."""
+        engine = IncrementalRollingMetrics(window=WINDOW)
+        ma, std, ret, sharpe = engine.update_tick("AAPL", 100.0)
+        assert (ma, std, ret, sharpe) == (None, None, None, None)
+        for price in (101.0, 102.0, 101.5, 103.0):
+            ma, std, ret, sharpe = engine.update_tick("AAPL", price)
+        assert ma == pytest.approx(101.5)
+        assert sharpe is None
+
+    def test_checkpoint_restore_resumes(self, polars_df, tmp_path):
+        """Test that a restored engine continues exactly like the original."""
+        engine = IncrementalRollingMetrics(window=WINDOW)
+        engine.update(polars_df.slice(0, 1500))
+        path = engine.checkpoint(tmp_path / "state.json")
+        restored = IncrementalRollingMetrics.restore(path)
+        rest = polars_df.slice(1500)
+        assert restored.update(rest).equals(engine.update(rest))
@@ -10,98 +10,197 @@ Tests to validate:
 TODO: Implement test cases to verify your parallel processing implementation.
 """
 
+import os
+import time
+
 import pytest
+import numpy as np
+import polars as pl
+
+from finm_python.hw7 import data_loader, parallel
+from finm_python.hw7.data_loader import generate_market_data
+from finm_python.hw7.metrics import compute_rolling_symbol
+
+
+SYMBOLS = ["S0000", "S0001", "S0002", "S0003"]
+
+
+@pytest.fixture(scope="module")
+def market_df():
+    """Four interleaved symbols, pandas layout."""
+    return generate_market_data(4, 2000, seed=3)
 
-# TODO: Import your parallel module
-# from finm_python.hw7 import parallel
+
+@pytest.fixture(scope="module")
+def comparison(market_df):
+    """All approaches run once on the same data."""
+    return parallel.compare_parallel_approaches(
+        market_df, SYMBOLS, compute_rolling_symbol, max_workers=2)
+
+
+def _by_symbol(results):
+    return {frame["symbol"].iloc[0]: frame for frame in results}
 
 
 class TestSequentialProcessing:
     """Tests for sequential (baseline) processing."""
 
-    def test_sequential_returns_results_list(self):
+    def test_sequential_returns_results_list(self, market_df):
         """Test that sequential processing returns a list of results."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        results, _ = parallel.process_symbols_sequential(market_df, SYMBOLS, compute_rolling_symbol)
+        assert isinstance(results, list)
 
-    def test_sequential_returns_execution_time(self):
+    def test_sequential_returns_execution_time(self, market_df):
         """Test that sequential processing returns execution time."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        _, elapsed = parallel.process_symbols_sequential(market_df, SYMBOLS, compute_rolling_symbol)
+        assert elapsed > 0
 
-    def test_sequential_processes_all_symbols(self):
+    def test_sequential_processes_all_symbols(self, market_df):
         """Test that all symbols are processed."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        results, _ = parallel.process_symbols_sequential(market_df, SYMBOLS, compute_rolling_symbol)
+        assert sorted(_by_symbol(results)) == SYMBOLS
 
 
 class TestThreadingProcessing:
     """Tests for threading-based parallel processing."""
 
-    def test_threading_returns_results_list(self):
+    def test_threading_returns_results_list(self, market_df):
         """Test that threading returns a list of results."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        results, _ = parallel.process_symbols_threading(
+            market_df, SYMBOLS, compute_rolling_symbol, max_workers=2)
+        assert isinstance(results, list)
+        assert len(results) == len(SYMBOLS)
 
-    def test_threading_returns_execution_time(self):
+    def test_threading_returns_execution_time(self, market_df):
         """Test that threading returns execution time."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        _, elapsed = parallel.process_symbols_threading(
+            market_df, SYMBOLS, compute_rolling_symbol, max_workers=2)
+        assert elapsed > 0
 
-    def test_threading_matches_sequential_results(self):
+    def test_threading_matches_sequential_results(self, market_df):
         """Test that threading produces same results as sequential."""
-        # TODO: Implement test
-        # Critical: Results should be identical regardless of execution method
-        pytest.skip("Implement this test")
+        expected, _ = parallel.process_symbols_sequential(market_df, SYMBOLS, compute_rolling_symbol)
+        actual, _ = parallel.process_symbols_threading(
+            market_df, SYMBOLS, compute_rolling_symbol, max_workers=2)
+        for exp, act in zip(expected, actual):
+            np.testing.assert_array_equal(act["rolling_ma"], exp["rolling_ma"])
 
-    def test_threading_with_custom_workers(self):
+    def test_threading_with_custom_workers(self, market_df):
         """Test threading with custom number of workers."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        results, _ = parallel.process_symbols_threading(
+            market_df, SYMBOLS, compute_rolling_symbol, max_workers=3)
+        assert [frame["symbol"].iloc[0] for frame in results] == SYMBOLS
 
 
 class TestMultiprocessingProcessing:
     """Tests for multiprocessing-based parallel processing."""
 
-    def test_multiprocessing_returns_results_list(self):
+    def test_multiprocessing_returns_results_list(self, market_df):
         """Test that multiprocessing returns a list of results."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        results, _ = parallel.process_symbols_multiprocessing(
+            market_df, SYMBOLS, compute_rolling_symbol, max_workers=2)
+        assert isinstance(results, list)
+        assert len(results) == len(SYMBOLS)
 
-    def test_multiprocessing_returns_execution_time(self):
+    def test_multiprocessing_returns_execution_time(self, market_df):
         """Test that multiprocessing returns execution time."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        _, elapsed = parallel.process_symbols_multiprocessing(
+            market_df, SYMBOLS, compute_rolling_symbol, max_workers=2)
+        assert elapsed > 0
 
-    def test_multiprocessing_matches_sequential_results(self):
+    def test_multiprocessing_matches_sequential_results(self, market_df):
         """Test that multiprocessing produces same results as sequential."""
-        # TODO: Implement test
-        # Critical: Results should be identical regardless of execution method
-        pytest.skip("Implement this test")
-
-    def test_multiprocessing_with_custom_workers(self):
+        expected, _ = parallel.process_symbols_sequential(market_df, SYMBOLS, compute_rolling_symbol)
+        actual, _ = parallel.process_symbols_multiprocessing(
+            market_df, SYMBOLS, compute_rolling_symbol, max_workers=2)
+        expected, actual = _by_symbol(expected), _by_symbol(actual)
+        for symbol in SYMBOLS:
+            np.testing.assert_array_equal(actual[symbol]["rolling_ma"], expected[symbol]["rolling_ma"])
+
+    def test_multiprocessing_with_custom_workers(self, market_df):
         """Test multiprocessing with custom number of workers."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        results, _ = parallel.process_symbols_multiprocessing(
+            market_df, SYMBOLS, compute_rolling_symbol, max_workers=3)
+        assert sorted(_by_symbol(results)) == SYMBOLS
+
+    def test_multiprocessing_missing_symbol_matches_sequential(self, market_df):
+        """Test that a symbol with no rows gives the same empty result as sequential."""
+        symbols = SYMBOLS + ["ZZZ"]
+        expected, _ = parallel.process_symbols_sequential(market_df, symbols, compute_rolling_symbol)
+        actual, _ = parallel.process_symbols_multiprocessing(
+            market_df, symbols, compute_rolling_symbol, max_workers=2)
+        assert len(actual[-1]) == len(expected[-1]) == 0
+        assert list(actual[-1].columns) == list(expected[-1].columns)
+
+
+class TestSharedMemoryProcessing:
+    """Tests for the shared-memory multiprocessing path."""
+
+    def test_shared_memory_matches_sequential(self, market_df):
+        """Test that shared-memory results match per-symbol sequential results."""
+        expected, _ = parallel.process_symbols_sequential(market_df, SYMBOLS, compute_rolling_symbol)
+        actual, elapsed = parallel.process_symbols_shared_memory(
+            market_df, SYMBOLS, max_workers=2, window=20)
+        assert elapsed > 0
+        assert [frame["symbol"].iloc[0] for frame in actual] == SYMBOLS
+        expected = _by_symbol(expected)
+        for frame in actual:
+            reference = expected[frame["symbol"].iloc[0]]
+            assert frame.index.equals(reference.index)
+            for column in ("rolling_ma", "rolling_std", "return", "rolling_sharpe"):
+                np.testing.assert_allclose(frame[column], reference[column], rtol=1e-12)
+
+    def test_shared_memory_polars_input(self, market_df):
+        """Test that polars frames come back as polars with null warm-up rows."""
+        df = pl.from_pandas(market_df.reset_index())
+        results, _ = parallel.process_symbols_shared_memory(df, SYMBOLS[:2], max_workers=2, window=20)
+        assert all(isinstance(frame, pl.DataFrame) for frame in results)
+        assert results[0]["rolling_ma"].null_count() == 19
+
+    def test_shared_memory_blocks_released(self, market_df):
+        """Test that no shared-memory segments outlive the call."""
+        from pathlib import Path
+        shm_dir = Path("/dev/shm")
+        if not shm_dir.is_dir():
+            pytest.skip("/dev/shm is not available")
+        before = set(shm_dir.iterdir())
+        parallel.process_symbols_shared_memory(market_df, SYMBOLS, max_workers=2, window=20)
+        assert set(shm_dir.iterdir()) <= before
+
+    def test_comparison_includes_shared_memory(self, market_df):
+        """Test that compare_parallel_approaches reports the shared-memory speedups."""
+        comparison = parallel.compare_parallel_approaches(
+            market_df, SYMBOLS, compute_rolling_symbol, max_workers=2)
+        assert "speedup_vs_multiprocessing" in comparison["shared_memory"]
+        assert comparison["shared_memory"]["speedup"] > 0
 
 
 class TestResultsConsistency:
     """Tests to ensure all approaches produce consistent results."""
 
-    def test_all_approaches_same_result_count(self):
+    def test_all_approaches_same_result_count(self, comparison):
         """Test that all approaches return same number of results."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        assert {len(bench["results"]) for bench in comparison.values()} == {len(SYMBOLS)}
 
-    def test_all_approaches_same_symbol_order(self):
+    def test_all_approaches_same_symbol_order(self, comparison):
         """Test that results can be mapped back to correct symbols."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        for bench in comparison.values():
+            assert [frame["symbol"].iloc[0] for frame in bench["results"]] == SYMBOLS
 
-    def test_numerical_values_match(self):
+    def test_numerical_values_match(self, comparison):
         """Test that computed metrics match across approaches."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        expected = comparison["sequential"]["results"]
+        for name in ("threading", "multiprocessing"):
+            for exp, act in zip(expected, comparison[name]["results"]):
+                np.testing.assert_array_equal(act["rolling_std"], exp["rolling_std"])
+
+    def test_window_reaches_every_approach(self, market_df):
+        """Test that a custom window is used by every approach, not just one."""
+        comparison = parallel.compare_parallel_approaches(
+            market_df, SYMBOLS, compute_rolling_symbol, max_workers=2, window=5)
+        expected = compute_rolling_symbol(market_df, SYMBOLS[0], window=5)["rolling_ma"]
+        for bench in comparison.values():
+            np.testing.assert_allclose(bench["results"][0]["rolling_ma"], expected, rtol=1e-12)
 
 
 class TestPerformanceCharacteristics:
@@ -124,5 +223,129 @@ class TestPerformanceCharacteristics:
 
     def test_optimal_worker_count_positive(self):
         """Test that optimal worker count is a positive integer."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        count = parallel.get_optimal_worker_count()
+        assert isinstance(count, int)
+        assert count >= 1
+        # A budget larger than any machine's memory still leaves one worker
+        assert parallel.get_optimal_worker_count(memory_per_worker=1 << 62) == 1
+
+
+class TestWorkerPool:
+    """Tests for the persistent pool, chunking and resource limits."""
+
+    def test_chunks_cover_every_symbol_once(self):
+        """Test that chunking neither drops nor repeats symbols."""
+        sizes = [5, 1000, 3, 3, 40, 7, 0, 600]
+        chunks = parallel.chunk_symbols(sizes, n_workers=2)
+        assert sorted(i for chunk in chunks for i in chunk) == list(range(len(sizes)))
+
+    def test_chunks_largest_first(self):
+        """Test that the biggest symbols are scheduled first, alone."""
+        sizes = [10] * 20 + [5000]
+        chunks = parallel.chunk_symbols(sizes, n_workers=2)
+        assert chunks[0] == [20]
+        totals = [sum(sizes[i] for i in chunk) for chunk in chunks]
+        assert totals == sorted(totals, reverse=True)
+
+    def test_results_follow_symbol_list_order(self, market_df):
+        """Test that results come back in symbol_list order despite chunking."""
+        order = SYMBOLS[::-1]
+        with parallel.WorkerPool(max_workers=2, kind="thread", chunks_per_worker=1) as pool:
+            results = pool.map_symbols(market_df, order, compute_rolling_symbol)
+        assert [frame["symbol"].iloc[0] for frame in results] == order
+
+    def test_pool_is_reused_across_calls(self, market_df):
+        """Test that the shared pool keeps one executor for repeated calls."""
+        pool = parallel.get_worker_pool("process", 2)
+        parallel.process_symbols_multiprocessing(market_df, SYMBOLS, compute_rolling_symbol, max_workers=2)
+        executor = pool.executor
+        parallel.process_symbols_multiprocessing(market_df, SYMBOLS, compute_rolling_symbol, max_workers=2)
+        assert parallel.get_worker_pool("process", 2) is pool
+        assert pool.executor is executor
+
+    def test_missing_symbol_gets_empty_frame(self, market_df):
+        """Test that symbols with no rows map to empty frames on both pool kinds."""
+        partitions = data_loader.partition_by_symbol(market_df)
+        symbols = ["ZZZ"] + SYMBOLS
+        assert parallel.symbol_row_counts(partitions, ["ZZZ"]) == [0]
+        for kind in ("thread", "process"):
+            for df in (market_df, partitions):
+                results = parallel.get_worker_pool(kind, 2).map_symbols(df, symbols, compute_rolling_symbol)
+                assert len(results[0]) == 0
+                assert [frame["symbol"].iloc[0] for frame in results[1:]] == SYMBOLS
+
+    def test_multiprocessing_polars_input(self, market_df):
+        """Test that polars frames run in worker processes without hanging."""
+        df = pl.from_pandas(market_df.reset_index())
+        results, _ = parallel.process_symbols_multiprocessing(
+            df, SYMBOLS, compute_rolling_symbol, max_workers=2)
+        assert [frame["symbol"][0] for frame in results] == SYMBOLS
+
+    def test_invalid_kind_rejected(self):
+        """Test that unknown pool kinds raise."""
+        with pytest.raises(ValueError):
+            parallel.WorkerPool(kind="gpu")
+
+    def test_cgroup_v2_quota(self, tmp_path):
+        """Test that a cgroup v2 quota of 1.5 CPUs allows 2 workers."""
+        (tmp_path / "cpu.max").write_text("150000 100000\n")
+        assert parallel._cgroup_cpu_limit(tmp_path) == 2
+        (tmp_path / "cpu.max").write_text("max 100000\n")
+        assert parallel._cgroup_cpu_limit(tmp_path) is None
+
+    def test_cgroup_v1_quota(self, tmp_path):
+        """Test that cgroup v1 quotas are read and -1 means unlimited."""
+        (tmp_path / "cpu").mkdir()
+        (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+        (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("300000\n")
+        assert parallel._cgroup_cpu_limit(tmp_path) == 3
+        (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("-1\n")
+        assert parallel._cgroup_cpu_limit(tmp_path) is None
+
+    def test_cgroup_memory_limit_caps_available(self, tmp_path):
+        """Test that headroom under the cgroup memory limit caps available memory."""
+        (tmp_path / "memory.max").write_text("1000000\n")
+        (tmp_path / "memory.current").write_text("400000\n")
+        assert parallel._available_memory(tmp_path) == 600000
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+    return "done"
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="needs /proc")
+class TestResourceMonitoring:
+    """Tests for the /proc sampling monitor behind measure_resource_usage."""
+
+    def test_returns_result_and_summary(self):
+        """Test that the function result and the summary fields come back."""
+        usage = parallel.measure_resource_usage(_busy, 0.2, sample_interval=0.02)
+        assert usage["result"] == "done"
+        assert usage["execution_time"] >= 0.2
+        assert usage["memory_mb"] > 0
+        assert usage["n_samples"] >= 5
+        assert len(usage["timeseries"]["cpu_percent"]) == usage["n_samples"]
+
+    def test_busy_loop_uses_about_one_core(self):
+        """Test that a pure-Python loop reports close to 100% CPU."""
+        usage = parallel.measure_resource_usage(_busy, 0.3, sample_interval=0.05)
+        assert 70 <= usage["cpu_percent"] <= 130
+
+    def test_child_workers_are_counted(self, market_df):
+        """Test that worker processes appear in the monitored tree."""
+        pool = parallel.get_worker_pool("process", 2)
+        usage = parallel.measure_resource_usage(
+            parallel.process_symbols_multiprocessing,
+            market_df, SYMBOLS, compute_rolling_symbol, pool=pool, sample_interval=0.01)
+        assert usage["max_processes"] > 1
+
+    def test_comparison_monitor_adds_resources(self, market_df):
+        """Test that monitor=True attaches resources to every approach."""
+        comparison = parallel.compare_parallel_approaches(
+            market_df, SYMBOLS, compute_rolling_symbol, max_workers=2, monitor=True)
+        for bench in comparison.values():
+            assert "cpu_percent" in bench["resources"]
+            assert "result" not in bench["resources"]
@@ -6,139 +6,401 @@ Tests to validate:
 - Position metric calculations
 - Recursive aggregation
 - Parallel vs sequential equivalence
+- Streaming JSON and binary portfolio I/O
 
-TODO: Implement test cases to verify your portfolio aggregation implementation.
 """
 
 import pytest
+import io
 import json
+import math
+import tracemalloc
 
-# TODO: Import your portfolio module
-# from finm_python.hw7 import portfolio
+import pandas as pd
+import polars as pl
+
+from finm_python.hw7 import portfolio, portfolio_io
+from finm_python.hw7.data_loader import generate_market_data
+
+
+# Known prices: AAA peaks at 120 then falls to 90 (drawdown -25%)
+PRICES = {
+    "AAA": [100.0, 120.0, 90.0, 110.0],
+    "BBB": [50.0, 51.0, 52.0, 53.0],
+    "CCC": [10.0, 10.0, 5.0, 8.0],
+}
+
+STRUCTURE = {
+    "name": "Main Portfolio",
+    "positions": [{"symbol": "AAA", "quantity": 10}, {"symbol": "BBB", "quantity": 20}],
+    "sub_portfolios": [
+        {
+            "name": "Child",
+            "positions": [{"symbol": "CCC", "quantity": 100}],
+            "sub_portfolios": [
+                {"name": "Grandchild", "positions": [{"symbol": "AAA", "quantity": 1}], "sub_portfolios": []}
+            ],
+        }
+    ],
+}
+
+
+@pytest.fixture
+def market_df():
+    """Interleaved pandas market data with known prices."""
+    rows = [(symbol, price) for i in range(4) for symbol, prices in PRICES.items() for price in [prices[i]]]
+    return pd.DataFrame(rows, columns=["symbol", "price"])
+
+
+@pytest.fixture
+def portfolio_file(tmp_path):
+    path = tmp_path / "portfolio_structure.json"
+    path.write_text(json.dumps(STRUCTURE))
+    return path
+
+
+def _chain(depth):
+    """A portfolio nested `depth` levels deep, one position per level."""
+    root = leaf = {"name": "L0", "positions": [{"symbol": "AAA", "quantity": 1}], "sub_portfolios": []}
+    for level in range(1, depth):
+        child = {"name": f"L{level}", "positions": [{"symbol": "CCC", "quantity": 1}], "sub_portfolios": []}
+        leaf["sub_portfolios"].append(child)
+        leaf = child
+    return root
+
+
+def _volatility(prices):
+    returns = pd.Series(prices).pct_change().dropna()
+    return returns.std()
 
 
 class TestPortfolioLoading:
     """Tests for portfolio structure loading."""
 
-    def test_load_returns_dict(self):
+    def test_load_returns_dict(self, portfolio_file):
         """Test that load_portfolio_structure returns a dictionary."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        assert isinstance(portfolio.load_portfolio_structure(portfolio_file), dict)
 
-    def test_portfolio_has_name(self):
+    def test_portfolio_has_name(self, portfolio_file):
         """Test that portfolio structure has 'name' field."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        assert portfolio.load_portfolio_structure(portfolio_file)["name"] == "Main Portfolio"
 
-    def test_portfolio_has_positions(self):
+    def test_portfolio_has_positions(self, portfolio_file):
         """Test that portfolio structure has 'positions' list."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        assert len(portfolio.load_portfolio_structure(portfolio_file)["positions"]) == 2
 
-    def test_portfolio_has_sub_portfolios(self):
+    def test_portfolio_has_sub_portfolios(self, portfolio_file):
         """Test that portfolio structure has 'sub_portfolios' list."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        assert portfolio.load_portfolio_structure(portfolio_file)["sub_portfolios"][0]["name"] == "Child"
 
 
 class TestPositionMetrics:
     """Tests for individual position metric calculations."""
 
-    def test_position_value_calculation(self):
+    def test_position_value_calculation(self, market_df):
         """Test that position value = quantity * latest_price."""
-        # TODO: Implement test
-        # Create test data where you know the expected value
-        pytest.skip("Implement this test")
+        metrics = portfolio.compute_position_metrics({"symbol": "AAA", "quantity": 10}, market_df)
+        assert metrics["value"] == pytest.approx(1100.0)
 
-    def test_position_volatility_calculation(self):
+    def test_position_volatility_calculation(self, market_df):
         """Test that volatility is calculated correctly."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        metrics = portfolio.compute_position_metrics({"symbol": "AAA", "quantity": 10}, market_df)
+        assert metrics["volatility"] == pytest.approx(_volatility(PRICES["AAA"]))
 
-    def test_position_drawdown_calculation(self):
+    def test_position_drawdown_calculation(self, market_df):
         """Test that max drawdown is calculated correctly."""
-        # TODO: Implement test
-        # Hint: Create price series with known peak and trough
-        pytest.skip("Implement this test")
+        metrics = portfolio.compute_position_metrics({"symbol": "AAA", "quantity": 10}, market_df)
+        assert metrics["drawdown"] == pytest.approx(-0.25)
+        bbb = portfolio.compute_position_metrics({"symbol": "BBB", "quantity": 1}, market_df)
+        assert bbb["drawdown"] == 0.0
 
-    def test_position_metrics_return_dict(self):
+    def test_position_metrics_return_dict(self, market_df):
         """Test that compute_position_metrics returns a dictionary."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        assert isinstance(portfolio.compute_position_metrics({"symbol": "BBB", "quantity": 1}, market_df), dict)
 
-    def test_position_metrics_has_all_fields(self):
+    def test_position_metrics_has_all_fields(self, market_df):
         """Test that result has symbol, quantity, value, volatility, drawdown."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        metrics = portfolio.compute_position_metrics({"symbol": "BBB", "quantity": 1}, market_df)
+        assert set(metrics) == {"symbol", "quantity", "value", "volatility", "drawdown"}
 
 
 class TestParallelPositionProcessing:
     """Tests for parallel position metric computation."""
 
-    def test_parallel_returns_list(self):
+    def test_parallel_returns_list(self, market_df):
         """Test that parallel processing returns a list."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        assert isinstance(portfolio.compute_position_metrics_parallel(STRUCTURE["positions"], market_df), list)
 
-    def test_parallel_processes_all_positions(self):
+    def test_parallel_processes_all_positions(self, market_df):
         """Test that all positions are processed."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        positions = STRUCTURE["positions"] + [{"symbol": "AAA", "quantity": 3}]
+        results = portfolio.compute_position_metrics_parallel(positions, market_df, use_multiprocessing=False)
+        assert [r["symbol"] for r in results] == ["AAA", "BBB", "AAA"]
+        assert results[2]["value"] == pytest.approx(330.0)
 
-    def test_parallel_matches_sequential(self):
+    def test_parallel_matches_sequential(self, market_df):
         """Test that parallel results match sequential results."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        positions = [{"symbol": s, "quantity": 5} for s in PRICES]
+        assert (portfolio.compute_position_metrics_parallel(positions, market_df)
+                == portfolio.compute_position_metrics_sequential(positions, market_df))
 
 
 class TestRecursiveAggregation:
     """Tests for recursive portfolio aggregation."""
 
-    def test_aggregation_returns_dict(self):
+    def test_aggregation_returns_dict(self, market_df):
         """Test that aggregation returns a dictionary."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        assert isinstance(portfolio.aggregate_portfolio_metrics(STRUCTURE, market_df, use_parallel=False), dict)
 
-    def test_total_value_is_sum_of_positions(self):
+    def test_total_value_is_sum_of_positions(self, market_df):
         """Test that total_value equals sum of position values."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        result = portfolio.aggregate_portfolio_metrics(STRUCTURE, market_df, use_parallel=False)
+        grandchild = result["sub_portfolios"][0]["sub_portfolios"][0]
+        assert grandchild["total_value"] == pytest.approx(110.0)
 
-    def test_total_value_includes_sub_portfolios(self):
+    def test_total_value_includes_sub_portfolios(self, market_df):
         """Test that total_value includes sub-portfolio values."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        result = portfolio.aggregate_portfolio_metrics(STRUCTURE, market_df, use_parallel=False)
+        # 10 x 110 + 20 x 53 + 100 x 8 + 1 x 110
+        assert result["total_value"] == pytest.approx(3070.0)
 
-    def test_aggregate_volatility_is_weighted_average(self):
+    def test_aggregate_volatility_is_weighted_average(self, market_df):
         """Test that aggregate volatility is weighted by value."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        result = portfolio.aggregate_portfolio_metrics(STRUCTURE, market_df, use_parallel=False)
+        values = {"AAA": 1100.0 + 110.0, "BBB": 1060.0, "CCC": 800.0}
+        expected = sum(v * _volatility(PRICES[s]) for s, v in values.items()) / sum(values.values())
+        assert result["aggregate_volatility"] == pytest.approx(expected)
 
-    def test_max_drawdown_is_worst_case(self):
+    def test_max_drawdown_is_worst_case(self, market_df):
         """Test that max_drawdown is the most negative drawdown."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        result = portfolio.aggregate_portfolio_metrics(STRUCTURE, market_df, use_parallel=False)
+        assert result["max_drawdown"] == pytest.approx(-0.5)  # CCC: 10 -> 5
 
-    def test_nested_sub_portfolios_aggregated(self):
+    def test_nested_sub_portfolios_aggregated(self, market_df):
         """Test that deeply nested sub-portfolios are handled."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        result = portfolio.aggregate_portfolio_metrics(STRUCTURE, market_df, use_parallel=False)
+        child = result["sub_portfolios"][0]
+        assert child["total_value"] == pytest.approx(910.0)
+        assert child["sub_portfolios"][0]["max_drawdown"] == pytest.approx(-0.25)
 
 
 class TestJSONOutput:
     """Tests for JSON export functionality."""
 
-    def test_save_creates_file(self):
+    def test_save_creates_file(self, market_df, tmp_path):
         """Test that save_aggregated_portfolio creates a file."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        result = portfolio.aggregate_portfolio_metrics(STRUCTURE, market_df, use_parallel=False)
+        portfolio.save_aggregated_portfolio(result, tmp_path / "out" / "aggregated.json")
+        assert (tmp_path / "out" / "aggregated.json").exists()
 
-    def test_saved_json_is_valid(self):
+    def test_saved_json_is_valid(self, market_df, tmp_path):
         """Test that saved file contains valid JSON."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        result = portfolio.aggregate_portfolio_metrics(STRUCTURE, market_df, use_parallel=False)
+        portfolio.save_aggregated_portfolio(result, tmp_path / "aggregated.json")
+        assert json.loads((tmp_path / "aggregated.json").read_text()) == result
 
-    def test_saved_json_preserves_structure(self):
+    def test_saved_json_preserves_structure(self, market_df, tmp_path):
         """Test that saved JSON maintains portfolio hierarchy."""
-        # TODO: Implement test
-        pytest.skip("Implement this test")
+        result = portfolio.aggregate_portfolio_metrics(STRUCTURE, market_df, use_parallel=False)
+        portfolio.save_aggregated_portfolio(result, tmp_path / "aggregated.json")
+        loaded = json.loads((tmp_path / "aggregated.json").read_text())
+        assert loaded["sub_portfolios"][0]["sub_portfolios"][0]["name"] == "Grandchild"
+
+
+class TestSymbolDeduplication:
+    """Tests for computing each symbol once across the tree."""
+
+    def test_collect_symbols_unique(self):
+        """Test that symbols held in several sub-portfolios are listed once."""
+        assert portfolio.collect_symbols(STRUCTURE) == ["AAA", "BBB", "CCC"]
+
+    def test_symbol_metrics_polars_input(self, market_df):
+        """Test that polars and pandas inputs give the same metrics."""
+        expected = portfolio.compute_symbol_metrics(market_df)
+        assert portfolio.compute_symbol_metrics(pl.from_pandas(market_df)) == expected
+
+    def test_missing_symbol_raises(self, market_df):
+        """Test that positions without market data are reported."""
+        with pytest.raises(ValueError, match="ZZZ"):
+            portfolio.compute_symbol_metrics(market_df, ["AAA", "ZZZ"])
+
+    def test_generated_tree_size(self):
+        """Test that the generated tree has the requested number of nodes."""
+        tree = portfolio.generate_portfolio_tree(500, ["AAA", "BBB"], positions_per_node=2)
+        assert sum(1 for _ in portfolio.iter_portfolios(tree)) == 500
+
+    def test_compare_sequential_vs_parallel(self):
+        """Test that both paths agree on a generated tree."""
+        df = generate_market_data(20, 5000, seed=1)
+        tree = portfolio.generate_portfolio_tree(300, [f"S{i:04d}" for i in range(20)])
+        comparison = portfolio.compare_sequential_vs_parallel(tree, df, include_baseline=True)
+        assert comparison["results_match"]
+        assert comparison["n_portfolios"] == 300
+        assert comparison["n_symbols"] == 20
+        assert comparison["speedup"] > 0 and comparison["dedup_speedup"] > 0
+
+
+class TestIterativeTraversal:
+    """Tests for the flattened, non-recursive aggregation."""
+
+    def test_flatten_parents_precede_children(self):
+        """Test that nodes are numbered in pre-order with parent indices."""
+        flat = portfolio.flatten_portfolio(STRUCTURE)
+        assert flat.names == [n["name"] for n in portfolio.iter_portfolios(STRUCTURE)]
+        assert flat.parent.tolist() == [-1, 0, 1]
+        assert flat.depth.tolist() == [0, 1, 2]
+        assert flat.position_node.tolist() == [0, 0, 1, 2]
+        assert [flat.symbols[c] for c in flat.position_symbol] == ["AAA", "BBB", "CCC", "AAA"]
+
+    def test_sibling_order_preserved(self, market_df):
+        """Test that sub-portfolios come back in their original order."""
+        tree = {"name": "Root", "positions": [], "sub_portfolios": [
+            {"name": f"Child{i}", "positions": [{"symbol": "AAA", "quantity": i}], "sub_portfolios": []}
+            for i in range(5)
+        ]}
+        result = portfolio.aggregate_portfolio_metrics(tree, market_df, use_parallel=False)
+        assert [c["name"] for c in result["sub_portfolios"]] == [f"Child{i}" for i in range(5)]
+        assert result["total_value"] == pytest.approx(10 * 110.0)
+
+    def test_deep_chain_beyond_recursion_limit(self, market_df):
+        """Test that a 10,000-level chain aggregates without recursion."""
+        depth = 10_000
+        result = portfolio.aggregate_portfolio_metrics(_chain(depth), market_df, use_parallel=False)
+        assert result["total_value"] == pytest.approx(110.0 + 8.0 * (depth - 1))
+        assert result["max_drawdown"] == pytest.approx(-0.5)
+
+        node = result
+        for _ in range(depth - 1):
+            node = node["sub_portfolios"][0]
+        assert node["name"] == f"L{depth - 1}"
+        assert node["total_value"] == pytest.approx(8.0)
+
+
+class TestStreamingIO:
+    """Tests for streaming JSON and binary portfolio files."""
+
+    def test_events_in_document_order(self, portfolio_file):
+        """Test that the reader yields portfolios and positions in order."""
+        events = list(portfolio_io.iter_portfolio_events(portfolio_file))
+        assert events[:4] == [
+            ("start_portfolio", 0),
+            ("field", "name", "Main Portfolio"),
+            ("position", {"symbol": "AAA", "quantity": 10}),
+            ("position", {"symbol": "BBB", "quantity": 20}),
+        ]
+        assert [e[0] for e in events].count("start_portfolio") == 3
+        assert events[-1] == ("end_portfolio", 0)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+    def test_stream_matches_json_load(self, tmp_path, chunk_size):
+        """Test that streaming gives json.load's tree for any chunk size."""
+        tree = portfolio.generate_portfolio_tree(200, ["AAA", "BBB", "Ünï"], seed=3)
+        tree["sub_portfolios"][0]["positions"].append({"symbol": "AAA", "quantity": 2.5})
+        path = tmp_path / "tree.json"
+        path.write_text(json.dumps(tree, indent=2))
+        flat = portfolio_io.read_flat_portfolio_json(path, chunk_size=chunk_size)
+        assert portfolio_io.unflatten_portfolio(flat) == json.loads(path.read_text())
+
+    def test_keys_in_any_order(self, tmp_path):
+        """Test that positions listed after sub-portfolios stay with their node."""
+        path = tmp_path / "reordered.json"
+        path.write_text('{"sub_portfolios": [{"positions": [{"quantity": 1, "symbol": "BBB"}], "name": "C"}],'
+                        ' "positions": [{"symbol": "AAA", "quantity": 3}], "name": "Root"}')
+        flat = portfolio_io.read_flat_portfolio_json(path)
+        assert flat.names == ["Root", "C"]
+        assert flat.position_node.tolist() == [0, 1]
+        assert [flat.symbols[c] for c in flat.position_symbol] == ["AAA", "BBB"]
+
+    @pytest.mark.parametrize("text", ['[]', '{"positions": [{"symbol": "A", "quantity": 1}', '{"name": "x"} 1',
+                                      '{"sub_portfolios": [{"name": }]}'])
+    def test_malformed_json_raises(self, tmp_path, text):
+        """Test that malformed documents raise ValueError."""
+        path = tmp_path / "bad.json"
+        path.write_text(text)
+        with pytest.raises(ValueError):
+            portfolio_io.read_flat_portfolio_json(path)
+
+    @pytest.mark.parametrize("indent", [2, None])
+    def test_writer_matches_json_dump(self, market_df, indent):
+        """Test that the streaming writer reproduces json.dump byte for byte."""
+        result = portfolio.aggregate_portfolio_metrics(STRUCTURE, market_df, use_parallel=False)
+        buffer = io.StringIO()
+        portfolio_io.write_portfolio_json(result, buffer, indent=indent)
+        assert buffer.getvalue() == json.dumps(result, indent=indent)
+
+    def test_aggregate_portfolio_file(self, market_df, portfolio_file, tmp_path):
+        """Test that file-to-file aggregation writes the same output as save."""
+        expected = portfolio.aggregate_portfolio_metrics(STRUCTURE, market_df, use_parallel=False)
+        portfolio.save_aggregated_portfolio(expected, tmp_path / "saved.json")
+        out = portfolio.aggregate_portfolio_file(portfolio_file, market_df, tmp_path / "streamed.json",
+                                                 use_parallel=False)
+        assert out.read_text() == (tmp_path / "saved.json").read_text()
+
+    def test_binary_round_trip(self, tmp_path):
+        """Test that the binary format restores the same structure."""
+        tree = portfolio.generate_portfolio_tree(300, ["AAA", "BBB", "Ünï"], seed=5)
+        path = portfolio_io.save_portfolio_binary(tree, tmp_path / "tree.pfb")
+        flat = portfolio_io.load_portfolio_binary(path)
+        assert portfolio_io.unflatten_portfolio(flat) == tree
+        assert portfolio.load_portfolio_structure(path) == tree
+
+    def test_binary_rejects_other_files(self, portfolio_file, tmp_path):
+        """Test that non-binary and truncated files are rejected."""
+        with pytest.raises(ValueError, match="Not a portfolio binary"):
+            portfolio_io.load_portfolio_binary(portfolio_file)
+        path = portfolio_io.save_portfolio_binary(STRUCTURE, tmp_path / "s.pfb")
+        path.write_bytes(path.read_bytes()[:-3])
+        with pytest.raises(ValueError, match="Truncated"):
+            portfolio_io.load_portfolio_binary(path)
+
+    def test_deep_file_round_trip(self, market_df, tmp_path):
+        """Test that 10,000-level files are written and read without recursion."""
+        tree = _chain(10_000)
+        with pytest.raises(RecursionError):
+            json.dumps(tree)
+        path = tmp_path / "deep.json"
+        with open(path, "w") as f:
+            portfolio_io.write_portfolio_json(tree, f, indent=None)
+        assert portfolio.load_portfolio_structure(path)["name"] == "L0"
+        flat = portfolio_io.load_flat_portfolio(path)
+        assert flat.n_nodes == 10_000 and int(flat.depth.max()) == 9_999
+
+        out = portfolio.aggregate_portfolio_file(path, market_df, tmp_path / "out.json",
+                                                 use_parallel=False)
+        root = portfolio_io.read_flat_portfolio_json(out)
+        assert root.names[-1] == "L9999"
+
+    def test_deep_save_default_indent(self, market_df, tmp_path):
+        """Test that saving a 10,000-level result with default settings stays compact."""
+        result = portfolio.aggregate_portfolio_metrics(_chain(10_000), market_df, use_parallel=False)
+        path = tmp_path / "deep_out.json"
+        portfolio.save_aggregated_portfolio(result, path)
+        assert path.stat().st_size < 5_000_000
+        assert portfolio_io.read_flat_portfolio_json(path).n_nodes == 10_000
+
+    def test_indented_writer_memory_is_flat_in_depth(self):
+        """Test that indented writing buffers a bounded amount, not the whole text."""
+        class Sink:
+            size = 0
+
+            def write(self, text):
+                self.size += len(text)
+
+        sink = Sink()
+        tracemalloc.start()
+        try:
+            portfolio_io.write_portfolio_json(_chain(1_000), sink, indent=2)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert sink.size > 10_000_000
+        assert peak < sink.size / 4
+
+    def test_compare_formats(self, tmp_path):
+        """Test that the format benchmark reports every timing."""
+        tree = portfolio.generate_portfolio_tree(500, ["AAA", "BBB"])
+        results = portfolio_io.compare_portfolio_formats(tree, tmp_path)
+        for key in ("json_dump", "stream_write", "binary_save", "json_load", "json_load_flat",
+                    "stream_load", "binary_load", "binary_speedup"):
+            assert results[key] > 0
+        assert results["binary_bytes"] > 0 and results["json_bytes"] > 0